@@ -0,0 +1,74 @@
+"""
+Benchmark comparing the Excel engines of ExcelEngine on the bundled data files. For every file, both engines parse all
+columns, and league files are also parsed with only the columns the radar chart uses. The parse times are reported, and
+the DataFrames of both engines are compared. Run from the repository root with:
+
+    python -m benchmarks.bench_excel_engines
+"""
+import glob
+import os
+import time
+
+import pandas as pd
+
+from graph_app.data.excel_engines import read_calamine, read_openpyxl
+from graph_app.data.position_registry import position_registry
+
+FILES_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'graph_app', 'files')
+
+
+def timed(reader, file, usecols):
+    start = time.perf_counter()
+    df = reader(file, usecols)
+    return df, time.perf_counter() - start
+
+
+def whitespace_differences(expected, actual):
+    """
+    Counts the text cells that differ between two DataFrames only in leading or trailing whitespace, or None if the
+    DataFrames also differ otherwise.
+    """
+    if expected.columns.tolist() != actual.columns.tolist() or len(expected) != len(actual):
+        return None
+    count = 0
+    for column in expected.columns:
+        left, right = expected[column], actual[column]
+        if left.dtype == object and right.dtype == object:
+            different = (left != right) & ~(left.isna() & right.isna())
+            if not (left[different].str.strip() == right[different].str.strip()).all():
+                return None
+            count += int(different.sum())
+        elif not left.equals(right):
+            return None
+    return count
+
+
+def main():
+    files = sorted(glob.glob(os.path.join(FILES_FOLDER, '*', '*.xlsx')))
+    files.append(os.path.join(FILES_FOLDER, 'Stats per position.xlsx'))
+    totals = {}
+    print(f"{'file':<40} {'columns':<8} {'openpyxl':>9} {'calamine':>9}  result")
+    for file in files:
+        is_league = os.path.basename(os.path.dirname(file)) == 'leagues'
+        selections = [('all', None)] + ([('radar', position_registry.league_columns)] if is_league else [])
+        for label, usecols in selections:
+            expected, openpyxl_time = timed(read_openpyxl, file, usecols)
+            actual, calamine_time = timed(read_calamine, file, usecols)
+            totals.setdefault(label, [0.0, 0.0])
+            totals[label][0] += openpyxl_time
+            totals[label][1] += calamine_time
+            try:
+                pd.testing.assert_frame_equal(expected, actual)
+                result = "identical"
+            except AssertionError:
+                count = whitespace_differences(expected, actual)
+                result = "DIFFERENT" if count is None else f"identical except whitespace in {count} cells"
+            print(f"{os.path.basename(file)[:40]:<40} {label:<8} {openpyxl_time:>8.3f}s {calamine_time:>8.3f}s  "
+                  f"{result}")
+    for label, (openpyxl_time, calamine_time) in totals.items():
+        print(f"total {label}: openpyxl {openpyxl_time:.2f}s, calamine {calamine_time:.2f}s, "
+              f"{openpyxl_time / calamine_time:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
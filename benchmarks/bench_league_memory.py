@@ -0,0 +1,36 @@
+"""
+Benchmark reporting the memory used by the bundled league files in the in-memory cache, before and after they are
+stored in compact dtypes, see compact_league_frame. Run from the repository root with:
+
+    python -m benchmarks.bench_league_memory
+"""
+import glob
+import os
+
+from graph_app.data.excel_reader import ExcelReader
+from graph_app.data.league_frame import compact_league_frame, frame_memory
+from graph_app.data.position_registry import position_registry
+
+LEAGUES_FOLDER = os.path.join(os.path.dirname(__file__), '..', 'graph_app', 'files', 'leagues')
+
+
+def main():
+    reader = ExcelReader()
+    columns = position_registry.league_columns
+    total_before = total_after = 0
+    print(f"{'league':<30} {'columns':>7} {'before':>10} {'after':>10}")
+    for file in sorted(glob.glob(os.path.join(LEAGUES_FOLDER, '*.xlsx'))):
+        league_df = reader.read_file(file, usecols=columns)
+        # The frame as it was kept before: the used columns as parsed, filled with fillna(0.0) per request
+        before = frame_memory(league_df[[column for column in league_df.columns if column in columns]].fillna(0.0))
+        after = frame_memory(compact_league_frame(league_df, columns))
+        total_before += before
+        total_after += after
+        print(f"{os.path.basename(file)[:30]:<30} {len(league_df.columns):>7} {before / 1024:>8.0f}kB "
+              f"{after / 1024:>8.0f}kB")
+    print(f"total: {total_before / 1024 ** 2:.1f}MB before, {total_after / 1024 ** 2:.1f}MB after, "
+          f"{total_before / total_after:.1f}x smaller")
+
+
+if __name__ == '__main__':
+    main()
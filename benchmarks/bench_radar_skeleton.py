@@ -0,0 +1,81 @@
+"""
+Benchmark comparing the time per radar chart with and without the skeleton cache. Charts are drawn for two players of
+every position group of a bundled league, first from scratch the way RadarChart drew them before the cache, and then
+through RadarChart.draw(), once with an empty skeleton cache and once with every skeleton cached. Run from the
+repository root with:
+
+    python -m benchmarks.bench_radar_skeleton
+"""
+import os
+import time
+
+from graph_app.data.excel_reader import ExcelReader
+from graph_app.data.position_registry import position_registry
+from graph_app.graph_generator.graphs import graph_resources
+from graph_app.graph_generator.graphs.radar_chart import RadarChart
+from graph_app.graph_generator.graphs.radar_skeleton import radar_skeletons
+
+LEAGUE_FILE = os.path.join(os.path.dirname(__file__), '..', 'graph_app', 'files', 'leagues', 'Eredivisie.xlsx')
+# Number of times every chart is drawn per measurement
+REPEATS = 5
+
+
+def param_maps():
+    league_df = ExcelReader().read_league_file(LEAGUE_FILE)
+    maps = []
+    for columns in position_registry.league_categories.values():
+        columns = list(columns)
+        players = league_df[league_df[columns].sum(axis=1) > 0].head(2)
+        maps.append({'columns': columns, 'scales': league_df[columns].max().tolist(),
+                     'player': players['Player'].iloc[0], 'player_row': players.iloc[[0]],
+                     'compare': players['Player'].iloc[1], 'compare_row': players.iloc[[1]]})
+    return maps
+
+
+def draw_from_scratch(chart, param_map):
+    """
+    Draws a radar chart with all layers drawn on every call, as RadarChart.draw() did before the skeleton cache.
+    """
+    column_names, scales = param_map['columns'], param_map['scales']
+    _, p1, p1_values = chart.get_player_data(column_names, param_map)
+    _, p2, p2_values = chart.get_player_data(column_names, param_map, True)
+    fig, ax, angles, p1_values, p2_values = chart.create_radar_chart(p1_values, p2_values, scales)
+    ax = chart.plot_player(ax, p1, p1_values, angles, '#e51e24')
+    ax = chart.print_scales(ax, angles, chart.get_scale_labels(scales, 6.0))
+    ax = chart.plot_player(ax, p2, p2_values, angles, '#4A24EC')
+    ax = chart.print_stat_labels(ax, angles, column_names)
+    ax = chart.print_logo(ax)
+    row = param_map['player_row']
+    chart.set_layout(ax, p1, p2, row['Team'].iloc[0], row['Matches played'].iloc[0], row['Birth country'].iloc[0])
+    ax.legend(bbox_to_anchor=(1.1, 1.15), loc='upper center')
+    return graph_resources.to_png(fig)
+
+
+def per_chart(draw, maps, before=None):
+    total = 0.0
+    for _ in range(REPEATS):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        for param_map in maps:
+            draw(param_map)
+        total += time.perf_counter() - start
+    return total / (REPEATS * len(maps))
+
+
+def main():
+    chart = RadarChart({})
+    maps = param_maps()
+    draw_from_scratch(chart, maps[0])  # warm up fonts and the logo
+    scratch = per_chart(lambda param_map: draw_from_scratch(chart, param_map), maps)
+    cold = per_chart(chart.draw, maps, radar_skeletons.clear)
+    cached = per_chart(chart.draw, maps)
+    print(f"{len(maps)} charts, {REPEATS} repeats")
+    print(f"from scratch:         {scratch * 1000:7.1f}ms per chart")
+    print(f"skeleton cache miss:  {cold * 1000:7.1f}ms per chart")
+    print(f"skeleton cache hit:   {cached * 1000:7.1f}ms per chart, {scratch / cached:.1f}x faster")
+    print(radar_skeletons.stats())
+
+
+if __name__ == '__main__':
+    main()
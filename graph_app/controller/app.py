@@ -1,21 +1,48 @@
-from flask import Flask, request
+import json
+import os
 
+from flask import Flask, Response, request
+
+from .connectors.data_connector import DataConnector
 from .services.file_update_service import FileUpdateService
 from .services.line_graph_service import LineGraphService
 from .services.radar_graph_service import RadarGraphService
 from .services.random_graph_service import RandomGraphService
+from .warm_up import WarmUp
+from ..data.file_watcher import file_watcher
+from ..data.ingest_worker import ingest_worker
+from ..data.upload_spooler import UPLOAD_REQUEST_BYTES
+from ..graph_generator.render_pool import RENDER_WORKERS, render_pool
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = UPLOAD_REQUEST_BYTES
+warm_up = WarmUp()
+
+
+@app.route('/ready', methods=["GET"])
+def ready():
+    """
+    API endpoint for checking whether the app is ready to handle requests, i.e. whether the optional warm-up phase has
+    finished.
+
+    :return: A response with status 200 if the app is ready, or status 503 while the warm-up is still running.
+    """
+    if warm_up.is_ready():
+        return Response("Ready.", 200, mimetype='text/plain')
+    return Response("Warming up.", 503, mimetype='text/plain')
 
 
 @app.route('/graph', methods=["PUT"])
 def update_files():
     """
-    API endpoint for updating the local files used to generate graphs. Currently lacking functionality, i.e. does not
-    work. The intention is to write functions that extract all league files from the passed league file list, and
-    replace all existing league files in the file folder with those. Same process for player files.
+    API endpoint for updating the local files used to generate graphs. The passed league and/or player files are
+    validated and converted in the background, and then published together as a new data version. Files can be sent
+    either as multipart files or as base64 strings in JSON.
+    Parameters include:
+    - league-files: list of league files, replacing all current league files.
+    - player-files: list of player files, replacing all current player files.
 
-    :return: A response either containing an error message, or a success message.
+    :return: A response either containing an error message, or the status of the ingest job.
     """
     service = FileUpdateService()
     if request.is_json:
@@ -24,6 +51,31 @@ def update_files():
         return service.key_value_process(request.files, request.form)
 
 
+@app.route('/graph/ingest', methods=["GET"])
+def ingest_jobs():
+    """
+    API endpoint for listing the status of recent file updates, see ingest_status().
+
+    :return: A response containing a list of job statuses in JSON, oldest first.
+    """
+    return Response(json.dumps(ingest_worker.jobs()), 200, mimetype='application/json')
+
+
+@app.route('/graph/ingest/<job_id>', methods=["GET"])
+def ingest_status(job_id):
+    """
+    API endpoint for following the progress of a file update sent to PUT /graph. The state of the update is one of
+    queued, validating, converting, publishing, published or failed.
+
+    :param job_id: Identifier of the update, as returned by PUT /graph.
+    :return: A response containing the status of the update in JSON, or status 404 if the update is unknown.
+    """
+    status = ingest_worker.status(job_id)
+    if status is None:
+        return Response("Error: unknown ingest job.", 404, mimetype='application/json')
+    return Response(json.dumps(status), 200, mimetype='application/json')
+
+
 @app.route('/graph', methods=["POST"])
 def random_graph():
     """
@@ -85,4 +137,15 @@ def line_graph():
 
 
 if __name__ == '__main__':
+    # The debug reloader runs this module again in a child process that serves the requests, so the data and the
+    # background workers are only loaded there, not in the watching parent process as well.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        if os.environ.get('GRAPH_APP_WARMUP', '0') == '1':
+            warm_up.start()
+        else:
+            DataConnector().load_file_catalogs()
+        if os.environ.get('GRAPH_APP_WATCH', '0') == '1':
+            file_watcher.start()
+        if RENDER_WORKERS > 0:
+            render_pool.start()
     app.run(host="0.0.0.0", debug=True, port=5001)
@@ -1,6 +1,10 @@
 import random
 
 from graph_app.controller.connectors.abstract_connector import AbstractConnector
+from graph_app.data.file_preloader import FilePreloader
+from graph_app.data.league_catalog import league_catalog
+from graph_app.data.player_directory import player_directory
+from graph_app.data.player_index import player_index
 from graph_app.data.preprocessors.line_processor import LineProcessor
 from graph_app.data.preprocessors.radar_processor import RadarProcessor
 from graph_app.data.preprocessors.randomizer import Randomizer
@@ -20,6 +24,24 @@ class DataConnector(AbstractConnector):
         self.__radar_processor = RadarProcessor()
         self.__line_processor = LineProcessor()
 
+    def load_file_catalogs(self):
+        """
+        Function that builds the catalog of local league files, the directory of players in them, and the index of local
+        player files, so that the first requests do not have to. Meant to be called on startup of the app.
+        """
+        league_catalog.rebuild()
+        player_directory.rebuild()
+        player_index.rebuild()
+
+    def preload_files(self, max_workers=None):
+        """
+        Function that loads all local data files into memory ahead of the first requests, see FilePreloader.
+
+        :param max_workers: Number of worker processes to parse files with. Defaults to the number of CPUs.
+        :return: Number of files that were loaded.
+        """
+        return FilePreloader(max_workers).preload()
+
     def random_graph_choice(self, param_map):
         """
         Function for setting the "graph_type" to a random graph from the graph generator. Possible types are contained
@@ -1,4 +1,6 @@
 from ...graph_generator.factories.graph_factory import GraphFactory
+from ...graph_generator.graphs import graph_resources
+from ...graph_generator.render_pool import render_pool
 
 
 class GraphConnector:
@@ -26,15 +28,25 @@ class GraphConnector:
     def create_graph(self, param_map):
         """
         Function that creates an instance of the desired graph, invokes its draw function to create graph images,
-        and returns them in a list. Currently, it only returns a single graph in a list.
+        and returns them in a list. Currently, it only returns a single graph in a list. If the render pool is running,
+        the graph is drawn in one of its worker processes instead of on the calling thread.
 
         :param param_map: Map containing preprocessed football data to be used in a graph.
         :return: The graph(s) generated from the preprocessed data in byte form in a list.
         """
+        if render_pool.is_running():
+            return render_pool.render(param_map)
         plot_obj = self.__factory.create_instance(param_map)
         plot = plot_obj.draw_all(param_map)
         return plot
 
+    def preload_graphs(self):
+        """
+        Function that loads the resources needed for drawing graphs, such as fonts and the logo, ahead of the first
+        request.
+        """
+        graph_resources.preload()
+
     @property
     def factory(self):
         """
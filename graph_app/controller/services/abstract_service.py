@@ -1,5 +1,8 @@
+import json
 from abc import ABC, abstractmethod
 
+from flask import Response
+
 
 class Service(ABC):
     """
@@ -18,3 +21,23 @@ class Service(ABC):
     @abstractmethod
     def pass_data(self, param_map):
         pass
+
+    def ambiguous_player_response(self, error):
+        """
+        Function that creates the response for a player name that occurs in several league files, listing the leagues
+        the request can choose from.
+
+        :param error: AmbiguousPlayerError raised while extracting the player's data.
+        :return: A response with status 409, containing an error message and the list of leagues in JSON.
+        """
+        body = json.dumps({'error': str(error), 'player': error.player, 'leagues': error.leagues})
+        return Response(body, 409, mimetype='application/json')
+
+    def render_timeout_response(self, error):
+        """
+        Function that creates the response for a graph that was not rendered in time by the render pool.
+
+        :param error: RenderTimeoutError raised while waiting for the graph.
+        :return: A response with status 504, containing an error message.
+        """
+        return Response("Error: " + str(error), 504, mimetype='application/json')
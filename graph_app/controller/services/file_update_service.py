@@ -1,53 +1,78 @@
-import base64
+import json
 
-from flask import request, Response
+from flask import Response
 
 from .abstract_service import Service
-from ...data.file_updater import FileUpdater
+from ...data.ingest_worker import ingest_worker
+from ...data.upload_spooler import UploadError, UploadSpooler
 
 
 class FileUpdateService(Service):
 
     def json_process(self, payload):
         """
-        Function that handles a json-formatted request to the PDF generator API endpoint.
+        Function that handles a json-formatted request to the file update API endpoint. Files are passed as lists of
+        objects with a filename and base64 encoded data, under the league-files and player-files keys. Each file is
+        decoded into a spooled temporary file, after which its encoded data is released.
 
         :param payload: The json payload of the request.
-        :return: A response either containing an error message, or the generated PDF in byte representation.
+        :return: A response either containing an error message, or a success message.
         """
         if payload is None:
             return Response("Error: invalid JSON payload.", 400, mimetype='application/json')
 
-        files = []
-        for file_data in payload['files']:
-            file_contents = base64.b64decode(file_data)
-            files.append(file_contents)
-
-        param_map = {"new_files": files}
-
-        return self.pass_data(param_map)
+        spooler = UploadSpooler()
+        try:
+            param_map = {}
+            for key, name in [('league-files', "league_files"), ('player-files', "player_files")]:
+                entries = payload.get(key) or []
+                if not isinstance(entries, list):
+                    raise UploadError("Error: " + key + " must be a list of files.")
+                files = []
+                for index, entry in enumerate(entries):
+                    if not isinstance(entry, dict):
+                        raise UploadError("Error: " + key + " must contain objects with a filename and data.")
+                    files.append(spooler.add_base64(entry.get('filename'), entry.get('data')))
+                    entries[index] = None
+                param_map[name] = files
+            return self.pass_data(param_map)
+        except UploadError as error:
+            return Response(str(error), error.status, mimetype='application/json')
+        finally:
+            spooler.close()
 
     def key_value_process(self, files, form):
         """
-        Function that handles a json-formatted request to the file update API endpoint.
+        Function that handles a multipart request to the file update API endpoint.
 
         :param files: The file key-value pairs that were sent with the request.
         :param form: The regular parameter key-value pairs that were sent with the request.
-        :return: A response either containing an error message, or the generated PDF in byte representation.
+        :return: A response either containing an error message, or a success message.
         """
-        league_files = request.files.getlist('league-files')
-        player_files = request.files.getlist('player-files')
-        param_map = {"league_files": league_files, "player_files": player_files}
-        return self.pass_data(param_map)
+        spooler = UploadSpooler()
+        try:
+            league_files = [spooler.add_file(file) for file in files.getlist('league-files')]
+            player_files = [spooler.add_file(file) for file in files.getlist('player-files')]
+            param_map = {"league_files": league_files, "player_files": player_files}
+            return self.pass_data(param_map)
+        except UploadError as error:
+            return Response(str(error), error.status, mimetype='application/json')
+        finally:
+            spooler.close()
 
     def pass_data(self, param_map):
         """
-        Function that sends the raw received data to a module connector.
+        Function that sends the raw received data to the ingest worker. The league and player files are staged right
+        away, and published together as a single new data version once they have been validated and converted in the
+        background. A kind of file that was not sent is kept as it is.
 
-        :param param_map:
-        :return: Response indicating successful updating of the files.
+        :param param_map: Map containing the new league files (league_files) and player files (player_files).
+        :return: Response with status 202 containing the ingest job's status, and the URL to follow its progress at.
         """
-        updater = FileUpdater()
-        updater.update_league_files(param_map.get("league_files"))
-        updater.update_player_files(param_map.get("player_files"))
-        return Response("Files successfully updated.", 200, mimetype='application/json')
+        league_files = param_map.get("league_files") or None
+        player_files = param_map.get("player_files") or None
+        if league_files is None and player_files is None:
+            return Response("Error: no league or player files were sent.", 400, mimetype='application/json')
+        status = ingest_worker.submit(league_files, player_files)
+        body = dict(status, message="Files received, ingesting.", status_url="/graph/ingest/" + status['job'])
+        return Response(json.dumps(body), 202, mimetype='application/json')
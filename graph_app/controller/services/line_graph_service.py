@@ -3,6 +3,7 @@ from flask import Response
 from .abstract_service import Service
 from ..connectors.data_connector import DataConnector
 from ..connectors.graph_connector import GraphConnector
+from ...graph_generator.render_pool import RenderTimeoutError
 
 
 class LineGraphService(Service):
@@ -36,6 +37,9 @@ class LineGraphService(Service):
         stat = payload.get('stat')
         start_date = payload.get('start-date')
         end_date = payload.get('end-date')
+        layout = payload.get('layout', 'separate')
+        if layout not in ('separate', 'combined'):
+            return Response("Error: layout should be either separate or combined.", 400, mimetype='application/json')
 
         param_map = {"type": "line",
                      "league": league,
@@ -43,7 +47,8 @@ class LineGraphService(Service):
                      "compare": compare,
                      "stat": stat,
                      "start_date": start_date,
-                     "end_date": end_date}
+                     "end_date": end_date,
+                     "layout": layout}
 
         return self.pass_data(param_map)
 
@@ -63,8 +68,14 @@ class LineGraphService(Service):
         player = form.get('player')
         compare = form.get('compare')
         stat = form.get('stat')
+        stats = form.getlist('stat') if hasattr(form, 'getlist') else []
+        if len(stats) > 1:
+            stat = stats
         start_date = form.get('start-date')
         end_date = form.get('end-date')
+        layout = form.get('layout', 'separate')
+        if layout not in ('separate', 'combined'):
+            return Response("Error: layout should be either separate or combined.", 400, mimetype='application/json')
 
         param_map = {"type": "line",
                      "league": league,
@@ -72,7 +83,8 @@ class LineGraphService(Service):
                      "compare": compare,
                      "stat": stat,
                      "start_date": start_date,
-                     "end_date": end_date}
+                     "end_date": end_date,
+                     "layout": layout}
 
         return self.pass_data(param_map)
 
@@ -83,10 +95,14 @@ class LineGraphService(Service):
         This class retrieves a generated graph, and returns it in a Flask response.
 
         :param param_map: Map containing parameters extracted from the API request.
-        :return: A response either containing the generated graph in byte string representation.
+        :return: A response either containing the generated graph in byte string representation, or an error message
+        if the graph was not rendered in time.
         """
         data_map = self.__data_connector.get_data(param_map)
-        graph = self.__graph_connector.get_data(data_map)
+        try:
+            graph = self.__graph_connector.get_data(data_map)
+        except RenderTimeoutError as error:
+            return self.render_timeout_response(error)
 
         return Response(graph, mimetype='image/png')
 
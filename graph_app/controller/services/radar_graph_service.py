@@ -3,6 +3,8 @@ from flask import Response
 from .abstract_service import Service
 from ..connectors.data_connector import DataConnector
 from ..connectors.graph_connector import GraphConnector
+from ...graph_generator.render_pool import RenderTimeoutError
+from graph_app.data.player_directory import AmbiguousPlayerError
 
 
 class RadarGraphService(Service):
@@ -33,11 +35,15 @@ class RadarGraphService(Service):
         league = payload.get('league')
         player = payload.get('player')
         compare = payload.get('compare')
+        scale_mode = payload.get('scale-mode', 'league')
+        if scale_mode not in ('league', 'position'):
+            return Response("Error: scale-mode should be either league or position.", 400, mimetype='application/json')
 
         param_map = {"type": "radar",
                      "league": league,
                      "player": player,
-                     "compare": compare}
+                     "compare": compare,
+                     "scale_mode": scale_mode}
 
         return self.pass_data(param_map)
 
@@ -59,11 +65,15 @@ class RadarGraphService(Service):
         league = form.get('league')
         player = form.get('player')
         compare = form.get('compare')
+        scale_mode = form.get('scale-mode', 'league')
+        if scale_mode not in ('league', 'position'):
+            return Response("Error: scale-mode should be either league or position.", 400, mimetype='application/json')
 
         param_map = {"type": "radar",
                      "league": league,
                      "player": player,
-                     "compare": compare}
+                     "compare": compare,
+                     "scale_mode": scale_mode}
 
         return self.pass_data(param_map)
 
@@ -74,10 +84,18 @@ class RadarGraphService(Service):
         This class retrieves a generated graph, and returns it in a Flask response.
 
         :param param_map: Map containing parameters extracted from the API request.
-        :return: A response either containing the generated graph in byte string representation.
+        :return: A response either containing the generated graph in byte string representation, or the leagues to
+        choose from if the player occurs in several league files, or an error message if the graph was not rendered in
+        time.
         """
-        data_map = self.__data_connector.get_data(param_map)
-        graph = self.__graph_connector.get_data(data_map)
+        try:
+            data_map = self.__data_connector.get_data(param_map)
+        except AmbiguousPlayerError as error:
+            return self.ambiguous_player_response(error)
+        try:
+            graph = self.__graph_connector.get_data(data_map)
+        except RenderTimeoutError as error:
+            return self.render_timeout_response(error)
 
         return Response(graph, mimetype='image/png')
 
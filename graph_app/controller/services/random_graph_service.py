@@ -3,6 +3,8 @@ from flask import Response
 from .abstract_service import Service
 from ..connectors.data_connector import DataConnector
 from ..connectors.graph_connector import GraphConnector
+from ...graph_generator.render_pool import RenderTimeoutError
+from graph_app.data.player_directory import AmbiguousPlayerError
 
 
 class RandomGraphService(Service):
@@ -80,11 +82,19 @@ class RandomGraphService(Service):
         players.
 
         :param param_map: Map containing parameters extracted from the API request.
-        :return: A response either containing the generated graph in byte string representation.
+        :return: A response either containing the generated graph in byte string representation, or the leagues to
+        choose from if the player occurs in several league files, or an error message if the graph was not rendered in
+        time.
         """
-        data_map = self.__data_connector.get_data(param_map)
-
-        graph = self.__graph_connector.get_data(data_map)
+        try:
+            data_map = self.__data_connector.get_data(param_map)
+        except AmbiguousPlayerError as error:
+            return self.ambiguous_player_response(error)
+
+        try:
+            graph = self.__graph_connector.get_data(data_map)
+        except RenderTimeoutError as error:
+            return self.render_timeout_response(error)
 
         response = self.create_response(data_map, graph)
 
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from .connectors.data_connector import DataConnector
+from .connectors.graph_connector import GraphConnector
+
+
+class WarmUp:
+    """
+    Class representing the optional warm-up phase of the app. When started, it loads all data files and prepares the
+    graph libraries in a background thread, while the app already accepts connections. Its readiness can be checked
+    through the GET /ready endpoint. If the warm-up is never started, the app counts as ready immediately.
+    """
+
+    def __init__(self):
+        self.__ready = threading.Event()
+        self.__ready.set()
+        self.__status = {'state': 'skipped'}
+        self.__thread = None
+
+    def start(self, max_workers=None):
+        """
+        Function that starts the warm-up in a background thread.
+
+        :param max_workers: Number of worker processes to parse data files with. Defaults to the number of CPUs.
+        """
+        self.__ready.clear()
+        self.__status = {'state': 'running'}
+        self.__thread = threading.Thread(target=self.run, args=(max_workers,), name='warm-up', daemon=True)
+        self.__thread.start()
+
+    def run(self, max_workers=None):
+        """
+        Function that performs the warm-up: preloading all data files, and preparing the graph libraries. The app is
+        marked as ready afterwards, also if the warm-up failed, since requests can still load the files themselves.
+
+        :param max_workers: Number of worker processes to parse data files with. Defaults to the number of CPUs.
+        """
+        start = time.perf_counter()
+        try:
+            files = DataConnector().preload_files(max_workers)
+            GraphConnector().preload_graphs()
+            self.__status = {'state': 'done', 'files': files, 'seconds': round(time.perf_counter() - start, 2)}
+        except Exception as error:
+            print("Warm-up failed:", error)
+            self.__status = {'state': 'failed', 'error': str(error)}
+        finally:
+            self.__ready.set()
+
+    def is_ready(self):
+        """
+        Function that checks whether the warm-up has finished.
+
+        :return: True if the warm-up finished or was never started, False if it is still running.
+        """
+        return self.__ready.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Function that blocks until the warm-up has finished.
+
+        :param timeout: Maximum number of seconds to wait.
+        :return: True if the warm-up finished within the timeout, False if not.
+        """
+        return self.__ready.wait(timeout)
+
+    @property
+    def status(self):
+        """
+        Getter for the status attribute of the WarmUp.
+
+        :return: Dictionary containing the state of the warm-up, and the number of files and duration once finished.
+        """
+        return dict(self.__status)
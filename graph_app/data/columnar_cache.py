@@ -0,0 +1,191 @@
+import glob
+import hashlib
+import os
+import shutil
+
+import pandas as pd
+
+
+class ColumnarCache:
+    """
+    Class that keeps a columnar (Parquet) copy of every Excel file that has been read, so that the slow openpyxl parse
+    only happens once per version of a file. Cache entries are keyed by the absolute path of the Excel file along with
+    its modification time and size, which means a changed file automatically results in a cache miss, and by the set of
+    columns parsed from it, so that projected and full parses of a file do not share an entry. On a miss, the Excel
+    file is read as usual and the cache entry is rebuilt.
+    """
+
+    def __init__(self, cache_folder=None):
+        """
+        Constructor for the class. Sets the folder the Parquet files are stored in, which is graph_app/cache/columnar
+        by default.
+
+        :param cache_folder: Optional path of the folder to store the cached files in.
+        """
+        if cache_folder is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            cache_folder = os.path.abspath(os.path.join(current_dir, '..', 'cache', 'columnar'))
+        self.__cache_folder = cache_folder
+
+    def file_prefix(self, file):
+        """
+        Function that creates the part of a cache file name that only depends on the path of the Excel file. It is
+        shared by all cached versions of the same file, so that stale versions can be found and removed.
+
+        :param file: Path to the Excel file.
+        :return: String containing a hash of the absolute file path.
+        """
+        path = os.path.abspath(file)
+        return hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+
+    def version_prefix(self, file, stat=None):
+        """
+        Function that creates the part of a cache file name that depends on the path and version of the Excel file. It
+        is shared by the entries of all column projections of the same version of the file.
+
+        :param file: Path to the Excel file.
+        :param stat: Optional os.stat_result to use instead of the file's own, e.g. for a file that has been moved.
+        :return: String containing a hash of the absolute file path, and the mtime and size of the file.
+        """
+        if stat is None:
+            stat = os.stat(file)
+        return f"{self.file_prefix(file)}_{stat.st_mtime_ns}_{stat.st_size}_"
+
+    def projection(self, usecols=None):
+        """
+        Function that creates the part of a cache file name that depends on the columns parsed from the Excel file, so
+        that a file parsed with different projections has a separate entry for each of them.
+
+        :param usecols: Optional list of column headers parsed from the Excel file.
+        :return: String 'all' if all columns are parsed, or a hash of the sorted column headers otherwise.
+        """
+        if usecols is None:
+            return 'all'
+        names = '\n'.join(sorted(str(column) for column in usecols))
+        return hashlib.sha1(names.encode('utf-8')).hexdigest()[:16]
+
+    def cache_path(self, file, stat=None, usecols=None):
+        """
+        Function that determines the path of the cache entry belonging to the current version of an Excel file.
+
+        :param file: Path to the Excel file.
+        :param stat: Optional os.stat_result to use instead of the file's own, e.g. for a file that has been moved.
+        :param usecols: Optional list of column headers parsed from the Excel file. All columns are parsed if omitted.
+        :return: Path of the Parquet file for the passed Excel file, based on its path, mtime, size and parsed columns.
+        """
+        name = self.version_prefix(file, stat) + self.projection(usecols) + '.parquet'
+        return os.path.join(self.__cache_folder, name)
+
+    def load(self, file, reader, columns=None, usecols=None):
+        """
+        Function that loads an Excel file through the cache. If a cache entry exists for the current version of the
+        file and the parsed columns, only the requested columns are read from it. Otherwise, the passed reader function
+        is used to parse the Excel file, and the cache entry is rebuilt.
+
+        :param file: Path to the Excel file.
+        :param reader: Function that takes a file path and returns a DataFrame, used on cache misses.
+        :param columns: Optional list of columns to load. All columns are loaded if omitted.
+        :param usecols: Optional list of column headers that the reader parses from the Excel file, e.g. the usecols
+        passed to ExcelEngine.reader(). Must be omitted if the reader parses all columns.
+        :return: DataFrame containing the (requested columns of the) data in the Excel file.
+        """
+        path = self.cache_path(file, usecols=usecols)
+        if os.path.exists(path):
+            try:
+                return pd.read_parquet(path, columns=columns)
+            except (ImportError, OSError, ValueError) as error:
+                print("Could not read cached file, falling back to Excel:", error)
+
+        df = self.normalize_mixed_columns(reader(file))
+        self.store(file, path, df)
+        if columns is not None:
+            return df[columns]
+        return df
+
+    def store(self, file, path, df):
+        """
+        Function that writes a DataFrame to a new cache entry, and removes the entries of older versions of the same
+        file. The entry is written to a temporary file first and then renamed, so readers never see a half-written file.
+
+        :param file: Path to the Excel file the DataFrame was read from.
+        :param path: Path of the cache entry to write.
+        :param df: DataFrame to cache.
+        """
+        os.makedirs(self.__cache_folder, exist_ok=True)
+        self.remove(file, keep=os.path.basename(path).rsplit('_', 1)[0] + '_')
+        temp_path = path + '.' + str(os.getpid()) + '.tmp'
+        try:
+            df.to_parquet(temp_path, index=False)
+            os.replace(temp_path, path)
+        except (ImportError, OSError, TypeError, ValueError) as error:
+            print("Could not cache file:", error)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def remove(self, file, keep=None):
+        """
+        Function that removes the cache entries for an Excel file.
+
+        :param file: Path to the Excel file whose cache entries should be removed.
+        :param keep: Optional version prefix of the entries to keep, see version_prefix(). All entries are removed if
+        omitted.
+        """
+        pattern = os.path.join(self.__cache_folder, self.file_prefix(file) + '_*.parquet')
+        for path in glob.glob(pattern):
+            if keep is not None and os.path.basename(path).startswith(keep):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def carry_over(self, old_file, new_file):
+        """
+        Function that reuses the cache entries of an Excel file for an identical copy of it at another path, e.g. an
+        unchanged file in a new data version. The copy must have kept the file's modification time and size, as a hard
+        link or a renamed file does, but the old file no longer has to exist. The entries of all column projections are
+        hard-linked where possible, so they are not copied on disk.
+
+        :param old_file: Path to the Excel file that may have cache entries.
+        :param new_file: Path to the identical Excel file.
+        :return: True if a cache entry was carried over, False if the old file had none.
+        """
+        stat = os.stat(new_file)
+        old_prefix = self.version_prefix(old_file, stat)
+        new_prefix = self.version_prefix(new_file, stat)
+        carried = False
+        for old_path in glob.glob(os.path.join(self.__cache_folder, old_prefix + '*.parquet')):
+            new_path = os.path.join(self.__cache_folder, new_prefix + os.path.basename(old_path)[len(old_prefix):])
+            if os.path.exists(new_path):
+                continue
+            try:
+                os.link(old_path, new_path)
+            except OSError:
+                shutil.copy2(old_path, new_path)
+            carried = True
+        return carried
+
+    def normalize_mixed_columns(self, df):
+        """
+        Function that replaces non-string values in text columns by empty values. Wyscout files put a 0 in text columns
+        such as "Position" when there is no value, which cannot be stored in a columnar format. It is applied before
+        storing, so that the returned data is the same on cache hits and misses.
+
+        :param df: DataFrame read from an Excel file.
+        :return: The DataFrame with all non-string values in text columns set to None.
+        """
+        for column in df.select_dtypes(include='object').columns:
+            values = df[column]
+            is_string = values.map(lambda value: isinstance(value, str))
+            if is_string.any() and not is_string[values.notna()].all():
+                df[column] = values.where(is_string, None)
+        return df
+
+    @property
+    def cache_folder(self):
+        """
+        Getter for the cache_folder attribute of the ColumnarCache.
+
+        :return: String containing the path of the folder the cache entries are stored in.
+        """
+        return self.__cache_folder
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+
+def file_digest(path):
+    """
+    Function that computes the BLAKE2b hash of a file's contents, reading it in chunks.
+
+    :param path: Path to the file.
+    :return: String containing the hexadecimal hash.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DataVersions:
+    """
+    Class that manages the versions of the local data files. Each version is a complete folder containing a leagues and
+    a players folder. An update stages a new version folder next to the current one, and publishes it by atomically
+    replacing the file that names the current version, so requests never see a half-written folder. Version 0 is the
+    data folder shipped with the app. The previous version is kept when a new one is published, so requests that are
+    still reading it can finish; older versions are removed.
+    """
+    # Name of the file containing the number of the current version
+    current_file = 'CURRENT'
+    # Name of the file in each version folder containing the hashes of its data files
+    manifest_file = 'manifest.json'
+    # Data folders contained in each version
+    kinds = ('leagues', 'players')
+
+    def __init__(self, root, base_folder, keep=2):
+        """
+        Constructor for the class.
+
+        :param root: Folder to store the published versions in.
+        :param base_folder: Folder containing the data files shipped with the app, used as version 0.
+        :param keep: Number of versions to keep on disk, including the current one.
+        """
+        self.__root = root
+        self.__base_folder = base_folder
+        self.__keep = max(keep, 1)
+        self.__current = (None, 0)
+        self.__base_manifest = None
+        self.__lock = threading.Lock()
+
+    def current(self):
+        """
+        Function that retrieves the number of the current version. The version file is only read again when it has
+        changed, e.g. after another process published a version.
+
+        :return: Integer representing the current version, 0 if no version was published.
+        """
+        path = os.path.join(self.__root, self.current_file)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+        cached_mtime, version = self.__current
+        if mtime != cached_mtime:
+            with open(path, encoding='utf-8') as file:
+                version = int(file.read().strip())
+            self.__current = (mtime, version)
+        return version
+
+    def folder(self, kind, version=None):
+        """
+        Function that determines the folder containing a kind of data file in a version.
+
+        :param kind: Kind of data file, either 'leagues' or 'players'.
+        :param version: Number of the version. Defaults to the current version.
+        :return: Path of the folder.
+        """
+        if version is None:
+            version = self.current()
+        if version == 0:
+            return os.path.join(self.__base_folder, kind)
+        return os.path.join(self.__root, str(version), kind)
+
+    def location(self, kind):
+        """
+        Function that retrieves the current version together with its folder for a kind of data file, so that both
+        refer to the same version.
+
+        :param kind: Kind of data file, either 'leagues' or 'players'.
+        :return: The number of the current version, and the path of the folder.
+        """
+        version = self.current()
+        return version, self.folder(kind, version)
+
+    def manifest(self, version=None):
+        """
+        Function that retrieves the manifest of a version, containing the content hash of each of its data files. The
+        manifest of version 0 is computed from the shipped files on first use.
+
+        :param version: Number of the version. Defaults to the current version.
+        :return: Dictionary with the kinds of data file as keys, and dictionaries with file names as keys and BLAKE2b
+        hashes as values as values.
+        """
+        if version is None:
+            version = self.current()
+        if version == 0:
+            if self.__base_manifest is None:
+                self.__base_manifest = self.hash_folders(0)
+            return self.__base_manifest
+        try:
+            with open(os.path.join(self.__root, str(version), self.manifest_file), encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return self.hash_folders(version)
+
+    def hash_folders(self, version):
+        """
+        Function that computes the content hash of every data file in a version.
+
+        :param version: Number of the version.
+        :return: Dictionary with the kinds of data file as keys, and dictionaries with file names as keys and BLAKE2b
+        hashes as values as values.
+        """
+        manifest = {}
+        for kind in self.kinds:
+            folder = self.folder(kind, version)
+            names = sorted(os.listdir(folder)) if os.path.isdir(folder) else []
+            manifest[kind] = {name: file_digest(os.path.join(folder, name)) for name in names
+                              if os.path.isfile(os.path.join(folder, name))}
+        return manifest
+
+    def write_manifest(self, staging, manifest):
+        """
+        Function that saves the manifest of a staged version.
+
+        :param staging: Path of the staging folder, see stage().
+        :param manifest: Dictionary with the kinds of data file as keys, and dictionaries with file names as keys and
+        BLAKE2b hashes as values as values.
+        """
+        with open(os.path.join(staging, self.manifest_file), 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=1, sort_keys=True)
+
+    def versions(self):
+        """
+        Function that lists the published versions on disk.
+
+        :return: Sorted list of version numbers.
+        """
+        if not os.path.isdir(self.__root):
+            return []
+        return sorted(int(name) for name in os.listdir(self.__root) if name.isdigit())
+
+    def stage(self):
+        """
+        Function that creates an empty staging folder for a new version, with an empty folder per kind of data file.
+
+        :return: Path of the staging folder.
+        """
+        os.makedirs(self.__root, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=self.__root)
+        for kind in self.kinds:
+            os.mkdir(os.path.join(staging, kind))
+        return staging
+
+    def discard(self, staging):
+        """
+        Function that removes a staging folder that will not be published.
+
+        :param staging: Path of the staging folder.
+        """
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def publish(self, staging, on_remove=None):
+        """
+        Function that makes a staged folder the current version. The folder is renamed to the next version number,
+        after which the version file is replaced in a single rename.
+
+        :param staging: Path of the staging folder, see stage().
+        :param on_remove: Optional function that takes the path of a data file, called for each file of an old version
+        before it is removed, see prune().
+        :return: Number of the published version.
+        """
+        with self.__lock:
+            version = max(self.versions() + [self.current()]) + 1
+            os.rename(staging, os.path.join(self.__root, str(version)))
+            temp_path = os.path.join(self.__root, self.current_file + '.' + str(os.getpid()) + '.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                file.write(str(version))
+            os.replace(temp_path, os.path.join(self.__root, self.current_file))
+            self.prune(on_remove)
+        return version
+
+    def prune(self, on_remove=None):
+        """
+        Function that removes old versions from disk, keeping the newest ones.
+
+        :param on_remove: Optional function that takes the path of a data file, called for each file of a removed
+        version before it is removed, e.g. ExcelReader.invalidate() to remove the file's cached data.
+        """
+        current = self.current()
+        for version in self.versions()[:-self.__keep]:
+            if version == current:
+                continue
+            folder = os.path.join(self.__root, str(version))
+            if on_remove is not None:
+                for kind in self.kinds:
+                    kind_folder = os.path.join(folder, kind)
+                    if os.path.isdir(kind_folder):
+                        for filename in sorted(os.listdir(kind_folder)):
+                            on_remove(os.path.join(kind_folder, filename))
+            shutil.rmtree(folder, ignore_errors=True)
+
+    @property
+    def root(self):
+        """
+        Getter for the root attribute of the DataVersions.
+
+        :return: String containing the path of the folder the versions are stored in.
+        """
+        return self.__root
+
+
+data_versions = DataVersions(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'files', 'versions')),
+                             os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'files')))
@@ -0,0 +1,137 @@
+import datetime
+import os
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+
+def read_openpyxl(file, usecols=None):
+    """
+    Function that reads the first sheet of an Excel file with openpyxl, pandas' default engine.
+
+    :param file: Path to the Excel file.
+    :param usecols: Optional list of column names to read. Names that are not in the file are ignored.
+    :return: DataFrame containing the data in the sheet.
+    """
+    return pd.read_excel(file, engine='openpyxl', usecols=column_filter(usecols))
+
+
+def read_calamine(file, usecols=None):
+    """
+    Function that reads the first sheet of an Excel file with python-calamine, a much faster reader written in Rust.
+    The cell values are converted the same way pandas converts openpyxl's, and parsed by the same TextParser, so the
+    result is identical to read_openpyxl().
+
+    :param file: Path to the Excel file.
+    :param usecols: Optional list of column names to read. Names that are not in the file are ignored.
+    :return: DataFrame containing the data in the sheet.
+    :raises: ImportError when python-calamine is not installed.
+    """
+    from python_calamine import CalamineWorkbook
+
+    rows = CalamineWorkbook.from_path(os.fspath(file)).get_sheet_by_index(0).to_python(skip_empty_area=False)
+    data = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(rows):
+        converted_row = [convert_calamine_cell(value) for value in row]
+        while converted_row and converted_row[-1] == "":
+            converted_row.pop()
+        if converted_row:
+            last_row_with_data = row_number
+        data.append(converted_row)
+    data = data[:last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+    width = max(len(row) for row in data)
+    data = [row + [""] * (width - len(row)) for row in data]
+    return TextParser(data, header=0, skip_blank_lines=False, usecols=column_filter(usecols)).read()
+
+
+def convert_calamine_cell(value):
+    """
+    Function that converts a cell value from python-calamine the way pandas converts openpyxl's cell values: whole
+    numbers become integers, and dates become timestamps.
+
+    :param value: Cell value as returned by python-calamine, with empty cells as empty strings.
+    :return: The converted value.
+    """
+    if isinstance(value, float):
+        whole = int(value) if value == value and abs(value) != float('inf') else None
+        return whole if whole == value else value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return pd.Timestamp(value)
+    if isinstance(value, datetime.timedelta):
+        return pd.Timedelta(value)
+    return value
+
+
+def column_filter(usecols):
+    """
+    Function that turns a list of column names into a usecols argument that ignores names missing from the file, so a
+    file without some of the columns can still be read, and checked for them afterwards.
+
+    :param usecols: List of column names, or None for all columns.
+    :return: Function that takes a column name and returns True if it should be read, or None for all columns.
+    """
+    if usecols is None:
+        return None
+    names = frozenset(usecols)
+    return lambda name: name in names
+
+
+class ExcelEngine:
+    """
+    Class representing the engine used to parse Excel files, which is openpyxl by default. Setting the
+    GRAPH_APP_EXCEL_ENGINE environment variable to calamine selects python-calamine instead, which is much faster, but
+    an optional dependency: if it is not installed, openpyxl is used. Both engines can restrict the columns they read.
+    """
+    # Functions that read an Excel file, by engine name
+    engines = {'openpyxl': read_openpyxl, 'calamine': read_calamine}
+
+    def __init__(self, name='openpyxl'):
+        """
+        Constructor for the class.
+
+        :param name: Name of the engine, either 'openpyxl' or 'calamine'.
+        :raises: ValueError when the engine is not known.
+        """
+        if name not in self.engines:
+            raise ValueError("Unknown Excel engine " + str(name) + ", please choose one of: " + ", ".join(self.engines))
+        if name == 'calamine':
+            try:
+                import python_calamine  # noqa: F401
+            except ImportError:
+                print("python-calamine is not installed, reading Excel files with openpyxl instead.")
+                name = 'openpyxl'
+        self.__name = name
+
+    def read(self, file, usecols=None):
+        """
+        Function that reads the first sheet of an Excel file.
+
+        :param file: Path to the Excel file.
+        :param usecols: Optional list of column names to read. Names that are not in the file are ignored.
+        :return: DataFrame containing the (selected columns of the) data in the sheet.
+        """
+        return self.engines[self.__name](file, usecols)
+
+    def reader(self, usecols=None):
+        """
+        Function that creates a reader function for a set of columns, e.g. for ColumnarCache.load().
+
+        :param usecols: Optional list of column names to read. Names that are not in the file are ignored.
+        :return: Function that takes the path of an Excel file and returns a DataFrame.
+        """
+        return lambda file: self.read(file, usecols)
+
+    @property
+    def name(self):
+        """
+        Getter for the name attribute of the ExcelEngine.
+
+        :return: String containing the name of the engine in use.
+        """
+        return self.__name
+
+
+excel_engine = ExcelEngine(os.environ.get('GRAPH_APP_EXCEL_ENGINE', 'openpyxl'))
@@ -2,6 +2,16 @@ import os
 
 import pandas as pd
 
+from .columnar_cache import ColumnarCache
+from .excel_engines import excel_engine
+from .frame_cache import frame_cache
+from .league_catalog import league_catalog
+from .league_frame import compact_league_frame
+from .league_store import league_stores
+from .player_index import player_index
+from .player_metadata import player_metadata, sort_player_file
+from .position_registry import position_registry
+
 
 class ExcelReader:
     """
@@ -9,46 +19,177 @@ class ExcelReader:
     """
 
     def __init__(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        self.__source_folder = os.path.abspath(os.path.join(current_dir, '..', '..'))
+        self.__cache = ColumnarCache()
 
-    def read_file(self, file):
+    def read_file(self, file, columns=None, usecols=None):
         """
-        General function for reading data from an Excel (.xlsx) file into a Pandas dataframe.
+        General function for reading data from an Excel (.xlsx) file into a Pandas dataframe. The data is read from a
+        columnar cache of the file if it is up-to-date, see ColumnarCache, and parsed with the configured Excel engine
+        otherwise, see ExcelEngine.
 
         :param file: The Excel file containing desired data.
+        :param columns: Optional list of column headers to read. All columns are read if omitted.
+        :param usecols: Optional list of column headers to parse from the Excel file and keep in the columnar cache,
+        e.g. position_registry.league_columns for league files. Each set of columns has its own cache entry.
         :return: A Pandas dataframe containing all data in the Excel file, including headers.
         """
-        return pd.read_excel(file)
+        return self.__cache.load(file, excel_engine.reader(usecols), columns, usecols)
 
-    def player_data(self, player):
+    def read_cached_file(self, file, prepare=None, usecols=None, key=None):
         """
-        Function for extracting the match data of a football player from an Excel file.
+        Function for reading data from an Excel file through the process-wide in-memory cache, so that repeated requests
+        for the same file do not read it again, and concurrent requests for it wait for a single read, see
+        FrameCache.get_or_load(). Entries are keyed by the file's path, modification time and size, so a changed file
+        replaces its old entry. The returned DataFrame is shared, and should not be modified in place.
+
+        :param file: The Excel file containing desired data.
+        :param prepare: Optional function that takes the read DataFrame and returns the DataFrame to cache, applied once
+        when the file is read, e.g. sort_player_file for player files.
+        :param usecols: Optional list of column headers to parse from the Excel file, see read_file().
+        :param key: Optional key of the file version to read, see file_key(). Determined from the file if omitted.
+        :return: A Pandas dataframe containing all data in the Excel file, including headers.
+        """
+        if key is None:
+            key = self.file_key(file)
+        path = key[0]
+
+        def load():
+            frame_cache.invalidate(lambda cached_key: cached_key[0] == path and cached_key != key)
+            df = self.read_file(path, usecols=usecols)
+            if prepare is not None:
+                df = prepare(df)
+            return df
+        return frame_cache.get_or_load(key, load)
+
+    def read_league_file(self, file, key=None):
+        """
+        Function for reading a league file through the process-wide in-memory cache. Only the columns the app uses are
+        parsed and kept, see position_registry.league_columns, in compact dtypes with empty values filled, see
+        compact_league_frame.
+
+        :param file: The league file containing desired data.
+        :param key: Optional key of the file version to read, see file_key(). Determined from the file if omitted.
+        :return: A Pandas dataframe containing the used columns of the league file.
+        """
+        columns = position_registry.league_columns
+        return self.read_cached_file(file, lambda df: compact_league_frame(df, columns), columns, key)
+
+    def read_player_file(self, file):
+        """
+        Function for reading a player file through the process-wide in-memory cache. The matches are ordered by
+        ascending datetime64 date when the file is read, see sort_player_file.
+
+        :param file: The player file containing desired data.
+        :return: A Pandas dataframe containing all data in the player file, ordered by date.
+        """
+        return self.read_cached_file(file, sort_player_file)
+
+    def carry_over(self, old_file, new_file):
+        """
+        Function that moves the cached data of a file to an identical copy of it at another path, e.g. an unchanged file
+        in a new data version, so that the copy does not have to be read again. The copy must have kept the file's
+        modification time and size, as a hard link or a renamed file does.
+
+        :param old_file: Path to the file that may have cached data.
+        :param new_file: Path to the identical file.
+        """
+        self.__cache.carry_over(old_file, new_file)
+        new_key = self.file_key(new_file)
+        old_key = (os.path.abspath(old_file),) + new_key[1:]
+        df = frame_cache.get(old_key)
+        if df is not None:
+            frame_cache.put(new_key, df)
+            frame_cache.invalidate(lambda cached_key: cached_key == old_key)
+        player_metadata.carry_over(old_key, new_key)
+        league_stores.carry_over(old_key, new_key)
+
+    def prepare_file(self, file, kind):
+        """
+        Function that loads a data file into the caches ahead of the first request for it: the columnar cache and the
+        in-memory cache, and the league store for league files or the metadata for player files.
+
+        :param file: Path to the data file.
+        :param kind: Kind of data file, either 'leagues' or 'players'.
+        """
+        key = self.file_key(file)
+        if kind == 'leagues':
+            league_stores.get(key, lambda: self.read_league_file(file))
+        else:
+            player_metadata.get(key, lambda: self.read_player_file(file))
+
+    def invalidate(self, file):
+        """
+        Function that removes all cached data of a file, e.g. after it was changed or removed outside of the app.
+
+        :param file: Path to the file.
+        """
+        path = os.path.abspath(file)
+        frame_cache.invalidate(lambda cached_key: cached_key[0] == path)
+        self.__cache.remove(path)
+        player_metadata.invalidate(path)
+        league_stores.invalidate(path)
+
+    def file_key(self, file):
+        """
+        Function that creates a key identifying the current version of a file, for use in caches.
+
+        :param file: Path to the file.
+        :return: Tuple containing the absolute path, modification time and size of the file.
+        """
+        path = os.path.abspath(file)
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def player_data(self, player, choice=0):
+        """
+        Function for extracting the match data of a football player from an Excel file. The file is found through the
+        player index, which requires the passed name to exactly match a player name from the file names. The matches are
+        ordered by ascending date.
 
         :param player: The name of the player whose match data to extract.
+        :param choice: Index of the file to use if several player files exist for the same name, see
+        PlayerIndex.candidates().
         :return: A Pandas dataframe containing all data in the Excel file, including headers.
         """
-        files_folder = os.path.join(self.__source_folder, 'graph_app', 'files', 'players')
+        file_path = player_index.lookup(player, choice)
+        if file_path is None:
+            print("Player file not found.")
+            return pd.DataFrame()
+        print("File found:", file_path)
+        return self.read_player_file(file_path)
+
+    def player_metadata(self, player, choice=0):
+        """
+        Function for retrieving the metadata of a player file, see PlayerMetadata. It is computed once per version of
+        the file, when the file is first read.
 
-        for dirpath, dirnames, filenames in os.walk(files_folder):
-            for filename in filenames:
-                if filename.startswith("Player stats") and filename.endswith(".xlsx") and player in filename:
-                    file_path = os.path.join(dirpath, filename)
-                    print("File found:", file_path)
-                    return self.read_file(file_path)
-        print("Player file not found.")
-        return pd.DataFrame()
+        :param player: The name of the player.
+        :param choice: Index of the file to use if several player files exist for the same name, see
+        PlayerIndex.candidates().
+        :return: PlayerMetadata of the player file, or None if the player file was not found.
+        """
+        file_path = player_index.lookup(player, choice)
+        if file_path is None:
+            return None
+        return player_metadata.get(self.file_key(file_path), lambda: self.read_player_file(file_path))
 
-    def league_data(self, player, league_df):
+    def league_data(self, player, league_df, league_store=None):
         """
-        Function for extracting the football league data of a single player from an Excel file.
+        Function for extracting the football league data of a single player from an Excel file. If the league's stat
+        store is passed, the player's row is found through its index instead of a scan of the league DataFrame.
 
-        :param player:
-        :param league:
+        :param player: The name of the player whose data to extract.
+        :param league_df: DataFrame containing all data in the player's league file.
+        :param league_store: Optional LeagueStore built from the same version of the league file as league_df, see
+        league_file().
         :return: A Pandas dataframe containing all data in the Excel file, including headers.
         """
         if league_df is None:
             return pd.DataFrame()
+        if league_store is not None and len(league_store.players) == len(league_df.index):
+            row = league_store.row(player)
+            if row is not None:
+                return league_df.iloc[[row]]
         try:
             player = league_df.loc[league_df['Player'] == player]
         except KeyError:
@@ -57,16 +198,55 @@ class ExcelReader:
 
     def all_league_data(self, league):
         """
-        Function for extracting all data from a league file into a dataframe.
+        Function for extracting all data from a league file into a dataframe. The file is found through the league
+        catalog, which requires the passed name to match the name of a league file, ignoring case.
 
+        :param league: The name of the league whose data to extract.
         :return: Dataframe containing data for all players in a specified football league file.
         """
-        files_folder = os.path.join(self.__source_folder, 'graph_app', 'files', 'leagues')
-        for dirpath, dirnames, filenames in os.walk(files_folder):
-            for filename in filenames:
-                if league in filename:
-                    file_path = os.path.join(dirpath, filename)
-                    print("File found:", file_path)
-                    return self.read_file(file_path)
-        print("League file not found.")
-        return pd.DataFrame()
+        entry = league_catalog.lookup(league)
+        if entry is None:
+            print("League file not found.")
+            return pd.DataFrame()
+        print("File found:", entry.path)
+        return self.read_league_file(entry.path)
+
+    def league_file(self, league):
+        """
+        Function for retrieving the data and the compact stat store of a league file. Both are resolved from a single
+        key of the file, see file_key(), so they always belong to the same version of the file, also when it is replaced
+        in between.
+
+        :param league: The name of the league.
+        :return: Tuple containing a DataFrame with the used columns of the league file, see read_league_file(), and the
+        LeagueStore of the same version of the file. An empty DataFrame and None if the league file was not found.
+        """
+        entry = league_catalog.lookup(league)
+        if entry is None:
+            print("League file not found.")
+            return pd.DataFrame(), None
+        print("File found:", entry.path)
+        key = self.file_key(entry.path)
+        league_df = self.read_league_file(entry.path, key)
+        return league_df, league_stores.get(key, lambda: league_df)
+
+    def league_store(self, league):
+        """
+        Function for retrieving the compact stat store of a league file, see LeagueStore.
+
+        :param league: The name of the league.
+        :return: LeagueStore containing the numeric stats of the league, or None if the league file was not found.
+        """
+        entry = league_catalog.lookup(league)
+        if entry is None:
+            return None
+        return league_stores.get(self.file_key(entry.path), lambda: self.read_league_file(entry.path))
+
+    @property
+    def cache(self):
+        """
+        Getter for the cache attribute of the ExcelReader.
+
+        :return: ColumnarCache object representing the ExcelReader's on-disk cache of Excel files.
+        """
+        return self.__cache
@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .columnar_cache import ColumnarCache
+from .excel_engines import excel_engine
+from .excel_reader import ExcelReader
+from .frame_cache import frame_cache
+from .league_catalog import league_catalog
+from .league_frame import compact_league_frame
+from .player_directory import player_directory
+from .player_index import player_index
+from .player_metadata import sort_player_file
+from .position_registry import position_registry
+
+
+def parse_file(path, usecols=None):
+    """
+    Function that parses a single data file through the columnar cache. It is defined at module level so it can be
+    run in a worker process.
+
+    :param path: Path to the Excel file to parse.
+    :param usecols: Optional list of column headers to parse, see ExcelReader.read_file().
+    :return: The path and the DataFrame containing the file's data.
+    """
+    return path, ColumnarCache().load(path, excel_engine.reader(usecols), usecols=usecols)
+
+
+class FilePreloader:
+    """
+    Class that loads all local league and player files into memory ahead of time, so that the first requests after a
+    deploy do not pay for parsing them. The files are parsed in a process pool, after which the DataFrames are put in
+    the process-wide frame cache, and the league catalog, player directory, player index, league stores and player file
+    metadata are built from them.
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Constructor for the class.
+
+        :param max_workers: Number of worker processes to parse files with. Defaults to the number of CPUs.
+        """
+        self.__max_workers = max_workers
+        self.__reader = ExcelReader()
+
+    def data_files(self):
+        """
+        Function that lists all league and player files.
+
+        :return: List of paths of all Excel files in the league and player folders.
+        """
+        paths = []
+        for folder in [league_catalog.folder, player_index.folder]:
+            if not os.path.isdir(folder):
+                continue
+            for filename in sorted(os.listdir(folder)):
+                if filename.endswith(".xlsx") and not filename.startswith("~$"):
+                    paths.append(os.path.join(folder, filename))
+        return paths
+
+    def preload(self):
+        """
+        Function that parses all data files in parallel, keeps them in the frame cache, and builds the league catalog,
+        player directory, player index, league stores and player file metadata. The worker processes are spawned, since
+        forking the app process is unsafe once it runs threads, e.g. when the preload runs in the warm-up thread. The
+        fork server is left to the render pool, which preloads the graph modules in it, see RenderPool.create_pool().
+
+        :return: Number of files that were loaded.
+        """
+        paths = self.data_files()
+        if paths:
+            usecols = [position_registry.league_columns if os.path.dirname(path) == league_catalog.folder else None
+                       for path in paths]
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.__max_workers, mp_context=context) as executor:
+                for (path, df), columns in zip(executor.map(parse_file, paths, usecols), usecols):
+                    if os.path.dirname(path) == player_index.folder:
+                        df = sort_player_file(df)
+                    elif columns is not None:
+                        df = compact_league_frame(df, columns)
+                    frame_cache.put(self.__reader.file_key(path), df)
+
+        league_catalog.rebuild()
+        player_directory.rebuild()
+        player_index.rebuild()
+        for league in league_catalog.names():
+            self.__reader.league_store(league)
+        for player in player_index.names():
+            self.__reader.player_metadata(player)
+        return len(paths)
+
+    @property
+    def max_workers(self):
+        """
+        Getter for the max_workers attribute of the FilePreloader.
+
+        :return: Number of worker processes used for parsing, or None for the number of CPUs.
+        """
+        return self.__max_workers
@@ -1,28 +1,217 @@
+import hashlib
 import os
 import shutil
+from collections import namedtuple
+
+from .data_versions import data_versions
+from .excel_reader import ExcelReader
+from .league_catalog import league_catalog
+from .player_directory import player_directory
+from .player_index import player_index
+
+# Files written to a staging folder by FileUpdater.stage(): the staging folder, and per kind of file a dictionary with
+# file names as keys and BLAKE2b hashes as values, or None if that kind of file is kept from the current version.
+StagedUpdate = namedtuple('StagedUpdate', ['staging', 'digests'])
 
 
 class FileUpdater:
-    def update(self, files, folder):
-        if os.path.exists(folder):
-            shutil.rmtree(folder)
-        os.mkdir(folder)
+    """
+    Class that replaces the local league and player files with new ones. The new files are written to a staging folder
+    that becomes a new data version once it is complete, see DataVersions, so requests keep reading the previous
+    version until the update has finished.
+    """
+
+    def __init__(self, versions=None):
+        """
+        Constructor for the class.
+
+        :param versions: DataVersions managing the data folders. Defaults to the app's data versions.
+        """
+        self.__versions = versions if versions is not None else data_versions
+
+    def write_file(self, file, folder):
+        """
+        Function that writes a single new file to a folder, and computes the BLAKE2b hash of its contents while it is
+        being written.
+
+        :param file: Either the path of a file, or an uploaded file with a filename and a stream.
+        :param folder: Folder to write the file to.
+        :return: The name of the written file, and the hexadecimal hash of its contents.
+        """
+        if hasattr(file, 'stream'):
+            filename, source = os.path.basename(file.filename), file.stream
+            close = False
+        else:
+            filename, source = os.path.basename(file), open(file, 'rb')
+            close = True
+        digest = hashlib.blake2b(digest_size=32)
+        try:
+            with open(os.path.join(folder, filename), 'wb') as target:
+                for chunk in iter(lambda: source.read(1 << 20), b''):
+                    digest.update(chunk)
+                    target.write(chunk)
+        finally:
+            if close:
+                source.close()
+        return filename, digest.hexdigest()
+
+    def link_file(self, source, target):
+        """
+        Function that places a file of the current version in the staged version. The file is hard-linked where
+        possible, so it is not copied on disk and keeps its modification time and size.
+
+        :param source: Path of the file in the current version.
+        :param target: Path of the file in the staged version.
+        """
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def copy_folder(self, source, target):
+        """
+        Function that fills a folder of the staged version with the files of the current version, for data that is not
+        being replaced.
+
+        :param source: Folder of the current version.
+        :param target: Folder of the staged version.
+        :return: List of the names of the copied files.
+        """
+        if not os.path.isdir(source):
+            return []
+        filenames = []
+        for filename in sorted(os.listdir(source)):
+            path = os.path.join(source, filename)
+            if os.path.isfile(path):
+                self.link_file(path, os.path.join(target, filename))
+                filenames.append(filename)
+        return filenames
+
+    def stage(self, league_files=None, player_files=None):
+        """
+        Function that writes the passed files to a new staging folder, without comparing them to the current version
+        yet. This is the only step that needs the uploaded files, so the rest of the update can run later, see
+        complete().
+
+        :param league_files: List of new league files, or None to keep the current league files.
+        :param player_files: List of new player files, or None to keep the current player files.
+        :return: StagedUpdate containing the staging folder, and per kind of file a dictionary with the names of the
+        written files as keys and their BLAKE2b hashes as values, or None if that kind is kept.
+        """
+        staging = self.__versions.stage()
+        digests = {}
+        try:
+            for kind, files in [('leagues', league_files), ('players', player_files)]:
+                if files is None:
+                    digests[kind] = None
+                    continue
+                digests[kind] = {}
+                for file in files:
+                    filename, digest = self.write_file(file, os.path.join(staging, kind))
+                    digests[kind][filename] = digest
+        except Exception:
+            self.__versions.discard(staging)
+            raise
+        return StagedUpdate(staging, digests)
+
+    def complete(self, staged, prepare=None):
+        """
+        Function that publishes a staged update as a new data version. The staged files are compared to the current
+        version by the BLAKE2b hash of their contents, see DataVersions.manifest(): files with unchanged contents are
+        linked to the current file instead, and keep their cached data, and a kind of file that was not staged is
+        carried over from the current version. No version is published when nothing changed.
+
+        :param staged: StagedUpdate returned by stage().
+        :param prepare: Optional function that takes the staging folder and the update summary, called before the
+        version is published, e.g. to validate the added and changed files. An exception raised by it cancels the
+        update.
+        :return: Dictionary containing the number of the current data version after the update, and per kind of file
+        the lists of added, changed, removed and unchanged file names.
+        """
+        staging = staged.staging
+        current = self.__versions.current()
+        old_manifest = self.__versions.manifest(current)
+        manifest = {}
+        summary = {'version': current}
+        try:
+            for kind in self.__versions.kinds:
+                folder = os.path.join(staging, kind)
+                current_folder = self.__versions.folder(kind, current)
+                old_digests = old_manifest.get(kind, {})
+                changes = {'added': [], 'changed': [], 'removed': [], 'unchanged': []}
+                summary[kind] = changes
+                digests = staged.digests.get(kind)
+                if digests is None:
+                    changes['unchanged'] = self.copy_folder(current_folder, folder)
+                    manifest[kind] = {filename: old_digests[filename] for filename in changes['unchanged']
+                                      if filename in old_digests}
+                    continue
+                for filename, digest in digests.items():
+                    if filename not in old_digests:
+                        changes['added'].append(filename)
+                    elif old_digests[filename] != digest:
+                        changes['changed'].append(filename)
+                    else:
+                        path = os.path.join(folder, filename)
+                        os.remove(path)
+                        self.link_file(os.path.join(current_folder, filename), path)
+                        changes['unchanged'].append(filename)
+                changes['removed'] = sorted(set(old_digests) - set(digests))
+                manifest[kind] = dict(digests)
+
+            if not any(summary[kind][change] for kind in self.__versions.kinds
+                       for change in ('added', 'changed', 'removed')):
+                self.__versions.discard(staging)
+                return summary
+            if prepare is not None:
+                prepare(staging, summary)
+            self.__versions.write_manifest(staging, manifest)
+            version = self.__versions.publish(staging, ExcelReader().invalidate)
+        except Exception:
+            self.__versions.discard(staging)
+            raise
+
+        summary['version'] = version
+        reader = ExcelReader()
+        for kind in self.__versions.kinds:
+            new_folder = self.__versions.folder(kind, version)
+            moved = [(self.__versions.folder(kind, current), filename) for filename in summary[kind]['unchanged']]
+            moved += [(os.path.join(staging, kind), filename)
+                      for filename in summary[kind]['added'] + summary[kind]['changed']]
+            for old_folder, filename in moved:
+                try:
+                    reader.carry_over(os.path.join(old_folder, filename), os.path.join(new_folder, filename))
+                except OSError:
+                    pass
+        league_catalog.rebuild()
+        player_directory.rebuild()
+        player_index.rebuild()
+        return summary
+
+    def update(self, league_files=None, player_files=None):
+        """
+        Function that publishes a new data version with the passed files, see stage() and complete().
 
-        for file in files:
-            shutil.copy(file, folder)
+        :param league_files: List of new league files, or None to keep the current league files.
+        :param player_files: List of new player files, or None to keep the current player files.
+        :return: Dictionary describing the update, see complete().
+        """
+        return self.complete(self.stage(league_files, player_files))
 
     def update_league_files(self, new_files):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
+        """
+        Function that replaces the league files, keeping the current player files.
 
-        # Get the absolute path of the parent directory (source folder)
-        source_folder = os.path.abspath(os.path.join(current_dir, '..', '..'))
-        files_folder = os.path.join(source_folder, 'graph_app', 'files', 'leagues')
-        self.update(new_files, files_folder)
+        :param new_files: List of new league files.
+        :return: Dictionary describing the update, see update().
+        """
+        return self.update(league_files=new_files)
 
     def update_player_files(self, new_files):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
+        """
+        Function that replaces the player files, keeping the current league files.
 
-        # Get the absolute path of the parent directory (source folder)
-        source_folder = os.path.abspath(os.path.join(current_dir, '..', '..'))
-        files_folder = os.path.join(source_folder, 'graph_app', 'files', 'players')
-        self.update(new_files, files_folder)
+        :param new_files: List of new player files.
+        :return: Dictionary describing the update, see update().
+        """
+        return self.update(player_files=new_files)
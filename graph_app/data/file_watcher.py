@@ -0,0 +1,340 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+from .excel_reader import ExcelReader
+from .league_catalog import league_catalog
+from .player_directory import player_directory
+from .player_index import player_index
+from .position_registry import position_registry
+
+# Seconds between checks for changed files when polling, and between checks for moved watch targets with inotify
+WATCH_INTERVAL = float(os.environ.get('GRAPH_APP_WATCH_INTERVAL', '2'))
+
+
+class Inotify:
+    """
+    Class representing a Linux inotify instance, accessed through the C library so that no extra package is needed.
+    Only the events that indicate a finished change to a file are watched for: a file that was written and closed,
+    created, moved into or out of a folder, or deleted.
+    """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    mask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    event_header = struct.Struct('iIII')
+
+    def __init__(self):
+        """
+        Constructor for the class.
+
+        :raises: OSError when inotify is not available on this system.
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux.")
+        self.__libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.__fd = self.__libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "Could not initialize inotify.")
+        self.__folders = {}
+
+    def add_watch(self, folder):
+        """
+        Function that starts watching a folder.
+
+        :param folder: Path of the folder.
+        :return: Watch descriptor of the folder.
+        :raises: OSError when the folder cannot be watched.
+        """
+        wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(folder), self.mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "Could not watch " + folder)
+        self.__folders[wd] = folder
+        return wd
+
+    def remove_watches(self):
+        """
+        Function that stops watching all folders.
+        """
+        for wd in list(self.__folders):
+            self.__libc.inotify_rm_watch(self.__fd, wd)
+        self.__folders = {}
+
+    def read(self, timeout):
+        """
+        Function that waits for events, without using CPU while waiting.
+
+        :param timeout: Maximum number of seconds to wait.
+        :return: Set of paths of the files that events were received for, empty if the timeout expired.
+        """
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        paths = set()
+        while readable:
+            try:
+                data = os.read(self.__fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + self.event_header.size <= len(data):
+                wd, _, _, length = self.event_header.unpack_from(data, offset)
+                offset += self.event_header.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if wd in self.__folders and name:
+                    paths.add(os.path.join(self.__folders[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        """
+        Function that closes the inotify instance.
+        """
+        os.close(self.__fd)
+
+
+class FileWatcher:
+    """
+    Class that watches data files for changes made outside of the app, e.g. workbooks copied into the files folder by
+    hand, and notifies subscribers with the path of every changed file. It uses inotify where available, and otherwise
+    compares the modification times and sizes of the files every interval. The watch targets are checked again every
+    interval, so the watcher follows the folders of the current data version. Changes within a short period are
+    combined, so a file that is written in several steps results in a single notification.
+    """
+
+    def __init__(self, targets, interval=None, debounce=0.5, use_inotify=True):
+        """
+        Constructor for the class. The watcher only runs after start() is called.
+
+        :param targets: Function without arguments that returns the paths of the folders and files to watch.
+        :param interval: Seconds between polls, and between checks of the watch targets. Defaults to
+        GRAPH_APP_WATCH_INTERVAL.
+        :param debounce: Seconds to wait for more changes after a change, before notifying subscribers.
+        :param use_inotify: Whether to use inotify if it is available, instead of polling.
+        """
+        self.__targets = targets
+        self.__interval = interval if interval is not None else WATCH_INTERVAL
+        self.__debounce = debounce
+        self.__use_inotify = use_inotify
+        self.__subscribers = []
+        self.__watches = None
+        self.__snapshot = {}
+        self.__inotify = None
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    def subscribe(self, callback):
+        """
+        Function that registers a function to be called with the absolute path of every changed file.
+
+        :param callback: Function that takes the path of a changed, created or removed file.
+        """
+        self.__subscribers.append(callback)
+
+    def start(self):
+        """
+        Function that starts watching in a background thread. Does nothing if the watcher is already running.
+        """
+        if self.is_running():
+            return
+        self.__stop.clear()
+        if self.__use_inotify:
+            try:
+                self.__inotify = Inotify()
+            except (OSError, AttributeError) as error:
+                print("inotify not available, polling for file changes instead:", error)
+                self.__inotify = None
+        self.__watches = None
+        self.__thread = threading.Thread(target=self.run, name='file-watcher', daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Function that stops the watcher.
+
+        :param timeout: Maximum number of seconds to wait for the background thread to finish.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+
+    def is_running(self):
+        """
+        Function that checks whether the watcher is running.
+
+        :return: True if the background thread is running, False if not.
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def run(self):
+        """
+        Function that watches for changes until the watcher is stopped.
+        """
+        try:
+            while not self.__stop.is_set():
+                self.update_watches()
+                changed = self.wait_for_changes(self.__interval)
+                if changed and not self.__stop.wait(self.__debounce):
+                    changed |= self.wait_for_changes(0)
+                if changed and not self.__stop.is_set():
+                    self.notify(changed)
+        finally:
+            if self.__inotify is not None:
+                self.__inotify.close()
+                self.__inotify = None
+
+    def watches(self):
+        """
+        Function that determines the folders to watch from the watch targets. A file target is watched through the
+        folder it is in, limited to the file's name.
+
+        :return: Dictionary with absolute folder paths as keys, and sets of file names to watch as values, or None to
+        watch every file in the folder.
+        """
+        watches = {}
+        for target in self.__targets():
+            target = os.path.abspath(target)
+            if os.path.isdir(target):
+                watches[target] = None
+            else:
+                folder, name = os.path.split(target)
+                if folder not in watches:
+                    watches[folder] = set()
+                if watches[folder] is not None:
+                    watches[folder].add(name)
+        return watches
+
+    def update_watches(self):
+        """
+        Function that starts watching the current watch targets if they have changed, e.g. after a new data version was
+        published. Files that are only found at the new targets do not count as changed.
+        """
+        watches = self.watches()
+        if watches == self.__watches:
+            return
+        self.__watches = watches
+        self.__snapshot = self.snapshot()
+        if self.__inotify is not None:
+            self.__inotify.remove_watches()
+            for folder in watches:
+                try:
+                    self.__inotify.add_watch(folder)
+                except OSError as error:
+                    print("Could not watch folder:", error)
+
+    def snapshot(self):
+        """
+        Function that records the modification time and size of every watched file.
+
+        :return: Dictionary with file paths as keys, and tuples of modification time and size as values.
+        """
+        snapshot = {}
+        for folder, names in self.__watches.items():
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for entry in entries:
+                if (names is None or entry.name in names) and entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait_for_changes(self, timeout):
+        """
+        Function that waits for watched files to change.
+
+        :param timeout: Maximum number of seconds to wait.
+        :return: Set of paths of the changed files, empty if none changed within the timeout.
+        """
+        if self.__inotify is not None:
+            return {path for path in self.__inotify.read(timeout) if self.is_watched(path)}
+        if timeout and self.__stop.wait(timeout):
+            return set()
+        snapshot = self.snapshot()
+        old_snapshot, self.__snapshot = self.__snapshot, snapshot
+        return {path for path in set(snapshot) | set(old_snapshot) if snapshot.get(path) != old_snapshot.get(path)}
+
+    def is_watched(self, path):
+        """
+        Function that checks whether a path belongs to the watch targets.
+
+        :param path: Absolute path of a file.
+        :return: True if the file is in a watched folder, or is a watched file.
+        """
+        folder, name = os.path.split(path)
+        if folder not in self.__watches:
+            return False
+        names = self.__watches[folder]
+        return names is None or name in names
+
+    def notify(self, paths):
+        """
+        Function that passes changed files to all subscribers. An error raised by a subscriber is reported, and does
+        not stop the other subscribers from being notified.
+
+        :param paths: Set of paths of the changed files.
+        """
+        for path in sorted(paths):
+            for callback in list(self.__subscribers):
+                try:
+                    callback(path)
+                except Exception as error:
+                    print("Could not handle change of " + path + ":", error)
+
+    @property
+    def backend(self):
+        """
+        Getter for the backend attribute of the FileWatcher.
+
+        :return: String 'inotify' if inotify is used to watch for changes, 'polling' otherwise.
+        """
+        return 'inotify' if self.__inotify is not None else 'polling'
+
+
+def data_file_targets():
+    """
+    Function that lists the data files the app derives in-memory data from: the league and player folders of the
+    current data version, and the stats per position file.
+
+    :return: List of paths to watch.
+    """
+    return [league_catalog.folder, player_index.folder, position_registry.stats_file]
+
+
+def refresh_derived_data(path):
+    """
+    Function that updates the in-memory data derived from a changed data file, after its cached data has been dropped by
+    ExcelReader.invalidate(). Only the structures the file belongs to are rebuilt, and a league or player file that
+    still exists is loaded again, so the next request does not have to.
+
+    :param path: Absolute path of the changed file.
+    """
+    folder, name = os.path.split(path)
+    if path == os.path.abspath(position_registry.stats_file):
+        position_registry.reload()
+        return
+    if not name.endswith('.xlsx') or name.startswith('~$'):
+        return
+    if folder == os.path.abspath(league_catalog.folder):
+        league_catalog.rebuild()
+        player_directory.rebuild()
+        kind = 'leagues'
+    elif folder == os.path.abspath(player_index.folder):
+        player_index.rebuild()
+        kind = 'players'
+    else:
+        return
+    if os.path.exists(path):
+        ExcelReader().prepare_file(path, kind)
+
+
+file_watcher = FileWatcher(data_file_targets)
+file_watcher.subscribe(ExcelReader().invalidate)
+file_watcher.subscribe(refresh_derived_data)
@@ -0,0 +1,146 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+class FrameCache:
+    """
+    Class representing a process-wide, in-memory cache of DataFrames read from the local data files. The cache has a
+    memory budget in bytes, measured with DataFrame.memory_usage(deep=True), and evicts the least recently used
+    DataFrames once the budget is exceeded. DataFrames returned by the cache are shared between requests, and should
+    therefore not be modified in place.
+    """
+
+    def __init__(self, max_bytes):
+        """
+        Constructor for the class.
+
+        :param max_bytes: Maximum amount of memory in bytes that the cached DataFrames may use combined.
+        """
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__used_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__loading = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Function that retrieves a cached DataFrame, and marks it as most recently used.
+
+        :param key: Hashable key the DataFrame was stored under.
+        :return: The cached DataFrame, or None if the key was not in the cache.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, key, df):
+        """
+        Function that stores a DataFrame in the cache, evicting the least recently used DataFrames until it fits in the
+        memory budget. DataFrames that are larger than the entire budget are not stored.
+
+        :param key: Hashable key to store the DataFrame under.
+        :param df: DataFrame to store.
+        """
+        size = int(df.memory_usage(deep=True).sum())
+        with self.__lock:
+            self.__discard(key)
+            if size > self.__max_bytes:
+                return
+            while self.__used_bytes + size > self.__max_bytes:
+                oldest = next(iter(self.__entries))
+                self.__discard(oldest)
+                self.__evictions += 1
+            self.__entries[key] = (df, size)
+            self.__used_bytes += size
+
+    def get_or_load(self, key, loader):
+        """
+        Function that retrieves a cached DataFrame, or loads and caches it if it was not in the cache. Only one thread
+        loads a missing key at a time: other threads asking for the same key wait for its DataFrame instead of loading
+        it as well. If the load fails, the error is raised in the loading thread, and a waiting thread loads the key.
+
+        :param key: Hashable key the DataFrame is stored under.
+        :param loader: Function without arguments that returns the DataFrame on a cache miss.
+        :return: The cached or newly loaded DataFrame.
+        """
+        while True:
+            with self.__lock:
+                entry = self.__entries.get(key)
+                if entry is not None:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return entry[0]
+                pending = self.__loading.get(key)
+                if pending is None:
+                    pending = self.__loading[key] = [threading.Event(), None]
+                    self.__misses += 1
+                    break
+            pending[0].wait()
+            if pending[1] is not None:
+                return pending[1]
+
+        try:
+            df = loader()
+            self.put(key, df)
+            pending[1] = df
+        finally:
+            with self.__lock:
+                self.__loading.pop(key, None)
+            pending[0].set()
+        return df
+
+    def invalidate(self, predicate=None):
+        """
+        Function that removes entries from the cache.
+
+        :param predicate: Optional function that takes a key and returns True if the entry should be removed. If
+        omitted, all entries are removed.
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                if predicate is None or predicate(key):
+                    self.__discard(key)
+
+    def stats(self):
+        """
+        Function that reports the usage of the cache.
+
+        :return: Dictionary containing the number of hits, misses, evictions and entries, and the used and maximum
+        amount of memory in bytes.
+        """
+        with self.__lock:
+            return {'hits': self.__hits,
+                    'misses': self.__misses,
+                    'evictions': self.__evictions,
+                    'entries': len(self.__entries),
+                    'used_bytes': self.__used_bytes,
+                    'max_bytes': self.__max_bytes}
+
+    def __discard(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__used_bytes -= entry[1]
+
+    @property
+    def max_bytes(self):
+        """
+        Getter for the max_bytes attribute of the FrameCache.
+
+        :return: Integer representing the memory budget of the cache in bytes.
+        """
+        return self.__max_bytes
+
+
+# Memory budget of the process-wide cache in megabytes, configurable through the environment.
+FRAME_CACHE_MB = int(os.environ.get('GRAPH_APP_FRAME_CACHE_MB', '512'))
+
+frame_cache = FrameCache(FRAME_CACHE_MB * 1024 * 1024)
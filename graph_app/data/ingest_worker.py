@@ -0,0 +1,206 @@
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+from .excel_reader import ExcelReader
+from .file_updater import FileUpdater
+from .position_registry import position_registry
+
+
+class SchemaError(ValueError):
+    """
+    Error raised when an uploaded data file lacks columns that the graphs need.
+    """
+
+
+def required_columns(kind):
+    """
+    Function that lists the columns a data file must contain: the Player and Position columns and all radar chart
+    categories for league files, and the Date column and all line plot stats for player files.
+
+    :param kind: Kind of data file, either 'leagues' or 'players'.
+    :return: Tuple of column names, without duplicates.
+    """
+    if kind == 'leagues':
+        columns = ['Player', 'Position']
+        stats = position_registry.league_categories.values()
+    else:
+        columns = ['Date']
+        stats = position_registry.line_stats.values()
+    return tuple(dict.fromkeys(columns + [stat for position_stats in stats for stat in position_stats]))
+
+
+def missing_columns(df, kind):
+    """
+    Function that checks the schema of a data file.
+
+    :param df: DataFrame containing the data of the file.
+    :param kind: Kind of data file, either 'leagues' or 'players'.
+    :return: List of required columns that the file does not contain, see required_columns().
+    """
+    return [column for column in required_columns(kind) if column not in df.columns]
+
+
+class IngestWorker:
+    """
+    Class that publishes uploaded data files in the background. An upload is written to a staging folder right away,
+    after which a single worker thread validates the schema of every added or changed file, converts it into the
+    columnar cache, league store or player metadata, and only then publishes the new data version. Requests keep using
+    the previous version until that has finished, and find the converted data in the caches once it is published. Jobs
+    are handled one at a time in order of submission, and the status of recent jobs is kept for the status endpoint.
+    """
+
+    def __init__(self, updater=None, history=50):
+        """
+        Constructor for the class. The worker thread is started on the first submitted job.
+
+        :param updater: FileUpdater to stage and publish the files with. Defaults to one for the app's data versions.
+        :param history: Number of finished jobs to keep the status of.
+        """
+        self.__updater = updater if updater is not None else FileUpdater()
+        self.__reader = ExcelReader()
+        self.__history = history
+        self.__jobs = OrderedDict()
+        self.__ids = itertools.count(1)
+        self.__queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+    def submit(self, league_files=None, player_files=None):
+        """
+        Function that stages uploaded files and queues them for ingestion. The files are written to disk before this
+        function returns, so the uploads can be closed afterwards.
+
+        :param league_files: List of new league files, or None to keep the current league files.
+        :param player_files: List of new player files, or None to keep the current player files.
+        :return: Dictionary containing the status of the queued job, see status().
+        """
+        staged = self.__updater.stage(league_files, player_files)
+        with self.__lock:
+            job_id = str(next(self.__ids))
+            self.__jobs[job_id] = {'job': job_id, 'state': 'queued', 'submitted': time.time(),
+                                   'done': threading.Event()}
+            self.prune()
+            if self.__thread is None or not self.__thread.is_alive():
+                self.__thread = threading.Thread(target=self.run, name='ingest-worker', daemon=True)
+                self.__thread.start()
+        self.__queue.put((job_id, staged))
+        return self.status(job_id)
+
+    def run(self):
+        """
+        Function that handles queued jobs for as long as the app runs.
+        """
+        while True:
+            job_id, staged = self.__queue.get()
+            try:
+                self.process(job_id, staged)
+            finally:
+                self.__queue.task_done()
+
+    def process(self, job_id, staged):
+        """
+        Function that ingests a single staged upload and publishes it, recording the outcome in the job's status.
+
+        :param job_id: Identifier of the job.
+        :param staged: StagedUpdate containing the staged files, see FileUpdater.stage().
+        """
+        start = time.perf_counter()
+        try:
+            summary = self.__updater.complete(staged, lambda staging, changes: self.ingest(job_id, staging, changes))
+            self.update_status(job_id, state='published', summary=summary)
+        except Exception as error:
+            print("Ingest failed:", error)
+            self.update_status(job_id, state='failed', error=str(error))
+        with self.__lock:
+            job = self.__jobs[job_id]
+            job['seconds'] = round(time.perf_counter() - start, 2)
+            job['done'].set()
+
+    def ingest(self, job_id, staging, summary):
+        """
+        Function that validates and converts the added and changed files of a staged upload. All files are validated
+        before any of them is converted, so an invalid upload fails fast.
+
+        :param job_id: Identifier of the job.
+        :param staging: Path of the staging folder.
+        :param summary: Dictionary describing the update, see FileUpdater.complete().
+        :raises: SchemaError when a file lacks required columns.
+        """
+        files = [(kind, os.path.join(staging, kind, filename)) for kind in ('leagues', 'players')
+                 for filename in summary[kind]['added'] + summary[kind]['changed']]
+        self.update_status(job_id, state='validating', files=len(files), processed=0)
+        for kind, path in files:
+            usecols = position_registry.league_columns if kind == 'leagues' else None
+            missing = missing_columns(self.__reader.read_file(path, usecols=usecols), kind)
+            if missing:
+                raise SchemaError(kind + "/" + os.path.basename(path) + " is missing columns: " + ", ".join(missing))
+
+        self.update_status(job_id, state='converting')
+        for processed, (kind, path) in enumerate(files, 1):
+            self.__reader.prepare_file(path, kind)
+            self.update_status(job_id, processed=processed)
+        self.update_status(job_id, state='publishing')
+
+    def update_status(self, job_id, **values):
+        """
+        Function that updates the status of a job.
+
+        :param job_id: Identifier of the job.
+        :param values: Status values to set.
+        """
+        with self.__lock:
+            job = self.__jobs.get(job_id)
+            if job is not None:
+                job.update(values)
+
+    def prune(self):
+        """
+        Function that forgets the oldest finished jobs beyond the history size. Must be called with the lock held.
+        """
+        finished = [job_id for job_id, job in self.__jobs.items() if job['done'].is_set()]
+        for job_id in finished[:max(len(self.__jobs) - self.__history, 0)]:
+            del self.__jobs[job_id]
+
+    def status(self, job_id):
+        """
+        Function that retrieves the status of a job.
+
+        :param job_id: Identifier of the job.
+        :return: Dictionary containing the job's identifier and state ('queued', 'validating', 'converting',
+        'publishing', 'published' or 'failed'), the number of files to ingest and processed so far, and the update
+        summary or error once finished. None if the job is unknown.
+        """
+        with self.__lock:
+            job = self.__jobs.get(job_id)
+            if job is None:
+                return None
+            return {key: value for key, value in job.items() if key != 'done'}
+
+    def jobs(self):
+        """
+        Function that retrieves the status of all recent jobs.
+
+        :return: List of dictionaries containing the status of each job, see status(), oldest first.
+        """
+        with self.__lock:
+            job_ids = list(self.__jobs)
+        return [status for status in map(self.status, job_ids) if status is not None]
+
+    def wait(self, job_id, timeout=None):
+        """
+        Function that blocks until a job has finished.
+
+        :param job_id: Identifier of the job.
+        :param timeout: Maximum number of seconds to wait.
+        :return: True if the job finished within the timeout, False if not or if the job is unknown.
+        """
+        with self.__lock:
+            job = self.__jobs.get(job_id)
+        return job is not None and job['done'].wait(timeout)
+
+
+ingest_worker = IngestWorker()
@@ -0,0 +1,173 @@
+import os
+import random
+import threading
+from collections import namedtuple
+
+from .columnar_cache import ColumnarCache
+from .data_versions import data_versions
+from .excel_engines import excel_engine
+from .position_registry import position_registry
+
+# Catalog entry for a single league file: the league name as in the file name, and the file path
+LeagueEntry = namedtuple('LeagueEntry', ['name', 'path'])
+# Details of a single league file: its number of rows (players), and the headers of the columns read for graphs
+LeagueDetails = namedtuple('LeagueDetails', ['rows', 'columns'])
+
+
+class LeagueCatalog:
+    """
+    Class representing a catalog of all local league files, mapping normalized league names to the league files. It
+    allows for exact lookups of leagues by name, e.g. "Bundesliga" never resolves to "2. Bundesliga.xlsx", and for
+    random selection of a league, without scanning the league folder on each request. Building the catalog only lists
+    the league folder; the row count and column headers of a league file are read on the first describe() call for it.
+    The catalog is kept per data version, see DataVersions, and built again once a new version is published.
+    """
+
+    def __init__(self, folder=None):
+        """
+        Constructor for the class. The catalog is built by rebuild(), or on first use.
+
+        :param folder: Path to the folder containing the league files. Defaults to the leagues folder of the current
+        data version.
+        """
+        self.__folder = folder
+        self.__cache = ColumnarCache()
+        self.__entries = None
+        self.__details = {}
+        self.__lock = threading.Lock()
+
+    def normalize(self, league):
+        """
+        Function that normalizes a league name for lookups, by ignoring case and redundant whitespace.
+
+        :param league: The name of the league.
+        :return: The normalized league name.
+        """
+        return " ".join(league.split()).casefold()
+
+    def describe(self, league):
+        """
+        Function that retrieves the row count and column headers of a league file. The file is read on the first call
+        for its catalog entry, with the same columns as for graphs, see position_registry.league_columns, so the catalog
+        shares their columnar cache entry.
+
+        :param league: The name of the league.
+        :return: LeagueDetails containing the league file's row count and the headers of the columns read, or None if
+        the league is not known.
+        """
+        entry = self.lookup(league)
+        if entry is None:
+            return None
+        details = self.__details.get(entry.path)
+        if details is None:
+            usecols = position_registry.league_columns
+            df = self.__cache.load(entry.path, excel_engine.reader(usecols), usecols=usecols)
+            details = LeagueDetails(len(df.index), tuple(df.columns))
+            self.__details[entry.path] = details
+        return details
+
+    def location(self):
+        """
+        Function that determines the data version and folder to catalog.
+
+        :return: The number of the data version, always 0 for a fixed folder, and the path of the league folder.
+        """
+        if self.__folder is not None:
+            return 0, self.__folder
+        return data_versions.location('leagues')
+
+    def build(self, folder=None):
+        """
+        Function that scans the league folder, and creates a catalog entry for each league file. The files are not
+        read, see describe().
+
+        :param folder: Path of the league folder to scan. Defaults to the folder of the current data version.
+        :return: Dictionary with normalized league names as keys, and LeagueEntry objects as values.
+        """
+        if folder is None:
+            folder = self.folder
+        entries = {}
+        if not os.path.isdir(folder):
+            return entries
+        for filename in sorted(os.listdir(folder)):
+            name, extension = os.path.splitext(filename)
+            if extension != ".xlsx" or filename.startswith("~$"):
+                continue
+            entries[self.normalize(name)] = LeagueEntry(name, os.path.join(folder, filename))
+        return entries
+
+    def rebuild(self):
+        """
+        Function that (re)builds the catalog, e.g. on startup or after the league files have been updated. The new
+        catalog replaces the old one in a single assignment, so concurrent lookups see either the old or the new one.
+        The details read by describe() are read again on the next call.
+        """
+        version, folder = self.location()
+        entries = self.build(folder)
+        with self.__lock:
+            self.__entries = (version, entries)
+            self.__details = {}
+
+    def get_entries(self):
+        """
+        Function that returns all catalog entries of the current data version, and builds the catalog if that has not
+        happened yet for this version.
+
+        :return: Dictionary with normalized league names as keys, and LeagueEntry objects as values.
+        """
+        version, folder = self.location()
+        entries = self.__entries
+        if entries is None or entries[0] != version:
+            with self.__lock:
+                if self.__entries is None or self.__entries[0] != version:
+                    self.__entries = (version, self.build(folder))
+                    self.__details = {}
+                entries = self.__entries
+        return entries[1]
+
+    def version(self):
+        """
+        Function that retrieves the data version the catalog describes.
+
+        :return: The number of the current data version, always 0 for a fixed folder.
+        """
+        return self.location()[0]
+
+    def lookup(self, league):
+        """
+        Function that retrieves the catalog entry of a league by exact (normalized) name.
+
+        :param league: The name of the league.
+        :return: LeagueEntry of the league, or None if the league is not known.
+        """
+        if not league:
+            return None
+        return self.get_entries().get(self.normalize(league))
+
+    def random_league(self):
+        """
+        Function that chooses a random league from the catalog.
+
+        :return: The name of a random football league, as in its file name.
+        """
+        return random.choice(list(self.get_entries().values())).name
+
+    def names(self):
+        """
+        Function that lists the names of all leagues in the catalog.
+
+        :return: List of league names, as in their file names.
+        """
+        return [entry.name for entry in self.get_entries().values()]
+
+    @property
+    def folder(self):
+        """
+        Getter for the folder attribute of the LeagueCatalog.
+
+        :return: String containing the path of the league folder.
+        """
+        return self.location()[1]
+
+
+league_catalog = LeagueCatalog()
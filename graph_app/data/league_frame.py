@@ -0,0 +1,45 @@
+import pandas as pd
+
+# League file columns with few distinct text values, stored as categoricals
+CATEGORICAL_COLUMNS = ('Team', 'Position', 'Birth country')
+
+
+def compact_league_frame(league_df, columns=None):
+    """
+    Function that prepares the data of a league file for use, storing it in compact dtypes: categoricals for the team,
+    position and birth country, float32 for fractional stats, and the smallest integer type for whole-number stats.
+    Empty stats are set to 0, empty values in the categorical columns to an empty string, and empty values in other text
+    columns, such as the player name, to 0 as Preprocessor.extract_league_data used to fill them, so the data does not
+    have to be filled per request. Done once when the file is loaded.
+
+    :param league_df: DataFrame containing the data of a league file, as read from the file.
+    :param columns: Optional list of columns to keep. Columns missing from the file are ignored.
+    :return: New DataFrame containing the same data in compact dtypes.
+    """
+    if columns is not None:
+        wanted = set(columns)
+        league_df = league_df[[column for column in league_df.columns if column in wanted]]
+    compact = {}
+    for column in league_df.columns:
+        values = league_df[column]
+        if pd.api.types.is_float_dtype(values):
+            compact[column] = values.fillna(0.0).astype('float32')
+        elif pd.api.types.is_integer_dtype(values):
+            compact[column] = pd.to_numeric(values, downcast='integer')
+        elif column in CATEGORICAL_COLUMNS:
+            compact[column] = values.fillna('').astype('category')
+        elif pd.api.types.is_object_dtype(values):
+            compact[column] = values.fillna(0.0)
+        else:
+            compact[column] = values
+    return pd.DataFrame(compact, index=league_df.index)
+
+
+def frame_memory(df):
+    """
+    Function that measures the memory used by a DataFrame, including the contents of its text values.
+
+    :param df: DataFrame to measure.
+    :return: Integer representing the number of bytes used.
+    """
+    return int(df.memory_usage(index=True, deep=True).sum())
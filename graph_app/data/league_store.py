@@ -0,0 +1,402 @@
+import hashlib
+import json
+import os
+import random
+import shutil
+import threading
+
+import numpy as np
+
+from .position_registry import position_registry
+
+
+class LeagueStore:
+    """
+    Class representing a compact, read-only store of the numeric stats in a league file. The stats are kept in a
+    contiguous float32 matrix with one row per player, which is saved as a .npy file and opened memory-mapped, so that
+    worker processes share the same pages through the OS page cache. Next to the matrix, the store keeps an index from
+    player names to rows, and from column headers to matrix columns, so that a player's row in the league DataFrame is
+    found without a scan of it. On creation, the store also computes a scale table with the maximum value of each radar
+    chart stat per general position, see scales(), and groups the rows by position code, so that a random player of a
+    position can be drawn in constant time, see random_player().
+    """
+    # Scale mode that normalizes radar stats against all players in the league
+    league_mode = 'league'
+    # Scale mode that normalizes radar stats against the players in the league with the same general position
+    position_mode = 'position'
+    # Version of the saved store layout, stores saved with another version are rebuilt
+    format_version = 2
+    # Name of the file containing the stat matrix
+    matrix_file = 'matrix.npy'
+    # Name of the file containing the player and column names
+    index_file = 'index.json'
+
+    def __init__(self, matrix, players, columns, positions=None):
+        """
+        Constructor for the class.
+
+        :param matrix: 2D float32 array (or memory map) with one row per player and one column per stat.
+        :param players: List of player names, in the order of the matrix rows.
+        :param columns: List of stat names, in the order of the matrix columns.
+        :param positions: Optional list of the positions of each player as in the league file, e.g. 'CF, LW', in the
+        order of the matrix rows.
+        """
+        self.__matrix = matrix
+        self.__players = tuple(players)
+        self.__columns = tuple(columns)
+        self.__positions = tuple(positions) if positions is not None else ('',) * len(self.__players)
+        self.__player_rows = {}
+        for row, player in enumerate(self.__players):
+            self.__player_rows.setdefault(player, []).append(row)
+        self.__column_index = {column: i for i, column in enumerate(self.__columns)}
+        self.__main_positions = tuple(position.split(', ')[0] for position in self.__positions)
+        self.__position_rows = self.build_position_rows()
+        self.__scale_table = self.build_scale_table()
+
+    @classmethod
+    def from_dataframe(cls, league_df):
+        """
+        Function that creates a store from a league DataFrame. Only numeric columns are included, with empty values
+        set to 0, the same way Preprocessor.extract_league_data fills them.
+
+        :param league_df: DataFrame containing all data in a league file.
+        :return: LeagueStore containing the numeric stats of the league, kept in memory.
+        """
+        numeric_df = league_df.select_dtypes(include='number')
+        matrix = np.ascontiguousarray(numeric_df.fillna(0.0).to_numpy(dtype=np.float32))
+        positions = [entry if isinstance(entry, str) else '' for entry in league_df['Position']]
+        return cls(matrix, league_df['Player'].tolist(), numeric_df.columns.tolist(), positions)
+
+    @classmethod
+    def open(cls, folder):
+        """
+        Function that opens a store that was saved to a folder, with the matrix memory-mapped.
+
+        :param folder: Folder the store was saved to.
+        :return: The opened LeagueStore.
+        :raises: ValueError when the store was saved with another layout version.
+        """
+        with open(os.path.join(folder, cls.index_file), encoding='utf-8') as file:
+            index = json.load(file)
+        if index.get('version') != cls.format_version:
+            raise ValueError("The league store in " + folder + " was saved with another layout version.")
+        matrix = np.load(os.path.join(folder, cls.matrix_file), mmap_mode='r')
+        return cls(matrix, index['players'], index['columns'], index['positions'])
+
+    def save(self, folder):
+        """
+        Function that saves the store to a folder. The files are written to a temporary folder first, which is then
+        renamed, so that other processes never open a half-written store.
+
+        :param folder: Folder to save the store to.
+        """
+        temp_folder = folder + '.' + str(os.getpid()) + '.tmp'
+        os.makedirs(temp_folder, exist_ok=True)
+        np.save(os.path.join(temp_folder, self.matrix_file), np.asarray(self.__matrix))
+        with open(os.path.join(temp_folder, self.index_file), 'w', encoding='utf-8') as file:
+            json.dump({'version': self.format_version, 'players': list(self.__players), 'columns': list(self.__columns),
+                       'positions': list(self.__positions)}, file)
+        try:
+            os.rename(temp_folder, folder)
+        except OSError:
+            # Another process saved the same store first
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    def row(self, player):
+        """
+        Function that retrieves the matrix row of a player. If a name occurs more than once, the first row is used.
+
+        :param player: The name of the player.
+        :return: The row index of the player, or None if the player is not in the league.
+        """
+        rows = self.__player_rows.get(player)
+        if rows is None:
+            return None
+        return rows[0]
+
+    def column_indices(self, columns):
+        """
+        Function that translates column headers into matrix column indices.
+
+        :param columns: List of stat names.
+        :return: List of matrix column indices.
+        :raises: KeyError when a column is not a numeric column of the league file.
+        """
+        return [self.__column_index[column] for column in columns]
+
+    def column_max(self, columns):
+        """
+        Function that retrieves the maximum value within the league for each of the passed stats.
+
+        :param columns: List of stat names.
+        :return: List containing the maximum value of each stat.
+        """
+        return self.__matrix[:, self.column_indices(columns)].max(axis=0).tolist()
+
+    def build_position_rows(self):
+        """
+        Function that groups the matrix rows by position code. A player is in the group of every position listed for
+        them in the league file.
+
+        :return: Dictionary with position codes as keys, and sorted arrays of matrix row indices as values.
+        """
+        position_rows = {}
+        for row, position in enumerate(self.__positions):
+            for code in position.split(', '):
+                if code:
+                    position_rows.setdefault(code, []).append(row)
+        return {code: np.array(rows, dtype=np.int64) for code, rows in position_rows.items()}
+
+    def position_rows(self, position):
+        """
+        Function that retrieves the matrix rows of all players that play a position.
+
+        :param position: Position code, e.g. 'CF'.
+        :return: Sorted array of matrix row indices, empty if no player plays the position.
+        """
+        return self.__position_rows.get(position, np.empty(0, dtype=np.int64))
+
+    def random_player(self, position, exclude=None):
+        """
+        Function that draws a random player that plays a position. Rows of the excluded player are skipped by shifting
+        the drawn index past them, so no draws are rejected.
+
+        :param position: Position code, e.g. 'CF'.
+        :param exclude: Optional name of a player that should not be drawn, e.g. the main player of a radar chart.
+        :return: The name of the drawn player, or None if no other player plays the position.
+        """
+        rows = self.position_rows(position)
+        excluded = []
+        for row in self.__player_rows.get(exclude, []):
+            index = int(np.searchsorted(rows, row))
+            if index < len(rows) and rows[index] == row:
+                excluded.append(index)
+        count = len(rows) - len(excluded)
+        if count <= 0:
+            return None
+        index = random.randrange(count)
+        for skipped in excluded:
+            if index >= skipped:
+                index += 1
+        return self.__players[rows[index]]
+
+    def build_scale_table(self):
+        """
+        Function that computes the maximum value of each radar chart stat for every general position, both within the
+        whole league and within the players of that position. A stat for which no player of the position has a value
+        above 0 uses the league maximum instead, so that it can still be normalized. Positions whose stats are not all
+        in the league file are left out.
+
+        :return: Dictionary with the scale modes as keys, and dictionaries with abbreviated general positions as keys
+        and tuples of maximum values as values.
+        """
+        short_names = position_registry.short_names
+        row_positions = np.array([short_names.get(position, '') for position in self.__main_positions], dtype=object)
+        table = {self.league_mode: {}, self.position_mode: {}}
+        for position, columns in position_registry.league_categories.items():
+            try:
+                stats = self.__matrix[:, self.column_indices(columns)]
+            except KeyError:
+                continue
+            if len(stats) == 0:
+                continue
+            league_max = stats.max(axis=0)
+            position_stats = stats[row_positions == position]
+            position_max = position_stats.max(axis=0) if len(position_stats) else league_max
+            position_max = np.where(position_max > 0, position_max, league_max)
+            table[self.league_mode][position] = tuple(league_max.tolist())
+            table[self.position_mode][position] = tuple(position_max.tolist())
+        return table
+
+    def scales(self, position, mode=None):
+        """
+        Function that retrieves the precomputed maximum values of the radar chart stats of a general position.
+
+        :param position: Abbreviated general position, e.g. 'ST'.
+        :param mode: Scale mode, either 'league' (default) to normalize against the whole league, or 'position' to
+        normalize against the players with the same general position.
+        :return: List containing the maximum value of each radar chart stat of the position, or None if the position
+        is not in the scale table.
+        :raises: ValueError when the scale mode is not known.
+        """
+        mode = mode or self.league_mode
+        if mode not in self.__scale_table:
+            raise ValueError("The passed scale mode is not known. Please choose league or position.")
+        scales = self.__scale_table[mode].get(position)
+        if scales is None:
+            return None
+        return list(scales)
+
+    @property
+    def matrix(self):
+        """
+        Getter for the matrix attribute of the LeagueStore.
+
+        :return: 2D float32 array with one row per player and one column per stat.
+        """
+        return self.__matrix
+
+    @property
+    def players(self):
+        """
+        Getter for the players attribute of the LeagueStore.
+
+        :return: Tuple containing the player names in the order of the matrix rows.
+        """
+        return self.__players
+
+    @property
+    def columns(self):
+        """
+        Getter for the columns attribute of the LeagueStore.
+
+        :return: Tuple containing the stat names in the order of the matrix columns.
+        """
+        return self.__columns
+
+    @property
+    def positions(self):
+        """
+        Getter for the positions attribute of the LeagueStore.
+
+        :return: Tuple containing the positions of each player as in the league file, in the order of the matrix rows.
+        """
+        return self.__positions
+
+    @property
+    def main_positions(self):
+        """
+        Getter for the main_positions attribute of the LeagueStore.
+
+        :return: Tuple containing the main (first) position code of each player, in the order of the matrix rows.
+        """
+        return self.__main_positions
+
+
+class LeagueStoreCache:
+    """
+    Class that keeps the league stores of the current league files open, and saves new stores to the cache folder when
+    a league file is loaded for the first time. Stores are keyed by the league file's path, modification time and size,
+    so a changed league file results in a new store. Saved stores are named after a hash of the absolute path, so that
+    league files with the same name in different folders, e.g. data versions, do not share a store.
+    """
+
+    def __init__(self, cache_folder):
+        """
+        Constructor for the class.
+
+        :param cache_folder: Folder to save the league stores in.
+        """
+        self.__cache_folder = cache_folder
+        self.__stores = {}
+        self.__lock = threading.Lock()
+
+    def path_prefix(self, path):
+        """
+        Function that creates the part of a store folder name that only depends on the path of the league file. It is
+        shared by the saved stores of all versions of the same file, so that stale versions can be found and removed.
+
+        :param path: Path to the league file.
+        :return: String containing a hash of the absolute file path, followed by an underscore.
+        """
+        return hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16] + '_'
+
+    def store_folder(self, key):
+        """
+        Function that determines the folder a league store is saved in.
+
+        :param key: Tuple containing the league file's path, modification time and size.
+        :return: Path of the folder to save the store in.
+        """
+        path, mtime, size = key
+        return os.path.join(self.__cache_folder, f"{self.path_prefix(path)}{mtime}_{size}")
+
+    def get(self, key, loader):
+        """
+        Function that retrieves the league store for a league file. It is opened from the cache folder if it was saved
+        before, and created from the league DataFrame otherwise.
+
+        :param key: Tuple containing the league file's path, modification time and size.
+        :param loader: Function without arguments that returns the league DataFrame, used when no store exists yet.
+        :return: The LeagueStore of the league file.
+        """
+        store = self.__stores.get(key)
+        if store is not None:
+            return store
+        folder = self.store_folder(key)
+        try:
+            store = LeagueStore.open(folder)
+        except (OSError, ValueError):
+            store = LeagueStore.from_dataframe(loader())
+            os.makedirs(self.__cache_folder, exist_ok=True)
+            self.remove_saved(key[0], folder)
+            shutil.rmtree(folder, ignore_errors=True)
+            store.save(folder)
+            try:
+                store = LeagueStore.open(folder)
+            except (OSError, ValueError):
+                pass
+        with self.__lock:
+            for old_key in [k for k in self.__stores if k[0] == key[0]]:
+                del self.__stores[old_key]
+            self.__stores[key] = store
+        return store
+
+    def remove_saved(self, path, keep=None):
+        """
+        Function that removes the saved stores of a league file from the cache folder.
+
+        :param path: Path of the league file.
+        :param keep: Optional path of a store folder to keep, e.g. that of the current version of the file.
+        """
+        if not os.path.isdir(self.__cache_folder):
+            return
+        prefix = self.path_prefix(path)
+        for name in os.listdir(self.__cache_folder):
+            folder = os.path.join(self.__cache_folder, name)
+            if name.startswith(prefix) and folder != keep:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    def carry_over(self, old_key, new_key):
+        """
+        Function that reuses the saved and open store of a league file for an identical copy of it at another path, e.g.
+        a file that was moved into a new data version. The saved store is moved to the folder of the copy.
+
+        :param old_key: Tuple containing the league file's path, modification time and size.
+        :param new_key: Tuple containing the copy's path, modification time and size.
+        """
+        old_folder = self.store_folder(old_key)
+        new_folder = self.store_folder(new_key)
+        if os.path.isdir(old_folder) and not os.path.exists(new_folder):
+            try:
+                os.rename(old_folder, new_folder)
+            except OSError:
+                pass
+        store = self.__stores.get(old_key)
+        if store is None:
+            return
+        with self.__lock:
+            self.__stores.pop(old_key, None)
+            self.__stores[new_key] = store
+
+    def invalidate(self, path):
+        """
+        Function that closes the open store of a league file, and removes its saved stores.
+
+        :param path: Absolute path of the league file.
+        """
+        with self.__lock:
+            for key in [k for k in self.__stores if k[0] == path]:
+                del self.__stores[key]
+        self.remove_saved(path)
+
+    def clear(self):
+        """
+        Function that closes all open league stores.
+        """
+        with self.__lock:
+            self.__stores = {}
+
+
+league_stores = LeagueStoreCache(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'cache', 'league_store')))
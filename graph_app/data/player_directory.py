@@ -0,0 +1,121 @@
+import threading
+from collections import namedtuple
+
+from .columnar_cache import ColumnarCache
+from .excel_engines import excel_engine
+from .league_catalog import league_catalog
+from .position_registry import position_registry
+
+# Location of a player in the league files: the league name as in the file name, and the player's row in that file.
+PlayerLocation = namedtuple('PlayerLocation', ['league', 'row'])
+
+
+class AmbiguousPlayerError(LookupError):
+    """
+    Error raised when a player name occurs in several league files, and no league was passed to choose between them.
+    The leagues the name occurs in are available as the leagues attribute.
+    """
+
+    def __init__(self, player, leagues):
+        super().__init__("Player " + player + " exists in several leagues, please pass one of: " + ", ".join(leagues))
+        self.player = player
+        self.leagues = list(leagues)
+
+
+class PlayerDirectory:
+    """
+    Class representing a directory of all players in the local league files, mapping player names to the leagues and
+    rows they occur in. It allows for finding the league of a player without reading every league file on each request.
+    Only the Player column of each league file is read to build it, through the columnar cache. Like the league catalog,
+    it is kept per data version.
+    """
+
+    def __init__(self, catalog):
+        """
+        Constructor for the class. The directory is built by rebuild(), or on first use.
+
+        :param catalog: LeagueCatalog containing the league files to index.
+        """
+        self.__catalog = catalog
+        self.__cache = ColumnarCache()
+        self.__directory = None
+        self.__lock = threading.Lock()
+
+    def build(self):
+        """
+        Function that reads the player names of all league files in the catalog, and creates the directory.
+
+        :return: Dictionary with player names as keys, and lists of PlayerLocation objects as values, in catalog order.
+        """
+        directory = {}
+        for entry in self.__catalog.get_entries().values():
+            usecols = position_registry.league_columns
+            players = self.__cache.load(entry.path, excel_engine.reader(usecols), ['Player'], usecols)['Player']
+            for row, player in enumerate(players):
+                if isinstance(player, str):
+                    directory.setdefault(player, []).append(PlayerLocation(entry.name, row))
+        return directory
+
+    def rebuild(self):
+        """
+        Function that (re)builds the directory, e.g. after the league files have been updated. The new directory
+        replaces the old one in a single assignment, so concurrent lookups see either the old or the new one.
+        """
+        version = self.__catalog.version()
+        directory = self.build()
+        with self.__lock:
+            self.__directory = (version, directory)
+
+    def get_directory(self):
+        """
+        Function that returns the directory of the current data version, and builds it if that has not happened yet
+        for this version.
+
+        :return: Dictionary with player names as keys, and lists of PlayerLocation objects as values.
+        """
+        version = self.__catalog.version()
+        directory = self.__directory
+        if directory is None or directory[0] != version:
+            with self.__lock:
+                if self.__directory is None or self.__directory[0] != version:
+                    self.__directory = (version, self.build())
+                directory = self.__directory
+        return directory[1]
+
+    def lookup(self, player):
+        """
+        Function that retrieves all locations of a player by exact name.
+
+        :param player: The name of the player.
+        :return: List of PlayerLocation objects, which is empty if the player is not in any league file.
+        """
+        if not player:
+            return []
+        return list(self.get_directory().get(player, []))
+
+    def leagues(self, player):
+        """
+        Function that lists the leagues a player occurs in.
+
+        :param player: The name of the player.
+        :return: List of league names without duplicates, in catalog order.
+        """
+        return list(dict.fromkeys(location.league for location in self.lookup(player)))
+
+    def resolve_league(self, player):
+        """
+        Function that finds the single league a player plays in.
+
+        :param player: The name of the player.
+        :return: The name of the player's league, or None if the player is not in any league file.
+        :raises: AmbiguousPlayerError when the player occurs in several league files.
+        """
+        leagues = self.leagues(player)
+        if len(leagues) > 1:
+            raise AmbiguousPlayerError(player, leagues)
+        if not leagues:
+            return None
+        return leagues[0]
+
+
+player_directory = PlayerDirectory(league_catalog)
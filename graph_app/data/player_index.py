@@ -0,0 +1,130 @@
+import os
+import threading
+
+from .data_versions import data_versions
+from .text_cleaner import TextCleaner
+
+
+class PlayerIndex:
+    """
+    Class representing an index from player names to the player files in the files folder, so that a player file can
+    be found with a dictionary lookup instead of scanning the folder. Every file is indexed under its cleaned player
+    name (see TextCleaner.clean_player_name), as well as under the full name in its file name. Several files can share
+    a cleaned name, e.g. "Player stats I. Sarr.xlsx" and "Player stats I. Sarr-2.xlsx" are both indexed as "I. Sarr".
+    A specific file can always be chosen by passing its full name, e.g. "I. Sarr-2". The index is kept per data version,
+    see DataVersions, and built again once a new version is published.
+    """
+
+    def __init__(self, folder=None):
+        """
+        Constructor for the class. The index is built on first use.
+
+        :param folder: Path to the folder containing the player files. Defaults to the players folder of the current
+        data version.
+        """
+        self.__folder = folder
+        self.__cleaner = TextCleaner()
+        self.__index = None
+        self.__lock = threading.Lock()
+
+    def location(self):
+        """
+        Function that determines the data version and folder to index.
+
+        :return: The number of the data version, always 0 for a fixed folder, and the path of the player folder.
+        """
+        if self.__folder is not None:
+            return 0, self.__folder
+        return data_versions.location('players')
+
+    def build(self, folder=None):
+        """
+        Function that scans the player folder, and creates the index.
+
+        :param folder: Path of the player folder to scan. Defaults to the folder of the current data version.
+        :return: Dictionary with player names as keys, and lists of file paths as values. The first path in each list
+        is the one whose full name matches the key, if any, followed by the rest in alphabetical order.
+        """
+        if folder is None:
+            folder = self.folder
+        index = {}
+        if not os.path.isdir(folder):
+            return index
+        for filename in sorted(os.listdir(folder)):
+            if not (filename.startswith("Player stats") and filename.endswith(".xlsx")):
+                continue
+            path = os.path.join(folder, filename)
+            full_name = self.__cleaner.remove_player_stats(os.path.splitext(filename)[0])
+            clean_name = self.__cleaner.clean_player_name(os.path.splitext(filename)[0])
+            index.setdefault(full_name, []).insert(0, path)
+            if clean_name != full_name:
+                index.setdefault(clean_name, []).append(path)
+        return index
+
+    def rebuild(self):
+        """
+        Function that rebuilds the index, e.g. after the player files have been updated. The new index replaces the old
+        one in a single assignment, so concurrent lookups see either the old or the new index.
+        """
+        version, folder = self.location()
+        index = self.build(folder)
+        with self.__lock:
+            self.__index = (version, index)
+
+    def get_index(self):
+        """
+        Function that returns the index of the current data version, and builds it if that has not happened yet for
+        this version.
+
+        :return: Dictionary with player names as keys, and lists of file paths as values.
+        """
+        version, folder = self.location()
+        index = self.__index
+        if index is None or index[0] != version:
+            with self.__lock:
+                if self.__index is None or self.__index[0] != version:
+                    self.__index = (version, self.build(folder))
+                index = self.__index
+        return index[1]
+
+    def candidates(self, player):
+        """
+        Function that retrieves all player files indexed under a player name.
+
+        :param player: The name of the player.
+        :return: List of file paths for the player, which is empty if the player is not known.
+        """
+        return list(self.get_index().get(player, []))
+
+    def lookup(self, player, choice=0):
+        """
+        Function that retrieves the path of a player file by exact player name.
+
+        :param player: The name of the player.
+        :param choice: Index of the file to choose if several files are indexed under the same name, see candidates().
+        :return: The path of the player file, or None if the player is not known.
+        """
+        paths = self.get_index().get(player)
+        if not paths or not 0 <= choice < len(paths):
+            return None
+        return paths[choice]
+
+    def names(self):
+        """
+        Function that lists all indexed player names.
+
+        :return: List of all player names in the index.
+        """
+        return list(self.get_index().keys())
+
+    @property
+    def folder(self):
+        """
+        Getter for the folder attribute of the PlayerIndex.
+
+        :return: String containing the path of the indexed player folder.
+        """
+        return self.location()[1]
+
+
+player_index = PlayerIndex()
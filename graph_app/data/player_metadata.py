@@ -0,0 +1,131 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .position_registry import position_registry
+
+# Metadata of a single player file: the most frequent position code, its general position in full and abbreviated, the
+# first and last match dates, the number of matches, and the stat columns in the file.
+PlayerMetadata = namedtuple('PlayerMetadata', ['main_pos', 'player_pos', 'main_pos_short', 'first_date', 'last_date',
+                                               'matches', 'columns'])
+
+# Player file columns that describe a match rather than a stat
+MATCH_COLUMNS = ('Match', 'Competition', 'Date', 'Position')
+
+
+def main_position(player_df):
+    """
+    Function that determines the most frequently occurring position in a player's match data. Ties are broken in
+    favour of the position played most recently, which is the position that occurs first in the file, since player
+    files list their matches newest first.
+
+    :param player_df: Dataframe containing the match data of a single player, ordered by ascending date, see
+    sort_player_file.
+    :return: The most frequently occurring position code, or None if the file contains no positions.
+    """
+    positions = player_df['Position'].iloc[::-1]
+    positions = positions[positions.map(lambda entry: isinstance(entry, str))]
+    if positions.empty:
+        return None
+    codes, uniques = pd.factorize(positions.str.split(', ').explode())
+    return uniques[np.bincount(codes[codes >= 0]).argmax()]
+
+
+def sort_player_file(player_df):
+    """
+    Function that prepares the match data of a player file for use, by parsing its dates into datetime64 values and
+    ordering the matches by ascending date. Player files list their matches newest first, so the rows are reversed
+    before a stable sort. Done once when the file is loaded, so line plots do not have to parse and sort the dates.
+
+    :param player_df: Dataframe containing the match data of a single player, as read from the player file.
+    :return: Dataframe containing the same match data ordered by ascending date, with a 0-based index.
+    """
+    if 'Date' not in player_df.columns:
+        return player_df
+    player_df = player_df.iloc[::-1]
+    player_df = player_df.assign(Date=pd.to_datetime(player_df['Date'], format='%Y-%m-%d', errors='coerce'))
+    return player_df.sort_values('Date', kind='mergesort').reset_index(drop=True)
+
+
+def describe_player_file(player_df):
+    """
+    Function that computes the metadata of a player file from its match data.
+
+    :param player_df: Dataframe containing the match data of a single player.
+    :return: PlayerMetadata of the player file.
+    """
+    main_pos = main_position(player_df)
+    dates = pd.to_datetime(player_df['Date'], errors='coerce').dropna()
+    columns = tuple(column for column in player_df.columns
+                    if column not in MATCH_COLUMNS and not str(column).startswith('Unnamed'))
+    return PlayerMetadata(main_pos, position_registry.position_names.get(main_pos),
+                          position_registry.short_names.get(main_pos),
+                          dates.min() if len(dates) else None, dates.max() if len(dates) else None,
+                          len(player_df.index), columns)
+
+
+class PlayerMetadataCache:
+    """
+    Class that keeps the metadata of the current player files, so that it is computed once per file when the file is
+    loaded instead of on each request. Entries are keyed by the player file's path, modification time and size, so a
+    changed player file results in new metadata.
+    """
+
+    def __init__(self):
+        self.__metadata = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key, loader):
+        """
+        Function that retrieves the metadata of a player file, and computes it if that has not happened yet.
+
+        :param key: Tuple containing the player file's path, modification time and size.
+        :param loader: Function without arguments that returns the player DataFrame, used when no metadata exists yet.
+        :return: PlayerMetadata of the player file.
+        """
+        metadata = self.__metadata.get(key)
+        if metadata is not None:
+            return metadata
+        metadata = describe_player_file(loader())
+        with self.__lock:
+            for old_key in [k for k in self.__metadata if k[0] == key[0]]:
+                del self.__metadata[old_key]
+            self.__metadata[key] = metadata
+        return metadata
+
+    def carry_over(self, old_key, new_key):
+        """
+        Function that reuses the metadata of a player file for an identical copy of it at another path, e.g. an
+        unchanged file in a new data version.
+
+        :param old_key: Tuple containing the player file's path, modification time and size.
+        :param new_key: Tuple containing the copy's path, modification time and size.
+        """
+        metadata = self.__metadata.get(old_key)
+        if metadata is None:
+            return
+        with self.__lock:
+            self.__metadata.pop(old_key, None)
+            self.__metadata[new_key] = metadata
+
+    def invalidate(self, path):
+        """
+        Function that removes the metadata of a player file.
+
+        :param path: Absolute path of the player file.
+        """
+        with self.__lock:
+            for key in [k for k in self.__metadata if k[0] == path]:
+                del self.__metadata[key]
+
+    def clear(self):
+        """
+        Function that removes all metadata.
+        """
+        with self.__lock:
+            self.__metadata = {}
+
+
+player_metadata = PlayerMetadataCache()
@@ -0,0 +1,150 @@
+import os
+import threading
+from types import MappingProxyType
+
+from .columnar_cache import ColumnarCache
+from .excel_engines import excel_engine
+
+# General positions with the position codes that fall under them, as (full name, abbreviation, position codes).
+POSITION_GROUPS = (
+    ('Winger', 'WI', ('RW', 'RWF', 'LWF', 'LW')),
+    ('Goalkeeper', 'GK', ('GK',)),
+    ('Full Back', 'FB', ('LB', 'LB5', 'LWB', 'RB', 'RB5', 'RWB')),
+    ('Center Back', 'CB', ('RCB', 'RCB3', 'CB', 'LCB', 'LCB3')),
+    ('Defensive Midfielder', 'DM', ('DMF', 'LCMF', 'RCMF', 'LDMF', 'RDMF', 'LCMF3', 'RCMF3')),
+    ('Attacking Midfielder', 'AM', ('AMF', 'LAMF', 'RAMF')),
+    ('Striker', 'ST', ('CF', 'LCF', 'RCF')),
+)
+
+# League file stats to graph in the radar chart, per abbreviated general position.
+LEAGUE_CATEGORIES = {
+    'GK': ('Shots blocked per 90', 'Long passes per 90', 'Accurate long passes, %', 'Key passes per 90',
+           'Smart passes per 90', 'Accurate smart passes, %', 'Aerial duels won, %', 'Clean sheets'),
+    'FB': ('Sliding tackles per 90', 'Interceptions per 90', 'Crosses per 90', 'Accurate crosses, %',
+           'Defensive duels per 90', 'Defensive duels won, %', 'Accurate passes, %', 'Key passes per 90'),
+    'CB': ('Shots blocked per 90', 'Interceptions per 90', 'Accurate passes, %', 'Aerial duels won, %',
+           'Defensive duels per 90', 'Defensive duels won, %', 'Crosses per 90', 'Dribbles per 90'),
+    'DM': ('Sliding tackles per 90', 'Interceptions per 90', 'Crosses per 90', 'Accurate crosses, %',
+           'Defensive duels per 90', 'Defensive duels won, %', 'Accurate passes, %', 'Key passes per 90'),
+    'AM': ('Progressive runs per 90', 'Assists per 90', 'Offensive duels won, %', 'Key passes per 90',
+           'Accurate passes, %', 'Goals per 90', 'Shots per 90', 'Shots on target, %'),
+    'WI': ('Crosses per 90', 'Assists per 90', 'Offensive duels won, %', 'Key passes per 90',
+           'Accurate passes, %', 'Goals per 90', 'Shots per 90', 'Shots on target, %'),
+    'ST': ('Successful dribbles, %', 'Assists per 90', 'Key passes per 90', 'xG',
+           'Accurate passes, %', 'Goals per 90', 'Shots per 90', 'Shots on target, %'),
+}
+
+# League file columns describing a player, used by the radar chart next to the league categories.
+LEAGUE_INFO_COLUMNS = ('Player', 'Team', 'Position', 'Matches played', 'Birth country')
+
+
+class PositionRegistry:
+    """
+    Class representing all metadata about football positions used by the preprocessors: the general position belonging
+    to each position code, in full and abbreviated, the league stats to graph per general position, and the player file
+    stats to graph per general position as defined in "Stats per position.xlsx". All tables are read-only, and built
+    once on first use. The stats file is only read again when reload() is called.
+    """
+
+    def __init__(self, stats_file):
+        """
+        Constructor for the class.
+
+        :param stats_file: Path to the Excel file containing the player file stats to graph per position.
+        """
+        self.__stats_file = stats_file
+        self.__position_names = MappingProxyType({code: name for name, _, codes in POSITION_GROUPS for code in codes})
+        self.__short_names = MappingProxyType({code: short for _, short, codes in POSITION_GROUPS for code in codes})
+        self.__league_categories = MappingProxyType(dict(LEAGUE_CATEGORIES))
+        self.__league_columns = tuple(dict.fromkeys(
+            LEAGUE_INFO_COLUMNS + tuple(stat for stats in LEAGUE_CATEGORIES.values() for stat in stats)))
+        self.__line_stats = None
+        self.__lock = threading.Lock()
+
+    def read_line_stats(self):
+        """
+        Function that reads the stats file, and creates a table of stats to graph per position.
+
+        :return: Read-only dictionary with the position columns of the stats file as keys, and tuples of the attributes
+        marked with 1 in that column as values.
+        """
+        stats_df = ColumnarCache().load(self.__stats_file, excel_engine.reader())
+        line_stats = {}
+        for position in stats_df.columns.drop('Attribute'):
+            attributes = stats_df.loc[stats_df[position] == 1.0, 'Attribute']
+            line_stats[position] = tuple(attributes)
+        return MappingProxyType(line_stats)
+
+    def reload(self):
+        """
+        Function that reads the stats file again, e.g. after it has changed. The new table replaces the old one in a
+        single assignment, so concurrent lookups see either the old or the new table.
+        """
+        line_stats = self.read_line_stats()
+        with self.__lock:
+            self.__line_stats = line_stats
+
+    @property
+    def line_stats(self):
+        """
+        Getter for the line_stats attribute of the PositionRegistry. Reads the stats file on first use.
+
+        :return: Read-only dictionary with abbreviated positions as keys, and tuples of player file stats as values.
+        """
+        line_stats = self.__line_stats
+        if line_stats is None:
+            with self.__lock:
+                if self.__line_stats is None:
+                    self.__line_stats = self.read_line_stats()
+                line_stats = self.__line_stats
+        return line_stats
+
+    @property
+    def position_names(self):
+        """
+        Getter for the position_names attribute of the PositionRegistry.
+
+        :return: Read-only dictionary with position codes as keys, and general position names as values.
+        """
+        return self.__position_names
+
+    @property
+    def short_names(self):
+        """
+        Getter for the short_names attribute of the PositionRegistry.
+
+        :return: Read-only dictionary with position codes as keys, and abbreviated general positions as values.
+        """
+        return self.__short_names
+
+    @property
+    def league_categories(self):
+        """
+        Getter for the league_categories attribute of the PositionRegistry.
+
+        :return: Read-only dictionary with abbreviated general positions as keys, and tuples of league stats as values.
+        """
+        return self.__league_categories
+
+    @property
+    def league_columns(self):
+        """
+        Getter for the league_columns attribute of the PositionRegistry.
+
+        :return: Tuple of the league file columns the app uses: the columns describing a player, and all league stats
+        in the league categories.
+        """
+        return self.__league_columns
+
+    @property
+    def stats_file(self):
+        """
+        Getter for the stats_file attribute of the PositionRegistry.
+
+        :return: String containing the path of the stats per position file.
+        """
+        return self.__stats_file
+
+
+position_registry = PositionRegistry(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'files', 'Stats per position.xlsx')))
@@ -1,6 +1,8 @@
+import pandas as pd
+
 from .preprocessor import Preprocessor
 from .randomizer import Randomizer
-from ..excel_reader import ExcelReader
+from ..position_registry import position_registry
 
 
 class LineProcessor(Preprocessor):
@@ -9,6 +11,8 @@ class LineProcessor(Preprocessor):
     stats to be graphed from an excel file, and for generating a map containing the parameters needed by the line graph
     module.
     """
+    # Layouts that the line plots of several stats can be graphed in
+    layouts = ('separate', 'combined')
 
     def __init__(self, *args, **kwargs):
         super(LineProcessor, self).__init__(*args, **kwargs)
@@ -16,16 +20,13 @@ class LineProcessor(Preprocessor):
 
     def get_columns_line_plots(self, player_pos):
         """
-        Function that provides a list of headers to use for graphing the line plots.
+        Function that provides a list of headers to use for graphing the line plots, as defined in
+        "Stats per position.xlsx" and loaded once by the PositionRegistry.
 
         :param player_pos: Abbreviated position of the player whose stats to graph.
         :return: Pandas Series containing the required stats to graph.
         """
-        stats_file = "graph_app/files/Stats per position.xlsx"
-        stats_pd = ExcelReader().read_file(stats_file)
-        stats_necessary = stats_pd[['Attribute', player_pos]]
-        stats_necessary = stats_necessary[stats_necessary[player_pos] == 1.0]
-        return stats_necessary['Attribute']
+        return pd.Series(position_registry.line_stats[player_pos], name='Attribute', dtype=object)
 
     def extract_line_data(self, param_map):
         """
@@ -108,26 +109,21 @@ class LineProcessor(Preprocessor):
     def set_player_data(self, line_map):
         """
         Function that sets the player's match data in the line graph parameter map, along with their position in
-        different formats.
+        different formats. The positions are taken from the player file's metadata, which is computed once per file.
 
-        :param param_map: Parameter map containing data passed to the API endpoint.
         :param line_map: Parameter map to be used by the line graph module.
         :return: Line graph parameter map updated with a player match DataFrame (player_data), the player's position
         as stated in the match data file (main_pos), the corresponding general position name (player_pos), and the
-        abbreviation of the general position (main_pos_short).
+        abbreviation of the general position (main_pos_short). The positions are None if the player file was not found.
         """
         player = line_map.get('player')
         player_df = self._reader.player_data(player)
         line_map.update({'player_data': player_df})
 
-        main_pos = self.main_position_player_file(player_df)
-        line_map.update({'main_pos': main_pos})
-
-        player_pos = self.position_dictionary().get(main_pos)
-        line_map.update({'player_pos': player_pos})
-
-        main_pos_short = self.shortened_dictionary().get(main_pos)
-        line_map.update({'main_pos_short': main_pos_short})
+        metadata = self._reader.player_metadata(player)
+        line_map.update({'main_pos': metadata.main_pos if metadata else None})
+        line_map.update({'player_pos': metadata.player_pos if metadata else None})
+        line_map.update({'main_pos_short': metadata.main_pos_short if metadata else None})
         return line_map
 
     def set_tactalyse_data(self, param_map, line_map):
@@ -149,18 +145,34 @@ class LineProcessor(Preprocessor):
 
     def set_stats(self, param_map, line_map):
         """
-        Function that sets the stat to be graphed in the line graph parameter map.
-        If no stat was included in the input parameter map, it is randomized.
+        Function that sets the stat(s) to be graphed in the line graph parameter map, and the layout to graph them in.
+        If no stat was included in the input parameter map, it is randomized, or with the 'combined' layout, all line
+        plot stats of the player's position are graphed. A random stat is used as well if the player's position has no
+        line plot stats.
 
-        :param param_map: Parameter map containing data passed to the API endpoint.
-        :param line_map: Parameter map to be used by the line graph module.
-        :return: Line graph parameter map updated with a stat to be graphed (stat).
+        :param param_map: Parameter map containing data passed to the API endpoint, with the stat as a string or a list
+        of stats (stat), and optionally the layout (layout), either 'separate' or 'combined'.
+        :param line_map: Parameter map to be used by the line graph module, containing the player's abbreviated
+        position (main_pos_short).
+        :return: Line graph parameter map updated with the stats to be graphed (columns), and the layout if one was
+        passed (layout).
+        :raises: ValueError when the layout is not known.
         """
         stat = param_map.get('stat')
-        if not stat:
-            stat = self.__randomizer.random_player_stat()
-        columns = [stat]
+        layout = param_map.get('layout')
+        if layout is not None and layout not in self.layouts:
+            raise ValueError("The passed layout is not known. Please choose separate or combined.")
+        if isinstance(stat, (list, tuple)) and stat:
+            columns = list(stat)
+        elif stat:
+            columns = [stat]
+        elif layout == 'combined' and position_registry.line_stats.get(line_map.get('main_pos_short')):
+            columns = self.get_columns_line_plots(line_map.get('main_pos_short')).tolist()
+        else:
+            columns = [self.__randomizer.random_player_stat()]
         line_map.update({'columns': columns})
+        if layout:
+            line_map.update({'layout': layout})
         return line_map
 
     @property
@@ -1,8 +1,8 @@
-import os
-import random
-from collections import Counter
-
 from graph_app.data.excel_reader import ExcelReader
+from graph_app.data.league_catalog import league_catalog
+from graph_app.data.player_directory import player_directory
+from graph_app.data.player_metadata import main_position
+from graph_app.data.position_registry import position_registry
 
 
 class Preprocessor:
@@ -12,80 +12,33 @@ class Preprocessor:
 
     def position_dictionary(self):
         """
-        Creates a collection of all position codes as found in the league file, with their associated general position
-        in full words.
+        Retrieves a collection of all position codes as found in the league file, with their associated general
+        position in full words. The collection is shared and read-only, see PositionRegistry.
 
         :return: Dictionary containing all position abbreviations as keys, and the associated general positions as
         values.
         """
-
-        pos_dict = dict.fromkeys(['RW', 'RWF', 'LWF', 'LW'], 'Winger')
-        pos_dict.update(dict.fromkeys(['GK'], 'Goalkeeper'))
-        pos_dict.update(dict.fromkeys(['LB', 'LB5', 'LWB', 'RB', 'RB5', 'RWB'], 'Full Back'))
-        pos_dict.update(dict.fromkeys(['RCB', 'RCB3', 'CB', 'LCB', 'LCB3'], 'Center Back'))
-        pos_dict.update(
-            dict.fromkeys(['DMF', 'LCMF', 'RCMF', 'LDMF', 'RDMF', 'LCMF3', 'RCMF3'], 'Defensive Midfielder'))
-        pos_dict.update(dict.fromkeys(['AMF', 'LAMF', 'RAMF'], 'Attacking Midfielder'))
-        pos_dict.update(dict.fromkeys(['CF', 'LCF', 'RCF'], 'Striker'))
-
-        return pos_dict
+        return position_registry.position_names
 
     def shortened_dictionary(self):
         """
-        Creates a collection of all position codes as found in the league file, with their associated general position
-        as abbreviations.
+        Retrieves a collection of all position codes as found in the league file, with their associated general
+        position as abbreviations. The collection is shared and read-only, see PositionRegistry.
 
         :return: Dictionary containing all position abbreviations as keys, and the associated general position
         abbreviations as values.
         """
-        pos_dict = dict.fromkeys(['RW', 'RWF', 'LWF', 'LW'], 'WI')
-        pos_dict.update(dict.fromkeys(['GK'], 'GK'))
-        pos_dict.update(dict.fromkeys(['LB', 'LB5', 'LWB', 'RB', 'RB5', 'RWB'], 'FB'))
-        pos_dict.update(dict.fromkeys(['RCB', 'RCB3', 'CB', 'LCB', 'LCB3'], 'CB'))
-        pos_dict.update(dict.fromkeys(['DMF', 'LCMF', 'RCMF', 'LDMF', 'RDMF', 'LCMF3', 'RCMF3'], 'DM'))
-        pos_dict.update(dict.fromkeys(['AMF', 'LAMF', 'RAMF'], 'AM'))
-        pos_dict.update(dict.fromkeys(['CF', 'LCF', 'RCF'], 'ST'))
-
-        return pos_dict
+        return position_registry.short_names
 
     def league_category_dictionary(self):
         """
-        Creates a collection of all positions, along with the league stats that should be graphed in the radar chart for
-        each position.
+        Retrieves a collection of all positions, along with the league stats that should be graphed in the radar chart
+        for each position. The collection is shared and read-only, see PositionRegistry.
 
-        :return: Dictionary containing all shortened positions as keys, and a list containing the associated stats as
+        :return: Dictionary containing all shortened positions as keys, and a tuple containing the associated stats as
         values.
         """
-
-        cat_dict = dict.fromkeys(['GK'], ['Shots blocked per 90', 'Long passes per 90',
-                                          'Accurate long passes, %', 'Key passes per 90',
-                                          'Smart passes per 90', 'Accurate smart passes, %',
-                                          'Aerial duels won, %', 'Clean sheets'])
-        cat_dict.update(dict.fromkeys(['FB'], ['Sliding tackles per 90', 'Interceptions per 90',
-                                               'Crosses per 90', 'Accurate crosses, %',
-                                               'Defensive duels per 90', 'Defensive duels won, %',
-                                               'Accurate passes, %', 'Key passes per 90']))
-        cat_dict.update(dict.fromkeys(['CB'], ['Shots blocked per 90', 'Interceptions per 90',
-                                               'Accurate passes, %', 'Aerial duels won, %',
-                                               'Defensive duels per 90', 'Defensive duels won, %',
-                                               'Crosses per 90', 'Dribbles per 90']))
-        cat_dict.update(dict.fromkeys(['DM'], ['Sliding tackles per 90', 'Interceptions per 90',
-                                               'Crosses per 90', 'Accurate crosses, %',
-                                               'Defensive duels per 90', 'Defensive duels won, %',
-                                               'Accurate passes, %', 'Key passes per 90']))
-        cat_dict.update(dict.fromkeys(['AM'], ['Progressive runs per 90', 'Assists per 90',
-                                               'Offensive duels won, %', 'Key passes per 90',
-                                               'Accurate passes, %', 'Goals per 90',
-                                               'Shots per 90', 'Shots on target, %']))
-        cat_dict.update(dict.fromkeys(['WI'], ['Crosses per 90', 'Assists per 90',
-                                               'Offensive duels won, %', 'Key passes per 90',
-                                               'Accurate passes, %', 'Goals per 90',
-                                               'Shots per 90', 'Shots on target, %']))
-        cat_dict.update(dict.fromkeys(['ST'], ['Successful dribbles, %', 'Assists per 90',
-                                               'Key passes per 90', 'xG',
-                                               'Accurate passes, %', 'Goals per 90',
-                                               'Shots per 90', 'Shots on target, %']))
-        return cat_dict
+        return position_registry.league_categories
 
     def main_position_league_file(self, player_row):
         """
@@ -102,29 +55,38 @@ class Preprocessor:
         """
         Function that chooses a random league name from the names of the local league files.
 
-        :return: The name of a random football league, extracted from one of the filenames in graph_app/files/leagues.
+        :return: The name of a random football league, taken from the league catalog of graph_app/files/leagues.
         """
-        files_folder = "graph_app/files/leagues"
-        league_files = os.listdir(files_folder)
-        random_league_file = random.choice(league_files)
+        return league_catalog.random_league()
 
-        file_name = os.path.splitext(random_league_file)[0]
-        return file_name
+    def resolve_league(self, param_map):
+        """
+        Function that sets the league of the passed player if no league was passed, by looking the player up in the
+        player directory. The league remains unset if the player is not in any league file.
+
+        :param param_map: Parameter map containing data passed to the API endpoint.
+        :return: Parameter map with the league of the player (league) set, if it could be found.
+        :raises: AmbiguousPlayerError when no league was passed and the player occurs in several league files.
+        """
+        if param_map.get('league') is None and param_map.get('player'):
+            param_map['league'] = player_directory.resolve_league(param_map['player'])
+        return param_map
 
     def extract_league_data(self, param_map):
         """
         Function that extracts all league data into a DataFrame, and puts it in the passed parameter map for further
-        use.
+        use, along with the league's compact stat store. Both belong to the same version of the league file, see
+        ExcelReader.league_file(). The DataFrame is shared with the in-memory cache, with empty values already filled
+        when the file was loaded, see compact_league_frame.
 
         :param param_map: Parameter map containing data passed to the API endpoint.
-        :return: Parameter map updated with a DataFrame containing all data in the league file (league_df).
+        :return: Parameter map updated with a DataFrame containing all data in the league file (league_df), and a
+        LeagueStore containing its numeric stats (league_store).
         """
         league = param_map.get('league')
         if league is None:
             param_map['league'] = self.random_league()
-        league_df = self._reader.all_league_data(param_map['league'])
-        league_df = league_df.fillna(0.0)
-        param_map['league_df'] = league_df
+        param_map['league_df'], param_map['league_store'] = self._reader.league_file(param_map['league'])
         print("Extracted data into dataframe")
         return param_map
 
@@ -135,12 +97,4 @@ class Preprocessor:
         :param player_df: Dataframe containing the match data of a single player.
         :return: The most frequently occurring position for the player in the match data file.
         """
-        positions = []
-        for entry in player_df['Position']:
-            if not isinstance(entry, str):
-                continue
-            separated_positions = entry.split(', ')
-            positions.extend(separated_positions)
-        position_counter = Counter(positions)
-        most_common = position_counter.most_common(1)[0][0]
-        return most_common
+        return main_position(player_df)
@@ -18,9 +18,13 @@ class RadarProcessor(Preprocessor):
         Function that provides a list of headers to use for graphing the radar chart.
 
         :param position: Full position name of the player whose stats to graph.
-        :return: List of column headers in string form to extract from dataframes when creating PDF graphs.
+        :return: List of column headers in string form to extract from dataframes when creating PDF graphs, or None if
+        the position is not known.
         """
-        return self.league_category_dictionary().get(position)
+        columns = self.league_category_dictionary().get(position)
+        if columns is None:
+            return None
+        return list(columns)
 
     def extract_radar_data(self, param_map):
         """
@@ -29,26 +33,31 @@ class RadarProcessor(Preprocessor):
 
         :param param_map: Parameter map containing information that should be used to create the graph. The player's
         name (player) is required. Optional parameters are the name of the player to compare to (compare), and the
-        player's league (league).
-        If compare is omitted, the graph will be a single-player graph. The league parameter is fully optional.
+        player's league (league), and the scale mode (scale_mode), either 'league' or 'position'.
+        If compare is omitted, the graph will be a single-player graph. The league parameter is fully optional: if it is
+        omitted, the player's league is looked up in the player directory, and a random league is used otherwise.
         :return: Parameter map with the player's name (player), a DataFrame with the player's data (player_data), the
         compare player's name (compare) and data (compare_data), a DataFrame extracted from the player's league file
-        (league_data), the player's position as found in the league file but in full (main_pos_long), and the interpreted
-        long position name abbreviated (main_pos), the row of the league file that belongs to the mentioned player
-        (player_row), the same for the compare player (compare_row), columns to use for graphing (columns), and the max
-        value within the league for each of these columns in a list (scales).
-        """
-        radar_map = {'type': "radar"}
+        (league_data), the player's position as found in the league file but in full (main_pos_long), and the
+        interpreted long position name abbreviated (main_pos), the row of the league file that belongs to the mentioned
+        player (player_row), the same for the compare player (compare_row), columns to use for graphing (columns), the
+        scale mode (scale_mode), and the max value within the league or position for each of these columns in a list
+        (scales).
+        :raises: AmbiguousPlayerError when no league was passed and the player occurs in several league files.
+        """
+        radar_map = {'type': "radar", 'scale_mode': param_map.get('scale_mode') or 'league'}
         if param_map.get('league_df') is None:
+            param_map = self.resolve_league(param_map)
             param_map = self.extract_league_data(param_map)
         league_df = param_map.get('league_df')
+        league_store = param_map.get('league_store')
 
         radar_map = self.set_player(param_map, league_df, radar_map)
-        radar_map = self.set_player_data(league_df, radar_map)
+        radar_map = self.set_player_data(league_df, radar_map, league_store)
         radar_map = self.set_player_positions(radar_map)
-        radar_map = self.set_compare(param_map, league_df, radar_map)
+        radar_map = self.set_compare(param_map, league_df, radar_map, league_store)
         radar_map = self.set_stats(radar_map)
-        radar_map = self.set_max_vals(league_df, radar_map)
+        radar_map = self.set_max_vals(league_df, radar_map, league_store)
 
         return radar_map
 
@@ -67,18 +76,19 @@ class RadarProcessor(Preprocessor):
         radar_map.update({'player': player})
         return radar_map
 
-    def set_player_data(self, league_df, radar_map):
+    def set_player_data(self, league_df, radar_map, league_store=None):
         """
         Function that sets the player's league data in the radar graph parameter map.
 
         :param league_df: DataFrame containing data for all players in the passed player's league.
         :param radar_map: Parameter map to be used by the radar graph module.
+        :param league_store: Optional LeagueStore of the league, used to find the player's row without a scan.
         :return: Radar graph parameter map updated with a player's row from the league DataFrame (player_data), the
         player's position as stated in the league data file (main_pos), the corresponding general position name
         (player_pos), and the abbreviation of the general position (player_pos_short).
         """
         player = radar_map.get('player')
-        player_row = self._reader.league_data(player, league_df)
+        player_row = self._reader.league_data(player, league_df, league_store)
         radar_map.update({'player_row': player_row})
         return radar_map
 
@@ -101,7 +111,7 @@ class RadarProcessor(Preprocessor):
         radar_map.update({'player_pos_short': main_pos_short})
         return radar_map
 
-    def set_compare(self, param_map, league_df, radar_map):
+    def set_compare(self, param_map, league_df, radar_map, league_store=None):
         """
         Function that sets the compare player's name in the radar graph parameter map, along with their league data.
         If no name was included in the input parameter map, it is entirely omitted.
@@ -109,6 +119,7 @@ class RadarProcessor(Preprocessor):
         :param param_map: Parameter map containing data passed to the API endpoint.
         :param league_df: DataFrame containing data for all players in the passed player's league.
         :param radar_map: Parameter map to be used by the radar graph module.
+        :param league_store: Optional LeagueStore of the league, used to find the player's row without a scan.
         :return: Radar graph parameter map updated with a compare player name (compare), and their row from the league
         DataFrame (compare_row).
         """
@@ -118,7 +129,7 @@ class RadarProcessor(Preprocessor):
         compare = param_map.get('compare')
         radar_map.update({'compare': compare})
 
-        compare_df = self._reader.league_data(compare, league_df)
+        compare_df = self._reader.league_data(compare, league_df, league_store)
         radar_map.update({'compare_row': compare_df})
         return radar_map
 
@@ -135,22 +146,53 @@ class RadarProcessor(Preprocessor):
         radar_map.update({'columns': columns})
         return radar_map
 
-    def set_max_vals(self, league_df, radar_map):
+    def set_max_vals(self, league_df, radar_map, league_store=None):
         """
         Function that retrieves the maximum value in the league for each stat to be graphed in the radar chart, and
-        updates the radar graph parameter map to include a list containing them.
+        updates the radar graph parameter map to include a list containing them. With a league store, the values are
+        taken from its precomputed scale table. In the 'position' scale mode, the maximum is taken over the players with
+        the same general position only.
 
         :param league_df: DataFrame containing data for all players in the passed player's league.
         :param radar_map: Parameter map to be used by the radar graph module.
+        :param league_store: Optional LeagueStore of the league, used instead of league_df to find the maximum values.
         :return: Radar graph parameter map updated with a list containing the maximum value for each stat to be graphed
         (scales)
         """
         columns = radar_map.get('columns')
-        max_vals_df = league_df[columns].max(axis=0)
-        max_vals = max_vals_df.tolist()
+        scale_mode = radar_map.get('scale_mode') or 'league'
+        max_vals = None
+        if league_store is not None:
+            max_vals = league_store.scales(radar_map.get('player_pos_short'), scale_mode)
+            if max_vals is None:
+                max_vals = league_store.column_max(columns)
+        if max_vals is None:
+            max_vals = self.max_vals_dataframe(league_df, columns, radar_map.get('player_pos_short'), scale_mode)
         radar_map.update({'scales': max_vals})
         return radar_map
 
+    def max_vals_dataframe(self, league_df, columns, position, scale_mode):
+        """
+        Function that computes the maximum value of each stat to be graphed from the league DataFrame, for leagues
+        without a league store.
+
+        :param league_df: DataFrame containing data for all players in the passed player's league.
+        :param columns: List of stats to be graphed.
+        :param position: Abbreviated general position of the player.
+        :param scale_mode: Scale mode, either 'league' or 'position'.
+        :return: List containing the maximum value for each stat to be graphed.
+        :raises: ValueError when the scale mode is not known.
+        """
+        if scale_mode not in ('league', 'position'):
+            raise ValueError("The passed scale mode is not known. Please choose league or position.")
+        league_max = league_df[columns].max(axis=0)
+        if scale_mode == 'league':
+            return league_max.tolist()
+        main_positions = league_df['Position'].map(lambda entry: entry.split(', ')[0] if isinstance(entry, str) else '')
+        position_df = league_df.loc[main_positions.map(self.shortened_dictionary()) == position, columns]
+        position_max = position_df.max(axis=0) if not position_df.empty else league_max
+        return position_max.where(position_max > 0, league_max).tolist()
+
     @property
     def randomizer(self):
         """
@@ -2,6 +2,7 @@ import os
 import random
 
 from .preprocessor import Preprocessor
+from ..player_index import player_index
 from ..text_cleaner import TextCleaner
 
 
@@ -25,6 +26,9 @@ class Randomizer(Preprocessor):
         (stat) if a line graph is requested, and the player's league (league) set to a default value if not included.
         """
 
+        if param_map.get('graph_type') == "radar":
+            param_map = self.resolve_league(param_map)
+
         if param_map.get('league') is None:
             param_map['league'] = self.random_league()
 
@@ -67,14 +71,16 @@ class Randomizer(Preprocessor):
         the same position.
 
         :param param_map: Parameter map containing data passed to the API endpoint, the league dataframe (league_df),
-        and the main player's name (player).
-        :return: Parameter map updated with a random compare player name (compare).
+        the main player's name (player), and optionally the league store (league_store).
+        :return: Parameter map updated with a random compare player name (compare), which is None if no other player
+        in the league has the same position.
         """
         league_df = param_map['league_df']
+        league_store = param_map.get('league_store')
         player = param_map['player']
-        player_row = self._reader.league_data(param_map['player'], league_df)
+        player_row = self._reader.league_data(param_map['player'], league_df, league_store)
         player_pos = self.main_position_league_file(player_row)
-        param_map['compare'] = self.select_random_compare(league_df, player_pos, player)
+        param_map['compare'] = self.select_random_compare(league_df, player_pos, player, league_store)
         return param_map
 
     def random_player_line(self):
@@ -83,8 +89,7 @@ class Randomizer(Preprocessor):
 
         :return: A player name extracted from the titles of the local player files.
         """
-        files_folder = "graph_app/files/players"
-        player_files = os.listdir(files_folder)
+        player_files = os.listdir(player_index.folder)
 
         random_player_file = random.choice(player_files)
 
@@ -103,7 +108,7 @@ class Randomizer(Preprocessor):
         random_value = league_df['Player'].sample(n=1).values[0]
         return random_value
 
-    def select_random_compare(self, league_df, player_pos, player=None):
+    def select_random_compare(self, league_df, player_pos, player=None, league_store=None):
         """
         Function that selects a random player name to compare to from the league dataframe that matches the
         passed player position. If passed, the name of the main player is avoided.
@@ -111,13 +116,18 @@ class Randomizer(Preprocessor):
         :param league_df: DataFrame containing league data.
         :param player_pos: The position the returned player should have.
         :param player: The name of the main player. Will be avoided in selecting the compare name.
-        :return: The name of the player to compare to.
-        """
-        position_df = league_df[league_df['Position'].str.contains(player_pos)]
-        random_player = player
-        while random_player == player:
-            random_player = position_df['Player'].sample(n=1).values[0]
-        return random_player
+        :param league_store: Optional LeagueStore of the league, used to draw from its position groups without a scan.
+        :return: The name of the player to compare to, or None if no other player has the passed position.
+        """
+        if league_store is not None:
+            return league_store.random_player(player_pos, player)
+
+        position_codes = league_df['Position'].map(lambda entry: entry.split(', ') if isinstance(entry, str) else [])
+        candidates = league_df.loc[position_codes.map(lambda codes: player_pos in codes) &
+                                   (league_df['Player'] != player), 'Player']
+        if candidates.empty:
+            return None
+        return candidates.sample(n=1).values[0]
 
     def random_player_stat(self):
         """
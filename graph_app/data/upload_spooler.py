@@ -0,0 +1,189 @@
+import binascii
+import os
+import re
+import tempfile
+
+# Maximum size of a single uploaded file and of all files in one upload in megabytes, configurable through the
+# environment.
+UPLOAD_FILE_MB = int(os.environ.get('GRAPH_APP_UPLOAD_FILE_MB', '128'))
+UPLOAD_TOTAL_MB = int(os.environ.get('GRAPH_APP_UPLOAD_TOTAL_MB', '1024'))
+# Maximum size of a request body in bytes, leaving room for the base64 encoding of JSON uploads
+UPLOAD_REQUEST_BYTES = UPLOAD_TOTAL_MB * 1024 * 1024 * 4 // 3 + 1024 * 1024
+
+# Size in bytes up to which a spooled upload is kept in memory before it is moved to a temporary file on disk
+SPOOL_BYTES = 1024 * 1024
+# Number of base64 characters decoded at a time, a multiple of 4 so chunks decode independently
+CHUNK_CHARS = 4 * 256 * 1024
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class UploadError(ValueError):
+    """
+    Error raised when an uploaded file cannot be accepted, e.g. because it has no file name or is not valid base64.
+    """
+    status = 400
+
+
+class UploadTooLargeError(UploadError):
+    """
+    Error raised when an uploaded file, or an upload as a whole, exceeds its configured size limit.
+    """
+    status = 413
+
+
+class SpooledUpload:
+    """
+    Class representing a single uploaded file that has been written to a spooled temporary file, so that it is only
+    kept in memory while it is small. It has a filename and a stream like an uploaded werkzeug FileStorage, so it can be
+    passed to the FileUpdater in the same way.
+    """
+
+    def __init__(self, filename, stream, size):
+        """
+        Constructor for the class.
+
+        :param filename: Name of the uploaded file.
+        :param stream: Binary file object containing the file's contents, positioned at the start.
+        :param size: Size of the file's contents in bytes.
+        """
+        self.filename = filename
+        self.stream = stream
+        self.size = size
+
+    def close(self):
+        """
+        Function that removes the temporary file.
+        """
+        self.stream.close()
+
+
+class UploadSpooler:
+    """
+    Class that collects the files of a single upload, checking them against the per-file and total size limits. Base64
+    encoded files from a JSON payload are decoded in chunks into spooled temporary files, so an upload never has to be
+    held in memory in decoded form. Multipart files are already spooled to disk by werkzeug, and are only measured.
+    """
+
+    def __init__(self, max_file_size=None, max_total_size=None):
+        """
+        Constructor for the class.
+
+        :param max_file_size: Maximum size of a single file in bytes. Defaults to GRAPH_APP_UPLOAD_FILE_MB.
+        :param max_total_size: Maximum size of all files together in bytes. Defaults to GRAPH_APP_UPLOAD_TOTAL_MB.
+        """
+        self.__max_file_size = max_file_size if max_file_size is not None else UPLOAD_FILE_MB * 1024 * 1024
+        self.__max_total_size = max_total_size if max_total_size is not None else UPLOAD_TOTAL_MB * 1024 * 1024
+        self.__total_size = 0
+        self.__uploads = []
+
+    def add_base64(self, filename, data):
+        """
+        Function that decodes a base64 encoded file into a spooled temporary file, a chunk at a time. Whitespace in the
+        encoded data is ignored.
+
+        :param filename: Name of the uploaded file.
+        :param data: String containing the base64 encoded contents of the file.
+        :return: SpooledUpload containing the decoded file.
+        :raises: UploadError when the file has no name or the data is not valid base64, UploadTooLargeError when a size
+        limit is exceeded.
+        """
+        filename = self.check_filename(filename)
+        if not isinstance(data, str):
+            raise UploadError("Error: the contents of " + filename + " must be a base64 string.")
+        stream = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        size = 0
+        remainder = ''
+        try:
+            for start in range(0, len(data), CHUNK_CHARS):
+                chunk = remainder + _WHITESPACE.sub('', data[start:start + CHUNK_CHARS])
+                cut = len(chunk) - len(chunk) % 4
+                chunk, remainder = chunk[:cut], chunk[cut:]
+                decoded = binascii.a2b_base64(chunk)
+                size += len(decoded)
+                self.check_size(filename, size)
+                stream.write(decoded)
+            if remainder:
+                raise UploadError("Error: the contents of " + filename + " are not valid base64.")
+        except binascii.Error:
+            stream.close()
+            raise UploadError("Error: the contents of " + filename + " are not valid base64.")
+        except UploadError:
+            stream.close()
+            raise
+        return self.add(filename, stream, size)
+
+    def add_file(self, file):
+        """
+        Function that adds a file from a multipart upload, measuring its size without reading it into memory.
+
+        :param file: Uploaded werkzeug FileStorage.
+        :return: SpooledUpload referring to the uploaded file's stream.
+        :raises: UploadError when the file has no name, UploadTooLargeError when a size limit is exceeded.
+        """
+        filename = self.check_filename(file.filename)
+        stream = file.stream
+        stream.seek(0, os.SEEK_END)
+        size = stream.tell()
+        self.check_size(filename, size)
+        return self.add(filename, stream, size)
+
+    def add(self, filename, stream, size):
+        """
+        Function that registers a received file as part of the upload.
+
+        :param filename: Name of the uploaded file.
+        :param stream: Binary file object containing the file's contents.
+        :param size: Size of the file's contents in bytes.
+        :return: SpooledUpload of the file, with its stream positioned at the start.
+        """
+        stream.seek(0)
+        upload = SpooledUpload(filename, stream, size)
+        self.__total_size += size
+        self.__uploads.append(upload)
+        return upload
+
+    def check_filename(self, filename):
+        """
+        Function that checks the name of an uploaded file, and strips any folders from it.
+
+        :param filename: Name of the uploaded file, as sent by the client.
+        :return: The file name without folders.
+        :raises: UploadError when the file has no usable name.
+        """
+        filename = os.path.basename(filename) if isinstance(filename, str) else ''
+        if not filename or filename in ('.', '..'):
+            raise UploadError("Error: every uploaded file must have a file name.")
+        return filename
+
+    def check_size(self, filename, size):
+        """
+        Function that checks a file against the per-file limit, and the upload against the total limit.
+
+        :param filename: Name of the uploaded file.
+        :param size: Number of bytes of the file received so far.
+        :raises: UploadTooLargeError when a limit is exceeded.
+        """
+        if size > self.__max_file_size:
+            raise UploadTooLargeError("Error: " + filename + " exceeds the maximum file size of "
+                                      + str(self.__max_file_size) + " bytes.")
+        if self.__total_size + size > self.__max_total_size:
+            raise UploadTooLargeError("Error: the upload exceeds the maximum total size of "
+                                      + str(self.__max_total_size) + " bytes.")
+
+    def close(self):
+        """
+        Function that removes the temporary files of all spooled uploads.
+        """
+        for upload in self.__uploads:
+            upload.close()
+        self.__uploads = []
+
+    @property
+    def total_size(self):
+        """
+        Getter for the total_size attribute of the UploadSpooler.
+
+        :return: Integer representing the size of all added files in bytes.
+        """
+        return self.__total_size
@@ -0,0 +1,60 @@
+import io
+import os
+from functools import lru_cache
+
+import matplotlib.font_manager as font_manager
+import matplotlib.image as mpimg
+import seaborn  # noqa: F401, imported so that its import cost is paid on preload
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Path of the Tactalyse logo that is placed in every graph
+LOGO_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'files', 'images',
+                                         'Logo_Tactalyse_Triangle.png'))
+
+
+@lru_cache(maxsize=None)
+def logo():
+    """
+    Function that reads the Tactalyse logo once, and returns the same image array for every graph afterwards.
+
+    :return: Array containing the RGBA image data of the logo.
+    """
+    image = mpimg.imread(LOGO_PATH)
+    image.setflags(write=False)
+    return image
+
+
+def create_figure(figsize):
+    """
+    Function that creates a matplotlib figure on its own Agg canvas, without registering it with pyplot. Since no
+    pyplot state is involved, figures can be created and drawn in several threads at the same time, and do not have
+    to be closed.
+
+    :param figsize: Tuple containing the width and height of the figure in inches.
+    :return: The new Figure.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def to_png(fig):
+    """
+    Function that renders a figure to a PNG image.
+
+    :param fig: Figure to render.
+    :return: The rendered image in byte string form.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def preload():
+    """
+    Function that loads all resources needed for drawing graphs ahead of the first request: the graph libraries, the
+    font cache and the logo.
+    """
+    font_manager.findfont(font_manager.FontProperties())
+    logo()
@@ -1,14 +1,20 @@
-import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.lines import Line2D
 from matplotlib.offsetbox import AnnotationBbox, OffsetImage
 
+from . import graph_resources
 from .abstract_models import Graph
 from .line_plot_data_helper import LinePlotDataHelper
 
+# Maximum number of threads that draw the plots of a multi-stat request at the same time, configurable through the
+# environment
+DRAW_THREADS = int(os.environ.get('GRAPH_APP_DRAW_THREADS', str(os.cpu_count() or 1)))
+
 
 class LinePlot(Graph):
     """
@@ -62,6 +68,12 @@ class LinePlot(Graph):
     __fig_w = 8
     # Height of the output image
     __fig_h = 7.75
+    # Height in inches of each stat's panel in a combined plot of several stats
+    __panel_h = 1.8
+    # Height in inches of the title, subtitle and legend above the panels of a combined plot
+    __header_h = 2.0
+    # Height in inches of the date axis below the panels of a combined plot
+    __footer_h = 0.7
 
     def __init__(self, param_map):
         """
@@ -119,7 +131,7 @@ class LinePlot(Graph):
         :param seasons: List containing string labels for each season to plot.
         :return: Ax object with the season lines drawn.
         """
-        plt.xlabel("Season")
+        ax.set_xlabel("Season")
         ax.set(xticks=self.helper.set_season_tick_values(season_x_values), xticklabels=seasons)
         no_label = False
         for i, season in enumerate(season_x_values):
@@ -143,22 +155,34 @@ class LinePlot(Graph):
         :param end_date: String containing the end date in YYYY-mm-dd format.
         :return: Ax object with the Tactalyse contract lines drawn.
         """
-        dates = pd.to_datetime(data["Date"], format='%Y-%m-%d')
-        dates = dates.sort_values().reset_index(drop=True)
+        start_x, end_x = self.tactalyse_x_values(data, start_date, end_date)
+        if start_x is not None:
+            ax.axvline(x=start_x, linestyle="-", label="Tactalyse contract", color=self.__tactalyse)
+            if end_x is not None:
+                ax.axvline(x=end_x, linestyle="-", color=self.__tactalyse)
+        return ax
+
+    def tactalyse_x_values(self, data, start_date, end_date):
+        """
+        Function that finds the x-values of the lines representing the start- and end-date of Tactalyse's services.
+
+        :param data: DataFrame containing player match data extracted from a player file.
+        :param start_date: String containing the start date in YYYY-mm-dd format.
+        :param end_date: String containing the end date in YYYY-mm-dd format.
+        :return: The x-values of the start and end line, each None if the line should not be drawn.
+        """
+        dates = self.__helper.sorted_dates(data)
         start = pd.Timestamp(start_date)
         end = pd.Timestamp(end_date)
 
-        scaled_x_values = self.__helper.scaled_date_values(dates)
+        scaled_x_values, _, _ = self.__helper.get_xlabels(data)
         start_idx = dates.searchsorted(start, side='left') - 1
-        start_x = scaled_x_values[start_idx]
         end_idx = dates.searchsorted(end, side='left') - 1
-        end_x = scaled_x_values[end_idx]
 
-        if 0 <= start_idx <= len(dates):
-            ax.axvline(x=start_x, linestyle="-", label="Tactalyse contract", color=self.__tactalyse)
-            if start_idx < end_idx <= len(dates):
-                ax.axvline(x=end_x, linestyle="-", color=self.__tactalyse)
-        return ax
+        if not 0 <= start_idx <= len(dates):
+            return None, None
+        end_x = scaled_x_values[end_idx] if start_idx < end_idx <= len(dates) else None
+        return scaled_x_values[start_idx], end_x
 
     def set_layout(self, ax, p1, p2, stat):
         """
@@ -179,12 +203,10 @@ class LinePlot(Graph):
         if p2 is not None:
             subtitle += "Compared with " + p2 + "\n"
         subtitle += "Stat: " + stat
-        plt.suptitle(subtitle, fontsize=12, y=self.__subtitle_offset, color=self.__subtitle)
+        ax.figure.suptitle(subtitle, fontsize=12, y=self.__subtitle_offset, color=self.__subtitle)
         ax.set_title(title, fontsize=15, fontweight=0, color=self.__tactalyse, weight="bold", y=self.__title_offset)
 
-        path = "graph_app/files/images/Logo_Tactalyse_Triangle.png"
-        arr_img = plt.imread(path)
-        im = OffsetImage(arr_img, zoom=self.__logo_size)
+        im = OffsetImage(graph_resources.logo(), zoom=self.__logo_size)
         ab = AnnotationBbox(im, (self.__logo_x_offset, self.__logo_y_offset), xycoords='axes fraction', frameon=False)
         ax.add_artist(ab)
 
@@ -211,6 +233,7 @@ class LinePlot(Graph):
         plot, and returns the generated plot.
 
         :param param_map: Map containing all relevant data: DataFrame with all data from a player file (player_data),
+        preferably sorted by date already, see LinePlotDataHelper.sort_by_date(),
         List containing the columns to graph in string form (columns), the start date of Tactalyse's services for the
         player in string form and YYYY-mm-dd format (start_date) as well as the end date (end_date), the name of the
         main player (player), the name of the comparison player (compare), and a DataFrame with all data from the
@@ -220,12 +243,12 @@ class LinePlot(Graph):
         # Extract from parameter map
         player_data, column_name, start_date, end_date, player, compare, compare_data = \
             self.__helper.extract_data_from_param_map(param_map)
+        player_data = self.__helper.sort_by_date(player_data)
 
         # Create plot
-        fig, ax = plt.subplots(figsize=(self.__fig_w, self.__fig_h), gridspec_kw={'top': self.__top_offset,
-                                                                                  'bottom': self.__bottom_offset,
-                                                                                  'left': self.__left_offset,
-                                                                                  'right': self.__right_offset})
+        fig = graph_resources.create_figure((self.__fig_w, self.__fig_h))
+        ax = fig.subplots(gridspec_kw={'top': self.__top_offset, 'bottom': self.__bottom_offset,
+                                       'left': self.__left_offset, 'right': self.__right_offset})
         ax.clear()
 
         # Get x-axis values
@@ -234,7 +257,7 @@ class LinePlot(Graph):
         # Extract y-axis values from dataframe
         subcolumns = column_name.split("/")
         column_index = player_data.columns.get_loc(column_name)
-        player_stat_data = player_data[player_data.columns[column_index]][::-1].reset_index(drop=True)
+        player_stat_data = player_data[player_data.columns[column_index]]
 
         # Extract y-axis sub-values from dataframe, if available
         player_sub_data, second_column = self.__helper.create_sub_plot_data(subcolumns, player_data, column_index)
@@ -245,8 +268,9 @@ class LinePlot(Graph):
 
         # Repeat for compare player if they exist
         if compare and isinstance(compare_data, pd.DataFrame):
+            compare_data = self.__helper.sort_by_date(compare_data)
             compare_x_values, _, _ = self.__helper.get_xlabels(compare_data)
-            compare_stat_data = compare_data[column_name][::-1].reset_index(drop=True)
+            compare_stat_data = compare_data[column_name]
 
             compare_sub_data, second_column = self.__helper.create_sub_plot_data(subcolumns, compare_data, column_index)
 
@@ -267,31 +291,119 @@ class LinePlot(Graph):
         ax = self.set_layout(ax, player, compare, column_name)
 
         # Set legend of the graph
-        plt.legend(bbox_to_anchor=(0.5, 1), loc='upper center', fontsize="small")
+        ax.legend(bbox_to_anchor=(0.5, 1), loc='upper center', fontsize="small")
 
         # Convert to byte string
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png')
-        buffer.seek(0)
-        plt.close()
-        return buffer.getvalue()
+        return graph_resources.to_png(fig)
 
-    def draw_all(self, param_map):
+    def draw_combined(self, param_map):
         """
-        Function for drawing plots for all passed stats.
+        Function for drawing several stats in one figure, as a column of panels that share the date axis. The x-values,
+        season lines and Tactalyse contract lines are computed once for all panels, and the title, subtitle, legend
+        and logo are only placed once, at the top of the figure.
 
-        :param param_map: Map containing all data required for creating the line plots.
-        :return: A list of generated plots for each stat if multiple stats were passed, otherwise one graph in byte
-        string form.
+        :param param_map: Map containing all relevant data, see draw(), with a list of stats to graph (columns).
+        :return: The generated figure in byte string form.
+        """
+        player_data, columns, start_date, end_date, player, compare, compare_data = \
+            self.__helper.extract_data_from_param_map(param_map)
+        player_data = self.__helper.sort_by_date(player_data)
+        player_x_values, year_x_values, years = self.__helper.get_xlabels(player_data)
+        contract_x_values = self.tactalyse_x_values(player_data, start_date, end_date) if start_date else (None, None)
+        has_compare = bool(compare) and isinstance(compare_data, pd.DataFrame)
+        if has_compare:
+            compare_data = self.__helper.sort_by_date(compare_data)
+            compare_x_values, _, _ = self.__helper.get_xlabels(compare_data)
+
+        height = self.__header_h + self.__panel_h * len(columns) + self.__footer_h
+        fig = graph_resources.create_figure((self.__fig_w, height))
+        axes = fig.subplots(len(columns), 1, sharex=True, squeeze=False,
+                            gridspec_kw={'top': 1 - self.__header_h / height, 'bottom': self.__footer_h / height,
+                                         'left': self.__left_offset, 'right': self.__right_offset, 'hspace': 0.35})
+        has_sub_stat = False
+        for ax, column_name in zip(axes[:, 0], columns):
+            subcolumns = column_name.split("/")
+            column_index = player_data.columns.get_loc(column_name)
+            player_stat_data = player_data[column_name]
+            player_sub_data, second_column = self.__helper.create_sub_plot_data(subcolumns, player_data, column_index)
+            has_sub_stat |= player_sub_data is not None
+            self.plot_player(ax, player_x_values, player_stat_data, player, subcolumns[0],
+                             self.__player_color, player_sub_data, second_column, self.__player_sub_color)
+            if has_compare:
+                compare_sub_data, second_column = self.__helper.create_sub_plot_data(subcolumns, compare_data,
+                                                                                     column_index)
+                self.plot_player(ax, compare_x_values, compare_data[column_name], compare, subcolumns[0],
+                                 self.__compare_color, compare_sub_data, second_column, self.__compare_sub_color)
+            self.draw_mean_line(ax, player_stat_data, player)
+            self.draw_seasons(ax, year_x_values, years)
+            for x in contract_x_values:
+                if x is not None:
+                    ax.axvline(x=x, linestyle="-", color=self.__tactalyse)
+            ax.set_title(column_name, fontsize=10, loc='left', color=self.__black)
+            ax.set_ylabel("")
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            ax.label_outer()
+
+        self.set_combined_layout(fig, height, player, compare if has_compare else None, has_sub_stat,
+                                 contract_x_values[0] is not None)
+        return graph_resources.to_png(fig)
+
+    def set_combined_layout(self, fig, height, p1, p2, has_sub_stat, has_contract):
+        """
+        Function that sets the title, subtitle, legend and logo of a figure with several stats, see draw_combined().
+        They are placed at a fixed distance from the top of the figure, whatever the number of panels.
+
+        :param fig: The figure containing the panels.
+        :param height: Height of the figure in inches.
+        :param p1: Name of the main player of the graph.
+        :param p2: Name of the comparison player of the graph, or None.
+        :param has_sub_stat: Whether any of the panels contains a sub-stat line.
+        :param has_contract: Whether the Tactalyse contract lines were drawn.
+        """
+        determinant = ', a '
+        if self.__position[0].lower() in ['a', 'e', 'i', 'o', 'u']:
+            determinant = ', an '
+        fig.text(0.5, 1 - 0.35 / height, 'Line plots for ' + p1 + determinant + self.__position, ha='center',
+                 va='center', fontsize=15, color=self.__tactalyse, weight="bold")
+        if p2 is not None:
+            fig.text(0.5, 1 - 0.7 / height, "Compared with " + p2, ha='center', va='center', fontsize=12,
+                     color=self.__subtitle)
+
+        handles = [Line2D([], [], color=self.__player_color, label=p1)]
+        if has_sub_stat:
+            handles.append(Line2D([], [], color=self.__player_sub_color, label=p1 + " (sub-stat)"))
+        if p2 is not None:
+            handles.append(Line2D([], [], color=self.__compare_color, label=p2))
+            if has_sub_stat:
+                handles.append(Line2D([], [], color=self.__compare_sub_color, label=p2 + " (sub-stat)"))
+        handles.append(Line2D([], [], color=self.__black, linestyle="dashed", label="Mean for " + p1))
+        if has_contract:
+            handles.append(Line2D([], [], color=self.__tactalyse, label="Tactalyse contract"))
+        fig.legend(handles=handles, loc='center', bbox_to_anchor=(0.5, 1 - 1.3 / height), ncol=3, fontsize="small")
+
+        im = OffsetImage(graph_resources.logo(), zoom=self.__logo_size)
+        ab = AnnotationBbox(im, (self.__right_offset, 1 - 0.5 / height), xycoords='figure fraction', frameon=False)
+        fig.add_artist(ab)
+
+    def draw_all(self, param_map):
+        """
+        Function for drawing plots for all passed stats. The plots are drawn at the same time in several threads, each
+        from its own copy of the parameter map, so the passed map is left unchanged. With the 'combined' layout, all
+        stats are drawn in a single figure instead, see draw_combined().
+
+        :param param_map: Map containing all data required for creating the line plots, and optionally the layout
+        (layout), either 'separate' (the default) or 'combined'.
+        :return: A list of generated plots for each stat in the order of the passed stats if multiple stats were passed
+        with the separate layout, otherwise one graph in byte string form.
         """
-        columns = param_map.get('columns')
-        plots = []
-        for column in columns:
-            param_map['columns'] = column
-            plots.append(self.draw(param_map))
-        if len(plots) == 1:
-            return plots[0]
-        return plots
+        if param_map.get('layout') == 'combined' and len(param_map.get('columns')) > 1:
+            return self.draw_combined(param_map)
+        maps = [dict(param_map, columns=column) for column in param_map.get('columns')]
+        if len(maps) == 1:
+            return self.draw(maps[0])
+        with ThreadPoolExecutor(max_workers=max(min(len(maps), DRAW_THREADS), 1)) as executor:
+            return list(executor.map(self.draw, maps))
 
     @property
     def helper(self):
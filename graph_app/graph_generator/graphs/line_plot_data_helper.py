@@ -1,6 +1,14 @@
+import threading
+import weakref
+
 import numpy as np
 import pandas as pd
 
+# X-axis values per player DataFrame, keyed by the DataFrame's id. Entries are removed when the DataFrame is garbage
+# collected, so player files shared through the frame cache keep their x-axis values across requests.
+_xlabel_cache = {}
+_xlabel_lock = threading.Lock()
+
 
 class LinePlotDataHelper:
     """
@@ -22,23 +30,45 @@ class LinePlotDataHelper:
         scaled_date_values = np.cumsum(time_diff)
         return scaled_date_values
 
+    def season_ticks(self, dates, scaled_x_values):
+        """
+        Function that computes everything needed to draw the football seasons on the x-axis in a single pass over the
+        dates: the index of the first data point of each season, the x-values of those data points, the tick positions
+        between them, and the season labels. A season starts with the first data point after July 1st of a year, and
+        is labeled by the two-digit year it starts in and the year after, e.g. "20/21".
+
+        :param dates: Series containing the datetime64 dates of the data points, in ascending order and with a 0-based
+        index.
+        :param scaled_x_values: Series containing line plot x-values representing all dates in the dates Series.
+        :return: List containing the indices of the first data point of each season, list containing the x-values of
+        those data points followed by the last x-value, list containing the x-values to put the season ticks at, and a
+        list containing the season labels, in that order.
+        """
+        values = dates.to_numpy(dtype='datetime64[D]')
+        years = values.astype('datetime64[Y]').astype(np.int64) + 1970
+        months = values.astype('datetime64[M]').astype(np.int64) % 12 + 1
+        days = (values - values.astype('datetime64[M]')).astype(np.int64) + 1
+
+        candidates = np.flatnonzero((months >= 7) & (days > 1))
+        season_years, first = np.unique(years[candidates], return_index=True)
+        season_indices = candidates[first]
+
+        x_values = scaled_x_values.to_numpy()
+        season_x_values = np.append(x_values[season_indices], x_values[-1]) if len(x_values) else x_values
+        tick_values = (season_x_values[:-1] + season_x_values[1:]) / 2
+        labels = [f"{year % 100:02d}/{year % 100 + 1}" for year in season_years.tolist()]
+        return season_indices.tolist(), season_x_values.tolist(), tick_values.tolist(), labels
+
     def get_season_change_indices(self, dates):
         """
         Function that finds the indices of entries in a Series containing dates where the date is the first after the
         start of a football season (July 1st).
 
-        :param dates: Pandas Series containing each date for which there is a data point in the player file.
+        :param dates: Pandas Series containing each date for which there is a data point in the player file, in
+        ascending order.
         :return: List containing indices of the first data point in the Series after July 1st for each year.
         """
-        season_indices = []
-        year = dates.dt.year
-        month = dates.dt.month
-        for y in year.unique():
-            year_dates = dates[year == y]
-            first_of_july = year_dates[(month >= 7) & (year_dates.dt.day > 1)].index.min()
-            if pd.notnull(first_of_july):
-                season_indices.append(first_of_july)
-        return season_indices
+        return self.season_ticks(dates, pd.Series(np.zeros(len(dates))))[0]
 
     def get_season_change_x_vals(self, season_indices, scaled_x_values):
         """
@@ -52,11 +82,7 @@ class LinePlotDataHelper:
         :param scaled_x_values: Series containing line plot x-values representing all dates in a data Series.
         :return: The x-values corresponding with the start of the football season for each year.
         """
-        season_x_values = []
-        for i in season_indices:
-            season_x_values.append(scaled_x_values[i])
-        season_x_values.append(scaled_x_values.iloc[-1])
-        return season_x_values
+        return scaled_x_values.iloc[list(season_indices) + [-1]].tolist()
 
     def season_tick_labels(self, dates, year_indices):
         """
@@ -67,30 +93,86 @@ class LinePlotDataHelper:
         season.
         :return: List containing the season labels in string form.
         """
-        date_strings = dates.iloc[year_indices].dt.strftime('%Y-%m-%d')
-        years = date_strings.str.slice(start=2, stop=4)
-        seasons = [f"{n}/{int(n) + 1}" for n in years]
-        return seasons
+        years = dates.iloc[year_indices].dt.year % 100
+        return [f"{year:02d}/{year + 1}" for year in years.tolist()]
+
+    def sort_by_date(self, data):
+        """
+        Function that orders player match data by ascending date, with the dates as datetime64 values. Player files list
+        their matches newest first, so the rows are reversed before a stable sort. Data that was already sorted when the
+        player file was loaded is returned as is.
+
+        :param data: DataFrame containing match data from a player file.
+        :return: DataFrame with the same data, ordered by ascending date, with a datetime64 Date column and a
+        0-based index.
+        """
+        if self.is_sorted_by_date(data):
+            return data
+        data = data.iloc[::-1]
+        data = data.assign(Date=pd.to_datetime(data["Date"], format='%Y-%m-%d'))
+        return data.sort_values("Date", kind='mergesort').reset_index(drop=True)
+
+    def is_sorted_by_date(self, data):
+        """
+        Function that checks whether player match data is ordered by ascending datetime64 date with a 0-based index.
+
+        :param data: DataFrame containing match data from a player file.
+        :return: True if the data is sorted by date, False if not.
+        """
+        dates = data["Date"]
+        return (pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing
+                and isinstance(data.index, pd.RangeIndex) and data.index.start == 0 and data.index.step == 1)
+
+    def sorted_dates(self, data):
+        """
+        Function that retrieves the dates of player match data in ascending order.
+
+        :param data: DataFrame containing match data from a player file.
+        :return: Series containing the datetime64 dates of the data in ascending order, with a 0-based index.
+        """
+        if self.is_sorted_by_date(data):
+            return data["Date"]
+        dates = pd.to_datetime(data["Date"], format='%Y-%m-%d')
+        return dates.sort_values().reset_index(drop=True)
 
     def get_xlabels(self, data):
         """
         Function that retrieves the x-value representations of each match data point in a player file, as well as the
-        x-values of season changes and the seasons in string form, to be used for x-axis ticks.
+        x-values of season changes and the seasons in string form, to be used for x-axis ticks. The result is kept for
+        as long as the DataFrame exists, so drawing several stats of the same player file computes it once. The returned
+        values are shared, and should not be modified in place.
 
         :param data: DataFrame containing all relevant data to be plotted from a player file.
         :return: Series containing integer x-value representations of the dates in the passed DataFrame, list containing
         integer x-value representations of the first data point after a change in football season for each year, and
         a list containing string representations of each season represented in the passed Dataframe, in that order.
         """
-        dates = pd.to_datetime(data["Date"], format='%Y-%m-%d')
-        dates = dates.sort_values().reset_index(drop=True)
+        cached = _xlabel_cache.get(id(data))
+        if cached is not None and cached[0]() is data:
+            return cached[1]
+
+        dates = self.sorted_dates(data)
 
         scaled_x_values = self.scaled_date_values(dates)
-        season_indices = self.get_season_change_indices(dates)
-        season_x_values = self.get_season_change_x_vals(season_indices, scaled_x_values)
-        seasons = self.season_tick_labels(dates, season_indices)
+        _, season_x_values, _, seasons = self.season_ticks(dates, scaled_x_values)
+
+        xlabels = scaled_x_values, season_x_values, seasons
+        with _xlabel_lock:
+            _xlabel_cache[id(data)] = (weakref.ref(data), xlabels)
+        weakref.finalize(data, self.forget_xlabels, id(data))
+        return xlabels
 
-        return scaled_x_values, season_x_values, seasons
+    @staticmethod
+    def forget_xlabels(data_id):
+        """
+        Function that removes the cached x-axis values of a DataFrame that no longer exists.
+
+        :param data_id: The id of the garbage collected DataFrame.
+        """
+        with _xlabel_lock:
+            cached = _xlabel_cache.get(data_id)
+            if cached is not None and cached[0]() is None:
+                del _xlabel_cache[data_id]
 
     def average_entries(self, x_vals, y_vals, window):
         """
@@ -115,7 +197,7 @@ class LinePlotDataHelper:
 
         :param subcolumns: List containing the name of the column for the stat, split into the main stat at index 0, and
         the sub-stat at index 1.
-        :param player_data: DataFrame containing one player's match data.
+        :param player_data: DataFrame containing one player's match data, sorted by date, see sort_by_date().
         :param column_index: Index of the main stat's column in the DataFrame.
         :return: Series containing data for the sub-stat from the player DataFrame, and the name of the sub-stat, in
         that order.
@@ -123,7 +205,7 @@ class LinePlotDataHelper:
         player_sub_data, second_column = None, None
         if len(subcolumns) > 1:
             second_column = subcolumns[1].strip()
-            player_sub_data = player_data[player_data.columns[column_index + 1]][::-1].reset_index(drop=True)
+            player_sub_data = player_data[player_data.columns[column_index + 1]].reset_index(drop=True)
         return player_sub_data, second_column
 
     def extract_data_from_param_map(self, param_map):
@@ -147,11 +229,8 @@ class LinePlotDataHelper:
         Function that sets x-values inbetween the passed x-values indicating the start of a season, so that the tick can
         be in the middle of season lines.
 
-        :param season_x_vals:
+        :param season_x_vals: List containing the x-values of the start of each season, followed by the last x-value.
         :return: The x-values in the line plot to put the season ticks at
         """
-        tick_vals = []
-        for i, season in enumerate(season_x_vals):
-            if i == len(season_x_vals) - 1:
-                return tick_vals
-            tick_vals.append((season_x_vals[i] + season_x_vals[i + 1]) / 2)
+        season_x_vals = np.asarray(season_x_vals)
+        return ((season_x_vals[:-1] + season_x_vals[1:]) / 2).tolist()
@@ -1,10 +1,9 @@
-import io
-
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.offsetbox import AnnotationBbox, OffsetImage
 
+from . import graph_resources
 from .abstract_models import Graph
+from .radar_skeleton import RadarSkeleton, SkeletonBackground, radar_skeletons, skeleton_pixels
 
 
 class RadarChart(Graph):
@@ -27,6 +26,7 @@ class RadarChart(Graph):
     __num_labels = 6.0
     __title_offset = 1.33
     __subtitle_offset = 0.92
+    __fig_size = (8, 7)
 
     def __init__(self, param_map):
         """
@@ -79,14 +79,8 @@ class RadarChart(Graph):
         for each player stat (angles), the normalized p1_values list (p1_data_normalized), and the normalized p2_values
         list, which is None if p2_values is None (p2_data_normalized), respectively.
         """
-        # calculate the angles for each category
-        n = len(p1_values) - 1
-        angles = np.linspace(0, 2 * np.pi, n, endpoint=False).tolist()
-        angles += angles[:1]  # Close the loop
-
-        # create the radar chart
-        fig = plt.figure(figsize=(8, 7))
-        ax = fig.add_axes([self.__left_pos, self.__bottom_pos, self.__plot_w, self.__plot_h], projection='polar')
+        angles = self.get_angles(len(p1_values) - 1)
+        fig, ax = self.create_figure()
 
         p1_data_normalized = [d / scale for d, scale in zip(p1_values, scales)]
         p1_data_normalized += p1_data_normalized[:1]  # Close the loop
@@ -98,6 +92,27 @@ class RadarChart(Graph):
 
         return fig, ax, angles, p1_data_normalized, p2_data_normalized
 
+    def get_angles(self, num_stats):
+        """
+        Function that calculates the angle in the radar chart for each stat.
+
+        :param num_stats: Number of stats to graph.
+        :return: List containing the angle of each stat, with the first angle appended at the end to close the loop.
+        """
+        angles = np.linspace(0, 2 * np.pi, num_stats, endpoint=False).tolist()
+        angles += angles[:1]  # Close the loop
+        return angles
+
+    def create_figure(self):
+        """
+        Function that creates an empty matplotlib figure with the polar axes of the radar chart.
+
+        :return: Matplotlib's generated fig (fig) and ax (ax) objects, respectively.
+        """
+        fig = graph_resources.create_figure(self.__fig_size)
+        ax = fig.add_axes([self.__left_pos, self.__bottom_pos, self.__plot_w, self.__plot_h], projection='polar')
+        return fig, ax
+
     def get_scale_labels(self, scales, num_labels):
         """
         Function that sets the y-values of scale labels on the plotted grid for each stat.
@@ -265,6 +280,55 @@ class RadarChart(Graph):
 
         return ax
 
+    def print_logo(self, ax):
+        """
+        Function for placing the Tactalyse logo in the top right corner of the figure.
+
+        :param ax: Ax object representing the radar graph
+        :return: The ax object representing the radar graph with the logo placed
+        """
+        im = OffsetImage(graph_resources.logo(), zoom=0.4)
+        ab = AnnotationBbox(im, (1.3, 1.35), xycoords='axes fraction', frameon=False)
+        ax.add_artist(ab)
+        return ax
+
+    def draw_skeleton(self, column_names, scales):
+        """
+        Function for rendering the static layers of a radar chart, which are the same for every chart of the same stats
+        and scales: the grid, the scale values, the stat labels and the logo.
+
+        :param column_names: Names of the football stats to plot
+        :param scales: List containing the maximum value within the league for each stat.
+        :return: RadarSkeleton containing the rendered layers as an array of RGBA pixels, and the radial limits of the
+        axes they were drawn on.
+        """
+        angles = self.get_angles(len(column_names))
+        fig, ax = self.create_figure()
+        ax = self.print_scales(ax, angles, self.get_scale_labels(scales, self.__num_labels))
+        ax = self.print_stat_labels(ax, angles, column_names)
+        ax = self.print_logo(ax)
+        fig.canvas.draw()
+        return RadarSkeleton(skeleton_pixels(fig.canvas), ax.get_ylim())
+
+    def place_skeleton(self, fig, ax, skeleton):
+        """
+        Function for placing the prerendered static layers of a radar chart behind its axes, and setting up the axes
+        so that the players' values line up with the grid in the skeleton.
+
+        :param fig: Fig object containing the radar graph
+        :param ax: Ax object representing the radar graph
+        :param skeleton: RadarSkeleton to place, see draw_skeleton()
+        :return: The ax object representing the radar graph, with a transparent background
+        """
+        fig.add_artist(SkeletonBackground(skeleton.background))
+        ax.patch.set_visible(False)
+        ax = self.clear_grid(ax)
+        ax.set_theta_offset(np.pi / 2)
+        ax.set_theta_direction(-1)
+        ax.set_xticks([])
+        ax.set_ylim(skeleton.ylim)
+        return ax
+
     def set_layout(self, ax, p1, p2, team, matches, country):
         """
         Function for setting the layout of the output figure, and setting the title/subtitle.
@@ -275,14 +339,8 @@ class RadarChart(Graph):
         :param team: Team the main player plays in
         :param matches: Number of matches played by the main player
         :param country: Birth country of the main player
-        :return: The ax object representing the radar graph with the layout placed and the title and subtitle printed
+        :return: The ax object representing the radar graph with the title and subtitle printed
         """
-        path = "graph_app/files/images/Logo_Tactalyse_Triangle.png"
-        arr_img = plt.imread(path)
-        im = OffsetImage(arr_img, zoom=0.4)
-        ab = AnnotationBbox(im, (1.3, 1.35), xycoords='axes fraction', frameon=False)
-        ax.add_artist(ab)
-
         determinant = ', a '
         if self.__position[0].lower() in ['a', 'e', 'i', 'o', 'u']:
             determinant = ', an '
@@ -293,14 +351,15 @@ class RadarChart(Graph):
         subtitle += "Matches played: " + str(matches) + "\n"
         if p2 is not None:
             subtitle += "Compared with " + p2 + "\n"
-        plt.suptitle(subtitle, fontsize=12, y=self.__subtitle_offset, color=self.__subtitle)
+        ax.figure.suptitle(subtitle, fontsize=12, y=self.__subtitle_offset, color=self.__subtitle)
         ax.set_title(title, fontsize=15, fontweight=0, color=self.__tactalyse, weight="bold", y=self.__title_offset)
 
         return ax
 
     def draw(self, param_map):
         """
-        Main draw function of the radar chart.
+        Main draw function of the radar chart. The static layers are taken from the skeleton cache, so only the
+        players, title and legend are drawn for each chart.
 
         :param param_map: Map containing all relevant data, as set in the RadarProcessor class in data/preprocessors.
         :return: The generated radar chart in byte form.
@@ -311,35 +370,29 @@ class RadarChart(Graph):
         p2_data, p2, p2_values = self.get_player_data(column_names, param_map, True)
 
         scales = param_map.get('scales')
+        skeleton = radar_skeletons.get_or_render(radar_skeletons.key(column_names, scales, self.__fig_size),
+                                                 lambda: self.draw_skeleton(column_names, scales))
         fig, ax, angles, p1_values, p2_values = self.create_radar_chart(p1_values, p2_values, scales)
+        ax = self.place_skeleton(fig, ax, skeleton)
 
         # plot the values on the radar chart
         if self.check_zeroes(p1_values):
             raise ValueError("Player " + p1 + " had only NA entries.")
         ax = self.plot_player(ax, p1, p1_values, angles, self.__tactalyse)
 
-        scale_labels = self.get_scale_labels(scales, self.__num_labels)
-        ax = self.print_scales(ax, angles, scale_labels)
-
         if p2_values is not None:
             if self.check_zeroes(p2_values):
                 raise ValueError("Player " + p2 + " had only NA entries.")
             ax = self.plot_player(ax, p2, p2_values, angles, self.__compare)
 
-        ax = self.print_stat_labels(ax, angles, column_names)
-
         team = param_map.get('player_row')['Team'].iloc[0]
         matches = param_map.get('player_row')['Matches played'].iloc[0]
         country = param_map.get('player_row')['Birth country'].iloc[0]
         ax = self.set_layout(ax, p1, p2, team, matches, country)
 
-        plt.legend(bbox_to_anchor=(1.1, 1.15), loc='upper center')
+        ax.legend(bbox_to_anchor=(1.1, 1.15), loc='upper center')
 
-        # Save the plot to a file
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png')
-        buffer.seek(0)
-        return buffer.getvalue()
+        return graph_resources.to_png(fig)
 
     def draw_all(self, param_map):
         """
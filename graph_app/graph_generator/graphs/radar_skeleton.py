@@ -0,0 +1,140 @@
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from matplotlib.artist import Artist
+
+# Prerendered static layers of a radar chart: the RGBA pixels of the grid, scale values, stat labels and logo, bottom
+# row first, and the radial limits of the axes they were drawn on
+RadarSkeleton = namedtuple('RadarSkeleton', ['background', 'ylim'])
+
+
+def skeleton_pixels(canvas):
+    """
+    Function that copies the pixels of a drawn Agg canvas into the layout used for skeleton backgrounds.
+
+    :param canvas: Agg canvas of the figure, after it has been drawn.
+    :return: Array of RGBA pixels with the bottom row first.
+    """
+    return np.ascontiguousarray(np.asarray(canvas.buffer_rgba())[::-1])
+
+
+class SkeletonBackground(Artist):
+    """
+    Class representing the background of a figure drawn from a skeleton. The pixels are copied onto the canvas as they
+    are, unlike with Figure.figimage(), which resamples the image on every draw.
+    """
+    zorder = -1
+
+    def __init__(self, pixels):
+        """
+        Constructor for the class.
+
+        :param pixels: Array of RGBA pixels with the bottom row first, the size of the figure in pixels.
+        """
+        super().__init__()
+        self.__pixels = pixels
+
+    def draw(self, renderer):
+        """
+        Function that copies the pixels onto the canvas, with the bottom left corner at the figure's origin.
+
+        :param renderer: Renderer of the canvas being drawn.
+        """
+        if not self.get_visible():
+            return
+        gc = renderer.new_gc()
+        renderer.draw_image(gc, 0, 0, self.__pixels)
+        gc.restore()
+
+
+class RadarSkeletonCache:
+    """
+    Class representing a process-wide, in-memory cache of radar chart skeletons. The static layers of a radar chart only
+    depend on the graphed stats, their scales and the figure size, so they are rendered once per combination, and every
+    following chart with the same combination only draws the players, title and legend on top of them. The cache has a
+    memory budget in bytes, and evicts the least recently used skeletons once the budget is exceeded. Skeletons returned
+    by the cache are shared between requests, and should therefore not be modified in place. Their backgrounds cannot be
+    marked read-only, since the Agg renderer only draws writable arrays.
+    """
+
+    def __init__(self, max_bytes):
+        """
+        Constructor for the class.
+
+        :param max_bytes: Maximum amount of memory in bytes that the cached backgrounds may use combined.
+        """
+        self.__max_bytes = max_bytes
+        self.__entries = OrderedDict()
+        self.__used_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def get_or_render(self, key, render):
+        """
+        Function that retrieves a cached skeleton, or renders and caches it if it was not in the cache.
+
+        :param key: Hashable key of the skeleton, see key().
+        :param render: Function without arguments that returns a RadarSkeleton on a cache miss.
+        :return: The cached or newly rendered RadarSkeleton.
+        """
+        with self.__lock:
+            skeleton = self.__entries.get(key)
+            if skeleton is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return skeleton
+            self.__misses += 1
+        skeleton = render()
+        size = skeleton.background.nbytes
+        with self.__lock:
+            if key not in self.__entries and size <= self.__max_bytes:
+                while self.__used_bytes + size > self.__max_bytes:
+                    _, oldest = self.__entries.popitem(last=False)
+                    self.__used_bytes -= oldest.background.nbytes
+                self.__entries[key] = skeleton
+                self.__used_bytes += size
+        return skeleton
+
+    def clear(self):
+        """
+        Function that removes all skeletons from the cache.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__used_bytes = 0
+
+    def stats(self):
+        """
+        Function that reports the usage of the cache.
+
+        :return: Dictionary containing the number of hits, misses and entries, and the used and maximum amount of
+        memory in bytes.
+        """
+        with self.__lock:
+            return {'hits': self.__hits,
+                    'misses': self.__misses,
+                    'entries': len(self.__entries),
+                    'used_bytes': self.__used_bytes,
+                    'max_bytes': self.__max_bytes}
+
+    @staticmethod
+    def key(column_names, scales, fig_size):
+        """
+        Function that creates the key of a skeleton.
+
+        :param column_names: Names of the graphed stats.
+        :param scales: Maximum scale value of each stat.
+        :param fig_size: Tuple containing the width and height of the figure in inches.
+        :return: Hashable tuple identifying the skeleton.
+        """
+        return tuple(column_names), tuple(float(scale) for scale in scales), tuple(fig_size)
+
+
+# Memory budget of the skeleton cache in megabytes, configurable through the environment. A skeleton of the default
+# radar chart size takes about 2MB.
+RADAR_SKELETON_MB = int(os.environ.get('GRAPH_APP_RADAR_SKELETON_MB', '64'))
+
+radar_skeletons = RadarSkeletonCache(RADAR_SKELETON_MB * 1024 * 1024)
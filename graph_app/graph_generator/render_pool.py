@@ -0,0 +1,202 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pandas as pd
+
+from .factories.graph_factory import GraphFactory
+from .graphs import graph_resources
+
+# Number of worker processes that render graphs, configurable through the environment. 0 renders graphs on the request
+# thread instead.
+RENDER_WORKERS = int(os.environ.get('GRAPH_APP_RENDER_WORKERS', '0'))
+# Maximum number of seconds a request may wait for its graph(s) to be rendered in the worker processes
+RENDER_TIMEOUT = float(os.environ.get('GRAPH_APP_RENDER_TIMEOUT', '30'))
+# Number of graphs a worker process renders before it is replaced by a fresh one, 0 to never replace workers
+RENDER_MAX_TASKS = int(os.environ.get('GRAPH_APP_RENDER_MAX_TASKS', '200'))
+
+# Columns of the main player's league data that the radar chart prints besides the graphed stats
+RADAR_INFO_COLUMNS = ('Team', 'Matches played', 'Birth country')
+
+
+class RenderTimeoutError(TimeoutError):
+    """
+    Error raised when the graph(s) of a request are not rendered within the timeout in the render pool.
+    """
+
+
+def line_plot_columns(df, stats):
+    """
+    Function that determines the columns of a player file that a line plot of the passed stats needs: the date, each
+    stat, and for stats with a sub-stat (e.g. 'Defensive duels / won') the column after it.
+
+    :param df: DataFrame containing the data of a player file.
+    :param stats: List of stats to plot, or a single stat in string form.
+    :return: List of column names, in the order of the DataFrame.
+    """
+    stats = [stats] if isinstance(stats, str) else list(stats)
+    keep = {'Date'}
+    for stat in stats:
+        if stat in df.columns:
+            keep.add(stat)
+            index = df.columns.get_loc(stat)
+            if '/' in stat and index + 1 < len(df.columns):
+                keep.add(df.columns[index + 1])
+    return [column for column in df.columns if column in keep]
+
+
+def compact_params(param_map):
+    """
+    Function that reduces a graph parameter map to the data the graph needs, so it can be sent to a worker process
+    cheaply. The DataFrames are limited to the graphed columns: the date and stats of the player files for line plots,
+    and the stats and player info of the league rows for radar charts.
+
+    :param param_map: Map containing all data required for creating the graph, see GraphConnector.create_graph().
+    :return: New map that the graph draws the same image from.
+    """
+    compact = dict(param_map)
+    columns = param_map.get('columns')
+    for key in ('player_data', 'compare_data'):
+        df = param_map.get(key)
+        if isinstance(df, pd.DataFrame) and columns is not None:
+            compact[key] = df[line_plot_columns(df, columns)]
+    for key in ('player_row', 'compare_row'):
+        df = param_map.get(key)
+        if isinstance(df, pd.DataFrame) and columns is not None:
+            keep = set(columns) | set(RADAR_INFO_COLUMNS)
+            compact[key] = df[[column for column in df.columns if column in keep]]
+    return compact
+
+
+def init_worker():
+    """
+    Function that prepares a worker process for rendering, by loading the graph libraries, fonts and logo.
+    """
+    graph_resources.preload()
+
+
+def render_graph(param_map):
+    """
+    Function that renders the graph(s) described by a parameter map. Runs in a worker process.
+
+    :param param_map: Map containing all data required for creating the graph, see compact_params().
+    :return: The graph(s) generated from the data in byte form, see Graph.draw_all().
+    """
+    return GraphFactory().create_instance(param_map).draw_all(param_map)
+
+
+def ping():
+    """
+    Function that does nothing, used to check that the worker processes have started.
+    """
+    return True
+
+
+class RenderPool:
+    """
+    Class representing an optional pool of worker processes that render graphs, so that graphs are drawn on every core
+    instead of in the threads of the app process, which share a single interpreter lock. The workers are created from a
+    fork server that has imported the graph modules, and load the fonts and logo when they start. A worker is replaced
+    after rendering a number of graphs, which keeps the memory of long-running workers in check. When the graphs of a
+    request are not finished within the timeout, the request fails, but the pool is left running, so the graphs of
+    other requests are not lost. A graph that timed out still occupies its worker until it is finished.
+    """
+
+    def __init__(self, workers=None, timeout=None, max_tasks=None):
+        """
+        Constructor for the class. The pool only runs after start() is called.
+
+        :param workers: Number of worker processes. Defaults to GRAPH_APP_RENDER_WORKERS, or the number of CPUs if that
+        is not set to a positive number.
+        :param timeout: Maximum number of seconds a request may wait for its graph(s), including the time they are
+        queued. Defaults to GRAPH_APP_RENDER_TIMEOUT.
+        :param max_tasks: Number of graphs a worker renders before it is replaced, 0 for no limit. Defaults to
+        GRAPH_APP_RENDER_MAX_TASKS.
+        """
+        self.__workers = workers if workers is not None else (RENDER_WORKERS if RENDER_WORKERS > 0 else os.cpu_count())
+        self.__timeout = timeout if timeout is not None else RENDER_TIMEOUT
+        self.__max_tasks = max_tasks if max_tasks is not None else RENDER_MAX_TASKS
+        self.__pool = None
+        self.__lock = threading.Lock()
+
+    def start(self):
+        """
+        Function that starts the worker processes, and waits until they can take graphs. Does nothing if the pool is
+        already running.
+        """
+        with self.__lock:
+            if self.__pool is None:
+                self.__pool = self.create_pool()
+                self.__pool.apply(ping)
+
+    def create_pool(self):
+        """
+        Function that creates the worker processes. The fork server start method is used where it is available, since
+        forking the app process itself is unsafe once it runs threads.
+
+        :return: The new multiprocessing Pool.
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        if 'forkserver' in methods:
+            context.set_forkserver_preload([__name__])
+        return context.Pool(self.__workers, initializer=init_worker, maxtasksperchild=self.__max_tasks or None)
+
+    def render(self, param_map):
+        """
+        Function that renders a graph in one of the worker processes. A line plot request for several stats in separate
+        plots is split into one task per stat, so that the plots are drawn by several workers at the same time.
+
+        :param param_map: Map containing all data required for creating the graph, see GraphConnector.create_graph().
+        :return: The graph(s) generated from the data in byte form, see Graph.draw_all().
+        :raises: RenderTimeoutError when the graph(s) were not finished within the timeout, RuntimeError when the pool
+        is not running, and any error raised while drawing the graph.
+        """
+        with self.__lock:
+            pool = self.__pool
+        if pool is None:
+            raise RuntimeError("The render pool is not running.")
+        columns = param_map.get('columns')
+        if param_map.get('type') == 'line' and param_map.get('layout') != 'combined' and not isinstance(columns, str) \
+                and len(columns) > 1:
+            tasks = [compact_params(dict(param_map, columns=[column])) for column in columns]
+        else:
+            tasks = [compact_params(param_map)]
+        deadline = time.monotonic() + self.__timeout
+        results = [pool.apply_async(render_graph, (task,)) for task in tasks]
+        try:
+            graphs = [result.get(max(deadline - time.monotonic(), 0)) for result in results]
+        except multiprocessing.TimeoutError:
+            raise RenderTimeoutError("Rendering the graph took longer than " + str(self.__timeout) + " seconds.")
+        return graphs if len(tasks) > 1 else graphs[0]
+
+    def stop(self):
+        """
+        Function that stops the worker processes.
+        """
+        with self.__lock:
+            pool, self.__pool = self.__pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def is_running(self):
+        """
+        Function that checks whether the pool is running.
+
+        :return: True if graphs are rendered in the worker processes, False if not.
+        """
+        return self.__pool is not None
+
+    @property
+    def workers(self):
+        """
+        Getter for the workers attribute of the RenderPool.
+
+        :return: Integer representing the number of worker processes.
+        """
+        return self.__workers
+
+
+render_pool = RenderPool()
@@ -31,3 +31,14 @@ class TestGraphConnector(unittest.TestCase):
         self.assertEqual(plot, "Mocked plot")
         factory_mock.create_instance.assert_called_with(params)
         graph_mock.draw_all.assert_called_with(params)
+
+    def test_create_graph_render_pool(self):
+        factory_mock = Mock()
+        self.connector.factory = factory_mock
+        with patch('graph_app.controller.connectors.graph_connector.render_pool') as pool_mock:
+            pool_mock.is_running.return_value = True
+            pool_mock.render.return_value = "Pooled plot"
+            plot = self.connector.create_graph(self.param_map)
+        self.assertEqual(plot, "Pooled plot")
+        pool_mock.render.assert_called_once_with(self.param_map)
+        factory_mock.create_instance.assert_not_called()
@@ -1,7 +1,67 @@
+import base64
+import io
+import json
 import unittest
+from unittest.mock import patch
+
+from werkzeug.datastructures import FileStorage, MultiDict
+
+from graph_app.controller.services.file_update_service import FileUpdateService
+from graph_app.data.upload_spooler import UploadSpooler
 
 
 class TestFileUpdateService(unittest.TestCase):
 
     def setUp(self):
-        pass
+        self.service = FileUpdateService()
+
+    def test_pass_data(self):
+        with patch('graph_app.controller.services.file_update_service.ingest_worker.submit',
+                   return_value={'job': '3', 'state': 'queued'}) as submit:
+            response = self.service.pass_data({"league_files": ["league.xlsx"], "player_files": []})
+            submit.assert_called_once_with(["league.xlsx"], None)
+            self.assertEqual(202, response.status_code)
+            self.assertEqual('3', json.loads(response.data)['job'])
+            self.assertEqual('/graph/ingest/3', json.loads(response.data)['status_url'])
+
+    def test_json_process(self):
+        payload = {'league-files': [{'filename': 'league.xlsx', 'data': base64.b64encode(b'league').decode()}]}
+        with patch('graph_app.controller.services.file_update_service.ingest_worker.submit',
+                   return_value={'job': '1', 'state': 'queued'}) as update:
+            response = self.service.json_process(payload)
+            self.assertEqual(202, response.status_code)
+            league_files, player_files = update.call_args[0]
+            self.assertEqual('league.xlsx', league_files[0].filename)
+            self.assertIsNone(player_files)
+            self.assertEqual([None], payload['league-files'])
+
+    def test_json_process_invalid_file(self):
+        with patch('graph_app.controller.services.file_update_service.ingest_worker.submit') as update:
+            response = self.service.json_process({'player-files': [{'data': 'bGVhZ3Vl'}]})
+            update.assert_not_called()
+            self.assertEqual(400, response.status_code)
+
+    def test_json_process_too_large(self):
+        payload = {'league-files': [{'filename': 'league.xlsx', 'data': base64.b64encode(b'league').decode()}]}
+        with patch('graph_app.controller.services.file_update_service.UploadSpooler',
+                   return_value=UploadSpooler(max_file_size=2)), \
+                patch('graph_app.controller.services.file_update_service.ingest_worker.submit') as update:
+            response = self.service.json_process(payload)
+            update.assert_not_called()
+            self.assertEqual(413, response.status_code)
+
+    def test_key_value_process_closes_uploads(self):
+        files = MultiDict([('league-files', FileStorage(io.BytesIO(b'league'), filename='league.xlsx'))])
+        with patch('graph_app.controller.services.file_update_service.ingest_worker.submit',
+                   return_value={'job': '2', 'state': 'queued'}) as update:
+            response = self.service.key_value_process(files, MultiDict())
+            self.assertEqual(202, response.status_code)
+            league_files, player_files = update.call_args[0]
+            self.assertEqual('league.xlsx', league_files[0].filename)
+            self.assertTrue(files['league-files'].stream.closed)
+
+    def test_pass_data_no_files(self):
+        with patch('graph_app.controller.services.file_update_service.ingest_worker.submit') as update:
+            response = self.service.pass_data({"league_files": [], "player_files": []})
+            update.assert_not_called()
+            self.assertEqual(400, response.status_code)
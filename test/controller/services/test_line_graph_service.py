@@ -2,8 +2,10 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from flask import Response
+from werkzeug.datastructures import MultiDict
 
 from graph_app.controller.services.line_graph_service import LineGraphService
+from graph_app.graph_generator.render_pool import RenderTimeoutError
 
 
 class TestLineGraphService(unittest.TestCase):
@@ -21,7 +23,8 @@ class TestLineGraphService(unittest.TestCase):
                          "compare": "player2",
                          "stat": "stat1",
                          "start_date": "start",
-                         "end_date": "end"}
+                         "end_date": "end",
+                         "layout": "separate"}
         self.service = LineGraphService()
         self.mock_return_value = MagicMock(return_value="mock data 1")
         self.mock_return_value_2 = MagicMock(return_value="mock data 2")
@@ -38,6 +41,19 @@ class TestLineGraphService(unittest.TestCase):
             mock_pass_data.assert_called_once_with(self.data_map)
             self.assertEqual("mock data 1", result)
 
+    def test_combined_layout_multiple_stats(self):
+        form = MultiDict(list(self.api_params.items()) + [("stat", "stat2"), ("layout", "combined")])
+        with patch.object(self.service, "pass_data", new=self.mock_return_value) as mock_pass_data:
+            self.service.key_value_process(None, form)
+            expected = dict(self.data_map, stat=["stat1", "stat2"], layout="combined")
+            mock_pass_data.assert_called_once_with(expected)
+
+    def test_invalid_layout(self):
+        with patch.object(self.service, "pass_data", new=self.mock_return_value) as mock_pass_data:
+            response = self.service.json_process(dict(self.api_params, layout="grid"))
+            self.assertEqual(400, response.status_code)
+            mock_pass_data.assert_not_called()
+
     def test_pass_data(self):
         with patch.object(self.service.data_connector, 'get_data', new=self.mock_return_value) as mock_data_get_data:
             with patch.object(self.service.graph_connector, 'get_data', new=self.mock_return_value_2) \
@@ -49,6 +65,13 @@ class TestLineGraphService(unittest.TestCase):
                 self.assertEqual('image/png', response.mimetype)
                 self.assertEqual("mock data 2", response.data.decode('utf-8'))
 
+    def test_pass_data_render_timeout(self):
+        with patch.object(self.service.data_connector, 'get_data', new=self.mock_return_value):
+            with patch.object(self.service.graph_connector, 'get_data', side_effect=RenderTimeoutError("took long")):
+                response = self.service.pass_data(self.data_map)
+                self.assertEqual(504, response.status_code)
+                self.assertEqual("Error: took long", response.data.decode('utf-8'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,8 @@ from unittest.mock import patch, MagicMock
 from flask import Response
 
 from graph_app.controller.services.radar_graph_service import RadarGraphService
+from graph_app.data.player_directory import AmbiguousPlayerError
+from graph_app.graph_generator.render_pool import RenderTimeoutError
 
 
 class TestRadarGraphService(unittest.TestCase):
@@ -15,7 +17,8 @@ class TestRadarGraphService(unittest.TestCase):
         self.data_map = {"type": "radar",
                          "league": "league1",
                          "player": "player1",
-                         "compare": "player2"}
+                         "compare": "player2",
+                         "scale_mode": "league"}
         self.service = RadarGraphService()
         self.mock_return_value = MagicMock(return_value="mock data 1")
         self.mock_return_value_2 = MagicMock(return_value="mock data 2")
@@ -32,6 +35,20 @@ class TestRadarGraphService(unittest.TestCase):
             mock_pass_data.assert_called_once_with(self.data_map)
             self.assertEqual("mock data 1", result)
 
+    def test_json_process_scale_mode(self):
+        with patch.object(self.service, "pass_data", new=self.mock_return_value) as mock_pass_data:
+            self.service.json_process({**self.api_params, "scale-mode": "position"})
+            mock_pass_data.assert_called_once_with({**self.data_map, "scale_mode": "position"})
+            response = self.service.json_process({**self.api_params, "scale-mode": "team"})
+            self.assertEqual(400, response.status_code)
+
+    def test_pass_data_ambiguous_player(self):
+        error = AmbiguousPlayerError("player1", ["league1", "league2"])
+        with patch.object(self.service.data_connector, 'get_data', side_effect=error):
+            response = self.service.pass_data(self.data_map)
+            self.assertEqual(409, response.status_code)
+            self.assertEqual(["league1", "league2"], response.get_json()['leagues'])
+
     def test_pass_data(self):
         with patch.object(self.service.data_connector, 'get_data', new=self.mock_return_value) as mock_data_get_data:
             with patch.object(self.service.graph_connector, 'get_data', new=self.mock_return_value_2) \
@@ -43,6 +60,13 @@ class TestRadarGraphService(unittest.TestCase):
                 self.assertEqual('image/png', response.mimetype)
                 self.assertEqual("mock data 2", response.data.decode('utf-8'))
 
+    def test_pass_data_render_timeout(self):
+        with patch.object(self.service.data_connector, 'get_data', new=self.mock_return_value):
+            with patch.object(self.service.graph_connector, 'get_data', side_effect=RenderTimeoutError("took long")):
+                response = self.service.pass_data(self.data_map)
+                self.assertEqual(504, response.status_code)
+                self.assertEqual("Error: took long", response.data.decode('utf-8'))
+
 
 if __name__ == '__main__':
     unittest.main()
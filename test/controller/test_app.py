@@ -54,6 +54,10 @@ class TestApp(unittest.TestCase):
                                  content_type='multipart/form-data')
         self.check_assertions(response)
 
+    def test_ready_endpoint(self):
+        response = self.app.get('/ready')
+        self.assertEqual(response.status_code, 200)
+
     def random_endpoint(self, graph):
         response = self.app.post('/graph',
                                  data=graph,
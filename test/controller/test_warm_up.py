@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import patch
+
+from graph_app.controller.warm_up import WarmUp
+
+
+class TestWarmUp(unittest.TestCase):
+
+    def setUp(self):
+        self.warm_up = WarmUp()
+
+    def test_ready_without_start(self):
+        self.assertTrue(self.warm_up.is_ready())
+        self.assertEqual('skipped', self.warm_up.status['state'])
+
+    def test_start(self):
+        with patch('graph_app.controller.warm_up.DataConnector.preload_files', return_value=3) as preload_files:
+            with patch('graph_app.controller.warm_up.GraphConnector.preload_graphs') as preload_graphs:
+                self.warm_up.start(2)
+                self.assertTrue(self.warm_up.wait(10))
+                preload_files.assert_called_once_with(2)
+                preload_graphs.assert_called_once()
+                self.assertEqual('done', self.warm_up.status['state'])
+                self.assertEqual(3, self.warm_up.status['files'])
+
+    def test_failure_still_ready(self):
+        with patch('graph_app.controller.warm_up.DataConnector.preload_files', side_effect=OSError("missing")):
+            self.warm_up.run()
+            self.assertTrue(self.warm_up.is_ready())
+            self.assertEqual('failed', self.warm_up.status['state'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
+from graph_app.data.player_metadata import PlayerMetadata
 from graph_app.data.preprocessors.line_processor import LineProcessor
 
 
@@ -54,24 +55,23 @@ class TestLineProcessor(unittest.TestCase):
 
     def test_set_player_data(self):
         params = {"player": "name"}
-        mock_file_pos = MagicMock(return_value="pos_f")
-        mock_pos = MagicMock(return_value={"pos_f": "pos_l"})
-        mock_short_pos = MagicMock(return_value={"pos_f": "pos_s"})
+        metadata = PlayerMetadata("pos_f", "pos_l", "pos_s", None, None, 0, ())
         with patch.object(self.processor.reader, 'player_data', new=self.mock_return_value) as mock_read:
-            with patch.object(self.processor, 'main_position_player_file', new=mock_file_pos) \
-                    as mock_get_file_pos:
-                with patch.object(self.processor, 'position_dictionary', new=mock_pos) \
-                        as mock_get_long_pos:
-                    with patch.object(self.processor, 'shortened_dictionary', new=mock_short_pos) \
-                            as mock_get_short_pos:
-                        result = self.processor.set_player_data(params)
-                        expected = {"player": "name", "main_pos": "pos_f", "player_pos": "pos_l",
-                                    "main_pos_short": "pos_s", "player_data": "mock"}
-                        mock_read.assert_called_once_with("name")
-                        mock_get_file_pos.assert_called_once_with("mock")
-                        mock_get_long_pos.assert_called_once()
-                        mock_get_short_pos.assert_called_once()
-                        self.assertEqual(expected, result)
+            with patch.object(self.processor.reader, 'player_metadata', return_value=metadata) as mock_metadata:
+                result = self.processor.set_player_data(params)
+                expected = {"player": "name", "main_pos": "pos_f", "player_pos": "pos_l",
+                            "main_pos_short": "pos_s", "player_data": "mock"}
+                mock_read.assert_called_once_with("name")
+                mock_metadata.assert_called_once_with("name")
+                self.assertEqual(expected, result)
+
+    def test_set_player_data_not_found(self):
+        params = {"player": "name"}
+        with patch.object(self.processor.reader, 'player_data', new=self.mock_return_value):
+            with patch.object(self.processor.reader, 'player_metadata', return_value=None):
+                result = self.processor.set_player_data(params)
+                self.assertIsNone(result["main_pos"])
+                self.assertIsNone(result["main_pos_short"])
 
     def test_set_tactalyse_data(self):
         params = {"start_date": "start", "end_date": "end"}
@@ -101,6 +101,30 @@ class TestLineProcessor(unittest.TestCase):
             expected = {'key': 'value', 'columns': ['mock']}
             self.assertEqual(expected, result)
 
+    def test_set_stats_list(self):
+        params = {'stat': ['stat1', 'stat2'], 'layout': 'combined'}
+        result = self.processor.set_stats(params, self.line_map)
+        expected = {'key': 'value', 'columns': ['stat1', 'stat2'], 'layout': 'combined'}
+        self.assertEqual(expected, result)
+
+    def test_set_stats_combined_no_stat(self):
+        params = {'layout': 'combined'}
+        line_map = {'main_pos_short': 'DM'}
+        result = self.processor.set_stats(params, line_map)
+        expected = self.processor.get_columns_line_plots('DM').tolist()
+        self.assertEqual(expected, result['columns'])
+        self.assertEqual('combined', result['layout'])
+
+    def test_set_stats_combined_unknown_position(self):
+        with patch.object(self.processor.randomizer, 'random_player_stat', new=self.mock_return_value):
+            for position in [None, 'XX']:
+                result = self.processor.set_stats({'layout': 'combined'}, {'main_pos_short': position})
+                self.assertEqual(['mock'], result['columns'])
+
+    def test_set_stats_unknown_layout(self):
+        with self.assertRaises(ValueError):
+            self.processor.set_stats({'stat': 'stat', 'layout': 'stacked'}, self.line_map)
+
     def test_extract_line_data(self):
         line_map = {'type': "line"}
         mock_player = MagicMock(return_value="player added")
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
+import pandas as pd
+
 from graph_app.data.preprocessors.radar_processor import RadarProcessor
 
 
@@ -14,10 +16,26 @@ class TestRadarProcessor(unittest.TestCase):
 
     def test_get_columns_radar_chart(self):
         with patch.object(self.processor, 'league_category_dictionary',
-                          return_value={"position": "columns"}) as mock_columns:
+                          return_value={"position": ("stat1", "stat2")}) as mock_columns:
             result = self.processor.get_columns_radar_chart("position")
             mock_columns.assert_called_once()
-            self.assertEqual("columns", result)
+            self.assertEqual(["stat1", "stat2"], result)
+
+    def test_extract_league_data_same_file_version(self):
+        league_df = pd.DataFrame({'Player': ['A'], 'Goals': [1.0]})
+        store = MagicMock()
+        key = ('Bundesliga.xlsx', 1, 2)
+        with patch('graph_app.data.excel_reader.league_catalog.lookup',
+                   return_value=MagicMock(path='Bundesliga.xlsx')), \
+                patch.object(self.processor.reader, 'file_key', return_value=key) as file_key, \
+                patch.object(self.processor.reader, 'read_league_file', return_value=league_df) as read, \
+                patch('graph_app.data.excel_reader.league_stores.get', return_value=store) as get_store:
+            result = self.processor.extract_league_data({'league': 'Bundesliga'})
+            file_key.assert_called_once_with('Bundesliga.xlsx')
+            read.assert_called_once_with('Bundesliga.xlsx', key)
+            self.assertEqual(key, get_store.call_args.args[0])
+        self.assertIs(league_df, result['league_df'])
+        self.assertIs(store, result['league_store'])
 
     def test_set_player(self):
         params = {"player": "name"}
@@ -37,7 +55,7 @@ class TestRadarProcessor(unittest.TestCase):
         params = {"player": "name"}
         with patch.object(self.processor.reader, 'league_data', new=self.mock_return_value) as mock_read:
             result = self.processor.set_player_data(self.mock_league_df, params)
-            mock_read.assert_called_once_with("name", self.mock_league_df)
+            mock_read.assert_called_once_with("name", self.mock_league_df, None)
             expected = {"player": "name", "player_row": "mock"}
             self.assertEqual(expected, result)
 
@@ -65,7 +83,7 @@ class TestRadarProcessor(unittest.TestCase):
         params = {"compare": "name"}
         with patch.object(self.processor.reader, 'league_data', new=self.mock_return_value) as mock_read:
             result = self.processor.set_compare(params, self.mock_league_df, self.radar_map)
-            mock_read.assert_called_once_with("name", self.mock_league_df)
+            mock_read.assert_called_once_with("name", self.mock_league_df, None)
             expected = {"key": "value", "compare": "name", "compare_row": "mock"}
             self.assertEqual(expected, result)
 
@@ -86,8 +104,26 @@ class TestRadarProcessor(unittest.TestCase):
         expected = {"columns": "stats", "scales": "max vals list"}
         self.assertEqual(expected, result)
 
+    def test_set_max_vals_league_store(self):
+        params = {"columns": ["stat"], "player_pos_short": "ST", "scale_mode": "position"}
+        mock_store = MagicMock()
+        mock_store.scales.return_value = [1.0]
+        result = self.processor.set_max_vals(self.mock_league_df, params, mock_store)
+        mock_store.scales.assert_called_once_with("ST", "position")
+        self.assertEqual([1.0], result["scales"])
+
+    def test_max_vals_dataframe_position(self):
+        league_df = pd.DataFrame({'Position': ['CF, LW', 'CB', 'RCF'],
+                                  'Goals per 90': [0.5, 0.9, 0.3],
+                                  'Clean sheets': [0, 4, 0]})
+        columns = ['Goals per 90', 'Clean sheets']
+        self.assertEqual([0.9, 4], self.processor.max_vals_dataframe(league_df, columns, 'ST', 'league'))
+        self.assertEqual([0.5, 4], self.processor.max_vals_dataframe(league_df, columns, 'ST', 'position'))
+        with self.assertRaises(ValueError):
+            self.processor.max_vals_dataframe(league_df, columns, 'ST', 'team')
+
     def test_extract_radar_data(self):
-        radar_map = {'type': "radar"}
+        radar_map = {'type': "radar", 'scale_mode': "league"}
         params = {'league_df': self.mock_league_df}
         mock_player = MagicMock(return_value="player added")
         mock_data = MagicMock(return_value="data added")
@@ -104,11 +140,12 @@ class TestRadarProcessor(unittest.TestCase):
                             with patch.object(self.processor, 'set_stats', new=mock_stats) as set_stats:
                                 result = self.processor.extract_radar_data(params)
                                 set_player.assert_called_once_with(params, self.mock_league_df, radar_map)
-                                set_data.assert_called_once_with(self.mock_league_df, "player added")
+                                set_data.assert_called_once_with(self.mock_league_df, "player added", None)
                                 set_positions.assert_called_once_with("data added")
-                                set_compare.assert_called_once_with(params, self.mock_league_df, "positions added")
+                                set_compare.assert_called_once_with(params, self.mock_league_df, "positions added",
+                                                                    None)
                                 set_stats.assert_called_once_with("compare added")
-                                set_scales.assert_called_once_with(self.mock_league_df, "stats added")
+                                set_scales.assert_called_once_with(self.mock_league_df, "stats added", None)
                                 expected = "scales added"
                                 self.assertEqual(expected, result)
 
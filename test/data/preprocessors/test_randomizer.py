@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
+import pandas as pd
+
 from graph_app.data.preprocessors.randomizer import Randomizer
 
 
@@ -54,11 +56,23 @@ class TestRandomizer(unittest.TestCase):
                         'league_df': self.mock_league_df,
                         'compare': 'p2'
                     }
-                    mock_row.assert_called_once_with('p1', self.mock_league_df)
+                    mock_row.assert_called_once_with('p1', self.mock_league_df, None)
                     mock_pos.assert_called_once_with('row')
-                    mock_name.assert_called_once_with(self.mock_league_df, 'pos', 'p1')
+                    mock_name.assert_called_once_with(self.mock_league_df, 'pos', 'p1', None)
                     self.assertEqual(expected, result)
 
+    def test_select_random_compare(self):
+        league_df = pd.DataFrame({'Player': ['p1', 'p2', 'p3'], 'Position': ['CF, LW', 'LCF', 'LW']})
+        self.assertEqual('p3', self.randomizer.select_random_compare(league_df, 'LW', 'p1'))
+        self.assertIsNone(self.randomizer.select_random_compare(league_df, 'CF', 'p1'))
+
+    def test_select_random_compare_league_store(self):
+        mock_store = MagicMock()
+        mock_store.random_player.return_value = 'p2'
+        result = self.randomizer.select_random_compare(self.mock_league_df, 'CF', 'p1', mock_store)
+        mock_store.random_player.assert_called_once_with('CF', 'p1')
+        self.assertEqual('p2', result)
+
 
 if __name__ == "__main__":
     unittest.main()
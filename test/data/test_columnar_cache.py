@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from graph_app.data.columnar_cache import ColumnarCache
+
+
+class TestColumnarCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ColumnarCache(os.path.join(self.temp_dir.name, 'cache'))
+        self.file = os.path.join(self.temp_dir.name, 'League.xlsx')
+        with open(self.file, 'w') as file:
+            file.write('placeholder')
+        self.df = pd.DataFrame({'Player': ['A', 'B'], 'Position': ['CF', 0], 'Goals': [1.0, 2.0]})
+        self.reader = MagicMock(side_effect=lambda file: self.df.copy())
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load_miss_reads_file(self):
+        result = self.cache.load(self.file, self.reader)
+        self.reader.assert_called_once_with(self.file)
+        self.assertTrue(os.path.exists(self.cache.cache_path(self.file)))
+        self.assertEqual(['A', 'B'], result['Player'].tolist())
+
+    def test_load_hit_skips_reader(self):
+        first = self.cache.load(self.file, self.reader)
+        second = self.cache.load(self.file, self.reader)
+        self.reader.assert_called_once()
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_load_hit_columns(self):
+        self.cache.load(self.file, self.reader)
+        result = self.cache.load(self.file, self.reader, ['Goals'])
+        self.assertEqual(['Goals'], result.columns.tolist())
+
+    def test_load_stale_rebuilds(self):
+        self.cache.load(self.file, self.reader)
+        old_path = self.cache.cache_path(self.file)
+        with open(self.file, 'w') as file:
+            file.write('a changed placeholder')
+        self.cache.load(self.file, self.reader)
+        self.assertEqual(2, self.reader.call_count)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertEqual(1, len(os.listdir(self.cache.cache_folder)))
+
+    def test_carry_over(self):
+        self.cache.load(self.file, self.reader)
+        copy = os.path.join(self.temp_dir.name, 'copy', 'League.xlsx')
+        os.makedirs(os.path.dirname(copy))
+        os.link(self.file, copy)
+        self.assertTrue(self.cache.carry_over(self.file, copy))
+        self.cache.load(copy, self.reader)
+        self.reader.assert_called_once()
+
+    def test_load_projections_separate(self):
+        projected_reader = MagicMock(side_effect=lambda file: self.df[['Player']].copy())
+        projected = self.cache.load(self.file, projected_reader, usecols=['Player'])
+        full = self.cache.load(self.file, self.reader)
+        self.assertEqual(['Player'], projected.columns.tolist())
+        self.assertEqual(['Player', 'Position', 'Goals'], full.columns.tolist())
+        self.cache.load(self.file, projected_reader, usecols=['Player'])
+        projected_reader.assert_called_once()
+        self.reader.assert_called_once()
+        self.assertEqual(2, len(os.listdir(self.cache.cache_folder)))
+
+    def test_carry_over_projections(self):
+        self.cache.load(self.file, self.reader)
+        self.cache.load(self.file, MagicMock(return_value=self.df[['Player']].copy()), usecols=['Player'])
+        copy = os.path.join(self.temp_dir.name, 'copy', 'League.xlsx')
+        os.makedirs(os.path.dirname(copy))
+        os.link(self.file, copy)
+        self.assertTrue(self.cache.carry_over(self.file, copy))
+        self.assertTrue(os.path.exists(self.cache.cache_path(copy)))
+        self.assertTrue(os.path.exists(self.cache.cache_path(copy, usecols=['Player'])))
+
+    def test_normalize_mixed_columns(self):
+        result = self.cache.normalize_mixed_columns(self.df.copy())
+        self.assertEqual('CF', result['Position'][0])
+        self.assertIsNone(result['Position'][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
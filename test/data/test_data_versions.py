@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from graph_app.data.data_versions import DataVersions
+
+
+class TestDataVersions(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.temp_dir.name, 'files')
+        os.makedirs(os.path.join(self.base, 'leagues'))
+        self.versions = DataVersions(os.path.join(self.base, 'versions'), self.base)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def publish(self, league, on_remove=None):
+        staging = self.versions.stage()
+        open(os.path.join(staging, 'leagues', league), 'w').close()
+        return self.versions.publish(staging, on_remove)
+
+    def test_base_version(self):
+        self.assertEqual(0, self.versions.current())
+        self.assertEqual((0, os.path.join(self.base, 'leagues')), self.versions.location('leagues'))
+
+    def test_publish(self):
+        self.assertEqual(1, self.publish('League.xlsx'))
+        version, folder = self.versions.location('leagues')
+        self.assertEqual(1, version)
+        self.assertEqual(['League.xlsx'], os.listdir(folder))
+        self.assertEqual([], os.listdir(self.versions.folder('players')))
+
+    def test_publish_keeps_previous_version(self):
+        for league in ['A.xlsx', 'B.xlsx', 'C.xlsx']:
+            self.publish(league)
+        self.assertEqual([2, 3], self.versions.versions())
+        self.assertEqual(['B.xlsx'], os.listdir(self.versions.folder('leagues', 2)))
+
+    def test_publish_reports_removed_files(self):
+        removed = []
+        for league in ['A.xlsx', 'B.xlsx', 'C.xlsx']:
+            self.publish(league, removed.append)
+        self.assertEqual([os.path.join(self.versions.root, '1', 'leagues', 'A.xlsx')], removed)
+
+    def test_current_from_other_instance(self):
+        other = DataVersions(self.versions.root, self.base)
+        self.assertEqual(0, other.current())
+        self.publish('League.xlsx')
+        self.assertEqual(1, other.current())
+
+    def test_discard(self):
+        staging = self.versions.stage()
+        self.versions.discard(staging)
+        self.assertFalse(os.path.exists(staging))
+        self.assertEqual(0, self.versions.current())
+
+
+if __name__ == "__main__":
+    unittest.main()
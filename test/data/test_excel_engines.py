@@ -0,0 +1,49 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from graph_app.data.excel_engines import ExcelEngine, convert_calamine_cell, read_calamine, read_openpyxl
+
+HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+
+class TestExcelEngines(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.temp_dir.name, 'League.xlsx')
+        pd.DataFrame({'Player': ['A', 'B', None], 'Position': ['CF', 'GK, LB', 'AMF'], 'Goals': [1, 2, None],
+                      'xG': [0.5, 1.25, 3.0]}).to_excel(self.file, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_openpyxl_usecols(self):
+        df = read_openpyxl(self.file, ['Player', 'xG', 'Missing'])
+        self.assertEqual(['Player', 'xG'], df.columns.tolist())
+
+    @unittest.skipUnless(HAS_CALAMINE, "python-calamine is not installed")
+    def test_calamine_matches_openpyxl(self):
+        pd.testing.assert_frame_equal(read_openpyxl(self.file), read_calamine(self.file))
+        pd.testing.assert_frame_equal(read_openpyxl(self.file, ['Goals']), read_calamine(self.file, ['Goals']))
+
+    def test_convert_calamine_cell(self):
+        self.assertIsInstance(convert_calamine_cell(2.0), int)
+        self.assertEqual(2.5, convert_calamine_cell(2.5))
+        self.assertEqual('', convert_calamine_cell(''))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            ExcelEngine('xlrd')
+
+    def test_engine_read(self):
+        engine = ExcelEngine('openpyxl')
+        self.assertEqual('openpyxl', engine.name)
+        self.assertEqual(['Position'], engine.reader(['Position'])(self.file).columns.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
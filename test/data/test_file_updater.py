@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from graph_app.data.data_versions import DataVersions
+from graph_app.data.file_updater import FileUpdater
+
+
+class TestFileUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.temp_dir.name, 'files')
+        for kind, name in [('leagues', 'Old league.xlsx'), ('players', 'Player stats A.xlsx')]:
+            os.makedirs(os.path.join(self.base, kind))
+            self.write(os.path.join(self.base, kind, name), name)
+        self.upload = os.path.join(self.temp_dir.name, 'New league.xlsx')
+        self.write(self.upload, 'New league')
+        self.versions = DataVersions(os.path.join(self.base, 'versions'), self.base)
+        self.updater = FileUpdater(self.versions)
+        self.rebuilds = [patch('graph_app.data.file_updater.' + name + '.rebuild')
+                         for name in ['league_catalog', 'player_directory', 'player_index']]
+        for rebuild in self.rebuilds:
+            rebuild.start()
+
+    def write(self, path, contents):
+        with open(path, 'w') as file:
+            file.write(contents)
+
+    def tearDown(self):
+        for rebuild in self.rebuilds:
+            rebuild.stop()
+        self.temp_dir.cleanup()
+
+    def test_update_league_files(self):
+        old_folder = self.versions.folder('leagues')
+        summary = self.updater.update_league_files([self.upload])
+        self.assertEqual(1, summary['version'])
+        self.assertEqual(['New league.xlsx'], summary['leagues']['added'])
+        self.assertEqual(['Old league.xlsx'], summary['leagues']['removed'])
+        self.assertEqual(['Player stats A.xlsx'], summary['players']['unchanged'])
+        self.assertEqual(['New league.xlsx'], os.listdir(self.versions.folder('leagues')))
+        self.assertEqual(['Player stats A.xlsx'], os.listdir(self.versions.folder('players')))
+        self.assertEqual(['Old league.xlsx'], os.listdir(old_folder))
+
+    def test_manifest(self):
+        self.updater.update_league_files([self.upload])
+        manifest = self.versions.manifest()
+        self.assertEqual(['New league.xlsx'], list(manifest['leagues']))
+        self.assertEqual(self.versions.manifest(0)['players'], manifest['players'])
+
+    def test_unchanged_files_not_published(self):
+        same = os.path.join(self.temp_dir.name, 'Old league.xlsx')
+        self.write(same, 'Old league.xlsx')
+        summary = self.updater.update_league_files([same])
+        self.assertEqual(0, summary['version'])
+        self.assertEqual(['Old league.xlsx'], summary['leagues']['unchanged'])
+        self.assertEqual([], self.versions.versions())
+
+    def test_unchanged_files_keep_caches(self):
+        same = os.path.join(self.temp_dir.name, 'Old league.xlsx')
+        self.write(same, 'Old league.xlsx')
+        old_path = os.path.join(self.versions.folder('leagues'), 'Old league.xlsx')
+        with patch('graph_app.data.file_updater.ExcelReader.carry_over') as carry_over:
+            summary = self.updater.update_league_files([same, self.upload])
+        new_path = os.path.join(self.versions.folder('leagues'), 'Old league.xlsx')
+        self.assertEqual(['New league.xlsx'], summary['leagues']['added'])
+        self.assertEqual(['Old league.xlsx'], summary['leagues']['unchanged'])
+        self.assertTrue(os.path.samefile(old_path, new_path))
+        carry_over.assert_any_call(old_path, new_path)
+
+    def test_failed_update_keeps_version(self):
+        with self.assertRaises(OSError):
+            self.updater.update(league_files=[os.path.join(self.temp_dir.name, 'missing.xlsx')])
+        self.assertEqual(0, self.versions.current())
+        self.assertEqual([], [name for name in os.listdir(self.versions.root) if name.startswith('.staging')])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from graph_app.data.file_watcher import FileWatcher, refresh_derived_data
+
+
+class TestFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.temp_dir.name, 'leagues')
+        os.mkdir(self.folder)
+        self.stats_file = os.path.join(self.temp_dir.name, 'Stats per position.xlsx')
+        self.changed = []
+        self.notified = threading.Event()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def callback(self, path):
+        self.changed.append(path)
+        self.notified.set()
+
+    def watch(self, use_inotify):
+        watcher = FileWatcher(lambda: [self.folder, self.stats_file], interval=0.1, debounce=0.05,
+                              use_inotify=use_inotify)
+        watcher.subscribe(self.callback)
+        watcher.start()
+        backend = watcher.backend
+        try:
+            # The file is written again until the watcher has picked up its watch targets
+            for _ in range(10):
+                with open(os.path.join(self.temp_dir.name, 'Other.xlsx'), 'w') as file:
+                    file.write('not watched')
+                with open(os.path.join(self.folder, 'League.xlsx'), 'w') as file:
+                    file.write('league')
+                if self.notified.wait(1):
+                    break
+        finally:
+            watcher.stop(timeout=5)
+        return backend
+
+    def test_polling(self):
+        self.assertEqual('polling', self.watch(use_inotify=False))
+        self.assertEqual([os.path.join(self.folder, 'League.xlsx')], self.changed)
+
+    def test_inotify(self):
+        self.assertIn(self.watch(use_inotify=True), ['inotify', 'polling'])
+        self.assertEqual([os.path.join(self.folder, 'League.xlsx')], self.changed)
+
+    def test_watches(self):
+        watcher = FileWatcher(lambda: [self.folder, self.stats_file])
+        self.assertEqual({self.folder: None, self.temp_dir.name: {'Stats per position.xlsx'}}, watcher.watches())
+
+    def test_refresh_league_file(self):
+        path = os.path.join(self.folder, 'League.xlsx')
+        with patch('graph_app.data.file_watcher.league_catalog') as catalog, \
+                patch('graph_app.data.file_watcher.player_directory') as directory, \
+                patch('graph_app.data.file_watcher.player_index') as index, \
+                patch('graph_app.data.file_watcher.ExcelReader.prepare_file') as prepare:
+            catalog.folder = self.folder
+            index.folder = os.path.join(self.temp_dir.name, 'players')
+            refresh_derived_data(path)
+            catalog.rebuild.assert_called_once()
+            directory.rebuild.assert_called_once()
+            index.rebuild.assert_not_called()
+            prepare.assert_not_called()
+
+    def test_refresh_stats_file(self):
+        with patch('graph_app.data.file_watcher.position_registry') as registry, \
+                patch('graph_app.data.file_watcher.league_catalog') as catalog:
+            registry.stats_file = self.stats_file
+            refresh_derived_data(self.stats_file)
+            registry.reload.assert_called_once()
+            catalog.rebuild.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
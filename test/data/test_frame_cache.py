@@ -0,0 +1,89 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from graph_app.data.frame_cache import FrameCache
+
+
+class TestFrameCache(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({'Goals': [1.0, 2.0, 3.0, 4.0]})
+        self.size = int(self.df.memory_usage(deep=True).sum())
+        self.cache = FrameCache(self.size * 2)
+
+    def test_get_miss(self):
+        self.assertIsNone(self.cache.get('league'))
+        self.assertEqual(1, self.cache.stats()['misses'])
+
+    def test_put_get_hit(self):
+        self.cache.put('league', self.df)
+        self.assertIs(self.df, self.cache.get('league'))
+        stats = self.cache.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(self.size, stats['used_bytes'])
+
+    def test_lru_eviction(self):
+        self.cache.put('a', self.df)
+        self.cache.put('b', self.df.copy())
+        self.cache.get('a')
+        self.cache.put('c', self.df.copy())
+        self.assertIsNone(self.cache.get('b'))
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNotNone(self.cache.get('c'))
+        self.assertEqual(1, self.cache.stats()['evictions'])
+
+    def test_put_too_large(self):
+        large = pd.DataFrame({'Goals': range(100)})
+        self.cache.put('large', large)
+        self.assertEqual(0, self.cache.stats()['entries'])
+
+    def test_get_or_load(self):
+        loader = MagicMock(return_value=self.df)
+        self.cache.get_or_load('league', loader)
+        result = self.cache.get_or_load('league', loader)
+        loader.assert_called_once()
+        self.assertIs(self.df, result)
+
+    def test_get_or_load_single_flight(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(5)
+            return self.df
+
+        loader = MagicMock(side_effect=slow_loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get_or_load('league', loader)))
+                   for _ in range(3)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        loader.assert_called_once()
+        self.assertEqual(3, len(results))
+        self.assertTrue(all(result is self.df for result in results))
+
+    def test_get_or_load_error(self):
+        with self.assertRaises(OSError):
+            self.cache.get_or_load('league', MagicMock(side_effect=OSError))
+        self.assertIs(self.df, self.cache.get_or_load('league', lambda: self.df))
+
+    def test_invalidate(self):
+        self.cache.put(('a', 1), self.df)
+        self.cache.put(('b', 1), self.df.copy())
+        self.cache.invalidate(lambda key: key[0] == 'a')
+        self.assertIsNone(self.cache.get(('a', 1)))
+        self.assertIsNotNone(self.cache.get(('b', 1)))
+        self.cache.invalidate()
+        self.assertEqual(0, self.cache.stats()['used_bytes'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from graph_app.data.data_versions import DataVersions
+from graph_app.data.file_updater import FileUpdater
+from graph_app.data.ingest_worker import IngestWorker, missing_columns, required_columns
+
+
+class TestIngestWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.temp_dir.name, 'files')
+        for kind in ['leagues', 'players']:
+            os.makedirs(os.path.join(self.base, kind))
+        self.upload = os.path.join(self.temp_dir.name, 'New league.xlsx')
+        with open(self.upload, 'w') as file:
+            file.write('New league')
+        self.versions = DataVersions(os.path.join(self.base, 'versions'), self.base)
+        self.worker = IngestWorker(FileUpdater(self.versions))
+        self.league_df = pd.DataFrame({column: [1.0] for column in required_columns('leagues')})
+        self.patches = [patch('graph_app.data.file_updater.' + name + '.rebuild')
+                        for name in ['league_catalog', 'player_directory', 'player_index']]
+        self.patches.append(patch('graph_app.data.file_updater.ExcelReader.carry_over'))
+        for rebuild in self.patches:
+            rebuild.start()
+
+    def tearDown(self):
+        for rebuild in self.patches:
+            rebuild.stop()
+        self.temp_dir.cleanup()
+
+    def test_required_columns(self):
+        self.assertEqual(('Player', 'Position'), required_columns('leagues')[:2])
+        self.assertIn('xG', required_columns('leagues'))
+        self.assertEqual('Date', required_columns('players')[0])
+
+    def test_missing_columns(self):
+        self.assertEqual([], missing_columns(self.league_df, 'leagues'))
+        self.assertEqual(['Position'], missing_columns(self.league_df.drop(columns='Position'), 'leagues'))
+
+    def test_submit_publishes(self):
+        with patch('graph_app.data.ingest_worker.ExcelReader.read_file', return_value=self.league_df), \
+                patch('graph_app.data.excel_reader.league_stores.get') as get_store:
+            status = self.worker.submit(league_files=[self.upload])
+            self.assertTrue(self.worker.wait(status['job'], timeout=10))
+        status = self.worker.status(status['job'])
+        self.assertEqual('published', status['state'])
+        self.assertEqual(1, status['processed'])
+        self.assertEqual(['New league.xlsx'], status['summary']['leagues']['added'])
+        self.assertEqual(1, self.versions.current())
+        get_store.assert_called_once()
+
+    def test_invalid_file_fails(self):
+        with patch('graph_app.data.ingest_worker.ExcelReader.read_file',
+                   return_value=self.league_df.drop(columns='Player')):
+            status = self.worker.submit(league_files=[self.upload])
+            self.assertTrue(self.worker.wait(status['job'], timeout=10))
+        status = self.worker.status(status['job'])
+        self.assertEqual('failed', status['state'])
+        self.assertIn('missing columns: Player', status['error'])
+        self.assertEqual(0, self.versions.current())
+        self.assertEqual([], [name for name in os.listdir(self.versions.root) if name.startswith('.staging')])
+
+    def test_unknown_job(self):
+        self.assertIsNone(self.worker.status('unknown'))
+        self.assertEqual([], self.worker.jobs())
+
+
+if __name__ == "__main__":
+    unittest.main()
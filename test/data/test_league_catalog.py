@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from graph_app.data.league_catalog import LeagueCatalog, LeagueDetails, LeagueEntry
+from graph_app.data.position_registry import position_registry
+
+
+class TestLeagueCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        for name in ["Bundesliga.xlsx", "2. Bundesliga.xlsx", "notes.txt"]:
+            open(os.path.join(self.folder, name), 'w').close()
+        self.catalog = LeagueCatalog(self.folder)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lookup_exact(self):
+        entry = self.catalog.lookup("Bundesliga")
+        self.assertEqual(LeagueEntry("Bundesliga", os.path.join(self.folder, "Bundesliga.xlsx")), entry)
+
+    def test_lookup_normalized(self):
+        self.assertEqual("2. Bundesliga", self.catalog.lookup(" 2.  bundesliga").name)
+
+    def test_lookup_unknown(self):
+        self.assertIsNone(self.catalog.lookup("Liga"))
+        self.assertIsNone(self.catalog.lookup(None))
+
+    def test_random_league(self):
+        self.assertIn(self.catalog.random_league(), ["Bundesliga", "2. Bundesliga"])
+
+    def test_rebuild(self):
+        self.assertIsNone(self.catalog.lookup("MLS"))
+        open(os.path.join(self.folder, "MLS.xlsx"), 'w').close()
+        self.catalog.rebuild()
+        self.assertEqual("MLS", self.catalog.lookup("mls").name)
+
+    def test_new_data_version(self):
+        other_folder = os.path.join(self.folder, 'v1')
+        os.mkdir(other_folder)
+        open(os.path.join(other_folder, "MLS.xlsx"), 'w').close()
+        catalog = LeagueCatalog()
+        with patch('graph_app.data.league_catalog.data_versions.location', return_value=(0, self.folder)):
+            self.assertIsNotNone(catalog.lookup("Bundesliga"))
+        with patch('graph_app.data.league_catalog.data_versions.location', return_value=(1, other_folder)):
+            self.assertIsNone(catalog.lookup("Bundesliga"))
+            self.assertEqual(1, catalog.version())
+            self.assertEqual("MLS", catalog.lookup("MLS").name)
+
+    def test_build_reads_no_files(self):
+        with patch('graph_app.data.league_catalog.ColumnarCache.load') as load:
+            self.catalog.rebuild()
+            self.assertEqual(2, len(self.catalog.names()))
+            load.assert_not_called()
+
+    def test_describe_reads_league_columns_once(self):
+        df = pd.DataFrame({'Player': ['A', 'B'], 'Team': ['X', 'Y']})
+        with patch('graph_app.data.league_catalog.ColumnarCache.load', return_value=df) as load:
+            self.assertEqual(LeagueDetails(2, ('Player', 'Team')), self.catalog.describe("bundesliga"))
+            self.assertEqual(LeagueDetails(2, ('Player', 'Team')), self.catalog.describe("Bundesliga"))
+            self.assertIsNone(self.catalog.describe("MLS"))
+        load.assert_called_once()
+        self.assertEqual(os.path.join(self.folder, "Bundesliga.xlsx"), load.call_args.args[0])
+        self.assertEqual(position_registry.league_columns, load.call_args.kwargs['usecols'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from graph_app.data.league_frame import compact_league_frame, frame_memory
+
+
+class TestLeagueFrame(unittest.TestCase):
+
+    def setUp(self):
+        self.league_df = pd.DataFrame({'Player': ['A', 'B', 'C'], 'Team': ['X', None, 'X'],
+                                       'Position': ['CF', 'GK', 'CF'], 'Matches played': [10, 20, 30],
+                                       'xG': [0.5, np.nan, 1.25], 'Unused': [1, 2, 3]})
+
+    def test_dtypes(self):
+        compact = compact_league_frame(self.league_df)
+        self.assertEqual('category', compact['Team'].dtype.name)
+        self.assertEqual('category', compact['Position'].dtype.name)
+        self.assertEqual(np.float32, compact['xG'].dtype)
+        self.assertEqual(np.int8, compact['Matches played'].dtype)
+        self.assertEqual(object, compact['Player'].dtype)
+
+    def test_empty_values_filled(self):
+        compact = compact_league_frame(self.league_df)
+        self.assertEqual([0.5, 0.0, 1.25], compact['xG'].tolist())
+        self.assertEqual(['X', '', 'X'], compact['Team'].tolist())
+
+    def test_empty_text_filled_with_zero(self):
+        league_df = self.league_df.assign(Player=['A', None, np.nan])
+        compact = compact_league_frame(league_df)
+        self.assertEqual(['A', 0.0, 0.0], compact['Player'].tolist())
+        self.assertEqual(object, compact['Player'].dtype)
+
+    def test_columns(self):
+        compact = compact_league_frame(self.league_df, ['Player', 'xG', 'Missing'])
+        self.assertEqual(['Player', 'xG'], compact.columns.tolist())
+
+    def test_smaller(self):
+        league_df = pd.concat([self.league_df] * 100, ignore_index=True)
+        self.assertLess(frame_memory(compact_league_frame(league_df)), frame_memory(league_df) / 2)
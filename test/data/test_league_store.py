@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from graph_app.data.league_store import LeagueStore, LeagueStoreCache
+from graph_app.data.position_registry import LEAGUE_CATEGORIES
+
+
+class TestLeagueStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.league_df = pd.DataFrame({'Player': ['A', 'B', 'A'],
+                                       'Team': ['X', 'Y', 'Z'],
+                                       'Position': ['CF', 'GK', 'CB, LCB'],
+                                       'Goals per 90': [0.5, None, 0.2],
+                                       'xG': [1.0, 3.0, 2.0]})
+        self.store = LeagueStore.from_dataframe(self.league_df)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_from_dataframe(self):
+        self.assertEqual(np.float32, self.store.matrix.dtype)
+        self.assertEqual(('Goals per 90', 'xG'), self.store.columns)
+        self.assertEqual(0.0, self.store.matrix[self.store.row('B'), 0])
+
+    def test_row(self):
+        self.assertEqual(0, self.store.row('A'))
+        self.assertEqual(1, self.store.row('B'))
+        self.assertIsNone(self.store.row('C'))
+
+    def test_column_max(self):
+        self.assertEqual([3.0, 0.5], self.store.column_max(['xG', 'Goals per 90']))
+
+    def test_scales(self):
+        columns = LEAGUE_CATEGORIES['ST']
+        league_df = pd.DataFrame({'Player': ['A', 'B', 'C'], 'Position': ['CF, LW', 'CB', 0]})
+        for i, column in enumerate(columns):
+            league_df[column] = [1.0, 2.0 + i, 0.0]
+        league_df['Goals per 90'] = [0.0, 0.9, 0.3]
+        store = LeagueStore.from_dataframe(league_df)
+        self.assertEqual(('CF', 'CB', ''), store.main_positions)
+        league_max = [0.9 if column == 'Goals per 90' else 2.0 + i for i, column in enumerate(columns)]
+        position_max = [0.9 if column == 'Goals per 90' else 1.0 for column in columns]
+        np.testing.assert_allclose(league_max, store.scales('ST'))
+        np.testing.assert_allclose(position_max, store.scales('ST', 'position'))
+        self.assertIsNone(store.scales('GK'))
+        with self.assertRaises(ValueError):
+            store.scales('ST', 'team')
+
+    def test_random_player(self):
+        np.testing.assert_array_equal([2], self.store.position_rows('LCB'))
+        self.assertEqual('B', self.store.random_player('GK'))
+        self.assertIsNone(self.store.random_player('GK', 'B'))
+        self.assertIsNone(self.store.random_player('CB', 'A'))
+        self.assertIsNone(self.store.random_player('RW'))
+        store = LeagueStore.from_dataframe(pd.DataFrame({'Player': ['A', 'B', 'C', 'D'],
+                                                         'Position': ['CF', 'CF', 'RCF, CF', 'CF']}))
+        drawn = {store.random_player('CF', 'B') for _ in range(100)}
+        self.assertEqual({'A', 'C', 'D'}, drawn)
+
+    def test_save_open(self):
+        folder = os.path.join(self.temp_dir.name, 'league')
+        self.store.save(folder)
+        opened = LeagueStore.open(folder)
+        self.assertIsInstance(opened.matrix, np.memmap)
+        self.assertEqual(self.store.players, opened.players)
+        self.assertEqual(self.store.positions, opened.positions)
+        np.testing.assert_array_equal(self.store.matrix, opened.matrix)
+
+    def test_cache_reuses_saved_store(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        key = ('/files/leagues/League.xlsx', 1, 2)
+        cache.get(key, lambda: self.league_df)
+        cache.clear()
+        store = cache.get(key, lambda: self.fail("Store should have been opened from disk."))
+        self.assertEqual(0, store.row('A'))
+
+    def test_cache_rebuilds_old_layout(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        key = ('/files/leagues/League.xlsx', 1, 2)
+        folder = cache.store_folder(key)
+        self.store.save(folder)
+        with open(os.path.join(folder, LeagueStore.index_file), 'w', encoding='utf-8') as file:
+            json.dump({'players': list(self.store.players), 'columns': list(self.store.columns)}, file)
+        store = cache.get(key, lambda: self.league_df)
+        self.assertEqual(self.store.positions, store.positions)
+
+    def test_cache_removes_stale_store(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        cache.get(('/files/leagues/League.xlsx', 1, 2), lambda: self.league_df)
+        cache.get(('/files/leagues/League.xlsx', 3, 2), lambda: self.league_df)
+        folder = cache.store_folder(('/files/leagues/League.xlsx', 3, 2))
+        self.assertEqual([os.path.basename(folder)], os.listdir(self.temp_dir.name))
+
+    def test_cache_same_name_other_folder(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        old_key = ('/files/v1/leagues/League.xlsx', 1, 2)
+        new_key = ('/files/v2/leagues/League.xlsx', 1, 2)
+        self.assertNotEqual(cache.store_folder(old_key), cache.store_folder(new_key))
+        cache.get(old_key, lambda: self.league_df)
+        cache.get(new_key, lambda: self.league_df.iloc[::-1])
+        self.assertEqual(2, len(os.listdir(self.temp_dir.name)))
+        cache.clear()
+        self.assertEqual(0, cache.get(old_key, lambda: self.fail("Store should have been opened from disk.")).row('A'))
+
+    def test_cache_invalidate_removes_saved_store(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        cache.get(('/files/v1/leagues/League.xlsx', 1, 2), lambda: self.league_df)
+        cache.get(('/files/v2/leagues/League.xlsx', 1, 2), lambda: self.league_df)
+        cache.invalidate('/files/v1/leagues/League.xlsx')
+        self.assertEqual([os.path.basename(cache.store_folder(('/files/v2/leagues/League.xlsx', 1, 2)))],
+                         os.listdir(self.temp_dir.name))
+
+    def test_cache_carry_over(self):
+        cache = LeagueStoreCache(self.temp_dir.name)
+        old_key = ('/files/v1/leagues/League.xlsx', 1, 2)
+        new_key = ('/files/v2/leagues/League.xlsx', 1, 2)
+        cache.get(old_key, lambda: self.league_df)
+        cache.carry_over(old_key, new_key)
+        cache.clear()
+        store = cache.get(new_key, lambda: self.fail("Store should have been opened from disk."))
+        self.assertEqual(0, store.row('A'))
+        self.assertFalse(os.path.exists(cache.store_folder(old_key)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from graph_app.data.league_catalog import LeagueEntry
+from graph_app.data.player_directory import AmbiguousPlayerError, PlayerDirectory, PlayerLocation
+
+
+class TestPlayerDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = MagicMock()
+        self.catalog.get_entries.return_value = {
+            'bundesliga': LeagueEntry('Bundesliga', 'Bundesliga.xlsx'),
+            'eredivisie': LeagueEntry('Eredivisie', 'Eredivisie.xlsx'),
+        }
+        players = {'Bundesliga.xlsx': ['A', 'B', 'A'], 'Eredivisie.xlsx': ['C', 'A']}
+        self.directory = PlayerDirectory(self.catalog)
+        self.load = patch('graph_app.data.player_directory.ColumnarCache.load',
+                          side_effect=lambda path, reader, columns, usecols: pd.DataFrame({'Player': players[path]}))
+        self.load.start()
+
+    def tearDown(self):
+        self.load.stop()
+
+    def test_lookup(self):
+        self.assertEqual([PlayerLocation('Eredivisie', 0)], self.directory.lookup('C'))
+        self.assertEqual([], self.directory.lookup('D'))
+        self.assertEqual(['Bundesliga', 'Eredivisie'], self.directory.leagues('A'))
+
+    def test_resolve_league(self):
+        self.assertEqual('Bundesliga', self.directory.resolve_league('B'))
+        self.assertIsNone(self.directory.resolve_league('D'))
+        with self.assertRaises(AmbiguousPlayerError) as context:
+            self.directory.resolve_league('A')
+        self.assertEqual(['Bundesliga', 'Eredivisie'], context.exception.leagues)
+
+    def test_build_once(self):
+        self.directory.lookup('A')
+        self.directory.lookup('B')
+        self.catalog.get_entries.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from graph_app.data.player_index import PlayerIndex
+
+
+class TestPlayerIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = self.temp_dir.name
+        for name in ["Player stats I. Sarr.xlsx", "Player stats I. Sarr-2.xlsx", "Player stats T. Cleverley.xlsx",
+                     "notes.txt"]:
+            open(os.path.join(self.folder, name), 'w').close()
+        self.index = PlayerIndex(self.folder)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lookup_exact(self):
+        expected = os.path.join(self.folder, "Player stats T. Cleverley.xlsx")
+        self.assertEqual(expected, self.index.lookup("T. Cleverley"))
+
+    def test_lookup_no_substring_match(self):
+        self.assertIsNone(self.index.lookup("Cleverley"))
+
+    def test_lookup_duplicates(self):
+        first = os.path.join(self.folder, "Player stats I. Sarr.xlsx")
+        second = os.path.join(self.folder, "Player stats I. Sarr-2.xlsx")
+        self.assertEqual([first, second], self.index.candidates("I. Sarr"))
+        self.assertEqual(first, self.index.lookup("I. Sarr"))
+        self.assertEqual(second, self.index.lookup("I. Sarr", 1))
+        self.assertEqual(second, self.index.lookup("I. Sarr-2"))
+        self.assertIsNone(self.index.lookup("I. Sarr", 2))
+
+    def test_rebuild(self):
+        self.assertIsNone(self.index.lookup("A. Masina"))
+        open(os.path.join(self.folder, "Player stats A. Masina.xlsx"), 'w').close()
+        self.assertIsNone(self.index.lookup("A. Masina"))
+        self.index.rebuild()
+        self.assertIsNotNone(self.index.lookup("A. Masina"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import pandas as pd
+
+from graph_app.data.player_metadata import PlayerMetadataCache, describe_player_file, main_position, sort_player_file
+
+
+class TestPlayerMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.player_df = pd.DataFrame({'Match': ['a', 'b', 'c', 'd'],
+                                       'Date': ['2021-03-16', '2020-08-01', '2020-12-24', None],
+                                       'Position': ['RW, CF', 'CF', 0, 'RW'],
+                                       'Goals': [1, 0, 2, 0],
+                                       'Unnamed: 4': [0, 0, 0, 0]})
+
+    def test_main_position_tie(self):
+        self.assertEqual('RW', main_position(self.player_df))
+
+    def test_main_position_tie_first_in_file(self):
+        player_df = pd.DataFrame({'Date': ['2021-03-16', '2021-03-09', '2021-03-02', '2021-02-23'],
+                                  'Position': ['LW', 'CF', 'LW', 'CF']})
+        self.assertEqual('LW', main_position(sort_player_file(player_df)))
+        self.assertEqual('CF', main_position(sort_player_file(player_df[1:3])))
+        self.assertEqual('LW', describe_player_file(sort_player_file(player_df)).main_pos)
+
+    def test_main_position_empty(self):
+        self.assertIsNone(main_position(pd.DataFrame({'Position': [0, None]})))
+
+    def test_describe_player_file(self):
+        metadata = describe_player_file(self.player_df)
+        self.assertEqual(('RW', 'Winger', 'WI'), metadata[:3])
+        self.assertEqual(pd.Timestamp('2020-08-01'), metadata.first_date)
+        self.assertEqual(pd.Timestamp('2021-03-16'), metadata.last_date)
+        self.assertEqual(4, metadata.matches)
+        self.assertEqual(('Goals',), metadata.columns)
+
+    def test_cache(self):
+        cache = PlayerMetadataCache()
+        cache.get(('Player stats A.xlsx', 1, 2), lambda: self.player_df)
+        metadata = cache.get(('Player stats A.xlsx', 1, 2), lambda: self.fail("Metadata should have been cached."))
+        self.assertEqual('RW', metadata.main_pos)
+        self.assertEqual('CF', cache.get(('Player stats A.xlsx', 3, 2), lambda: self.player_df[1:2]).main_pos)
+
+
+if __name__ == "__main__":
+    unittest.main()
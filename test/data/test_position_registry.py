@@ -0,0 +1,55 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from graph_app.data.position_registry import PositionRegistry, position_registry
+
+
+class TestPositionRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.stats_df = pd.DataFrame({'Attribute': ['Goals', 'Saves', 'xG'],
+                                      'GK': [0.0, 1.0, None],
+                                      'ST': [1.0, 0.0, 1.0]})
+        self.registry = PositionRegistry('stats.xlsx')
+
+    def test_position_names(self):
+        self.assertEqual('Winger', self.registry.position_names['LWF'])
+        self.assertEqual('Striker', self.registry.position_names['CF'])
+        self.assertEqual('ST', self.registry.short_names['CF'])
+        self.assertEqual(8, len(self.registry.league_categories['GK']))
+
+    def test_tables_read_only(self):
+        with self.assertRaises(TypeError):
+            self.registry.position_names['XX'] = 'Unknown'
+        with self.assertRaises(TypeError):
+            self.registry.league_categories['GK'] = ()
+
+    def test_line_stats_read_once(self):
+        with patch('graph_app.data.position_registry.ColumnarCache.load', return_value=self.stats_df) as read:
+            self.assertEqual(('Goals', 'xG'), self.registry.line_stats['ST'])
+            self.assertEqual(('Saves',), self.registry.line_stats['GK'])
+            read.assert_called_once()
+            self.assertEqual('stats.xlsx', read.call_args[0][0])
+
+    def test_league_columns(self):
+        columns = self.registry.league_columns
+        self.assertEqual(('Player', 'Team', 'Position', 'Matches played', 'Birth country'), columns[:5])
+        self.assertIn('xG', columns)
+        self.assertEqual(len(set(columns)), len(columns))
+
+    def test_reload(self):
+        with patch('graph_app.data.position_registry.ColumnarCache.load', return_value=self.stats_df) as read:
+            self.registry.line_stats
+            self.registry.reload()
+            self.assertEqual(2, read.call_count)
+
+    def test_bundled_stats_file(self):
+        self.assertTrue(os.path.exists(position_registry.stats_file))
+        self.assertIn('Goals', position_registry.line_stats['ST'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import base64
+import io
+import unittest
+from unittest.mock import MagicMock
+
+from graph_app.data.upload_spooler import UploadError, UploadSpooler, UploadTooLargeError
+
+
+class TestUploadSpooler(unittest.TestCase):
+
+    def setUp(self):
+        self.spooler = UploadSpooler(max_file_size=100, max_total_size=150)
+
+    def tearDown(self):
+        self.spooler.close()
+
+    def test_add_base64(self):
+        contents = bytes(range(90))
+        encoded = base64.encodebytes(contents).decode()
+        upload = self.spooler.add_base64('folder/League.xlsx', encoded)
+        self.assertEqual('League.xlsx', upload.filename)
+        self.assertEqual(90, upload.size)
+        self.assertEqual(contents, upload.stream.read())
+
+    def test_add_base64_invalid(self):
+        with self.assertRaises(UploadError):
+            self.spooler.add_base64('League.xlsx', 'abcde')
+
+    def test_add_base64_no_filename(self):
+        with self.assertRaises(UploadError):
+            self.spooler.add_base64(None, base64.b64encode(b'data').decode())
+
+    def test_file_limit(self):
+        with self.assertRaises(UploadTooLargeError):
+            self.spooler.add_base64('League.xlsx', base64.b64encode(bytes(101)).decode())
+
+    def test_total_limit(self):
+        self.spooler.add_base64('A.xlsx', base64.b64encode(bytes(100)).decode())
+        with self.assertRaises(UploadTooLargeError):
+            self.spooler.add_base64('B.xlsx', base64.b64encode(bytes(60)).decode())
+        self.assertEqual(100, self.spooler.total_size)
+
+    def test_add_file(self):
+        file = MagicMock(filename='Player stats A.xlsx', stream=io.BytesIO(bytes(80)))
+        file.stream.read()
+        upload = self.spooler.add_file(file)
+        self.assertEqual(80, upload.size)
+        self.assertEqual(0, upload.stream.tell())
+
+    def test_add_file_limit(self):
+        file = MagicMock(filename='Player stats A.xlsx', stream=io.BytesIO(bytes(101)))
+        with self.assertRaises(UploadTooLargeError):
+            self.spooler.add_file(file)
+
+
+if __name__ == "__main__":
+    unittest.main()
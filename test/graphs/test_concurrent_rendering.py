@@ -0,0 +1,52 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from graph_app.graph_generator.graphs.line_plot import LinePlot
+from graph_app.graph_generator.graphs.radar_chart import RadarChart
+
+
+class ConcurrentRenderingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        dates = pd.date_range('2019-07-01', periods=40, freq='7D').strftime('%Y-%m-%d').tolist()
+        row = {'Team': ['Team A'], 'Matches played': [10], 'Birth country': ['Country A']}
+        self.jobs = []
+        for i in range(6):
+            self.jobs.append((LinePlot({'player_pos': 'Forward'}), {
+                'player_data': pd.DataFrame({'Date': dates, 'Stat': [(j * (i + 3)) % 11 for j in range(40)]}),
+                'compare_data': pd.DataFrame({'Date': dates, 'Stat': [(j * (i + 5)) % 7 for j in range(40)]}),
+                'columns': 'Stat',
+                'start_date': dates[5],
+                'end_date': dates[30],
+                'player': 'Player ' + str(i),
+                'compare': 'Compare ' + str(i)
+            }))
+            self.jobs.append((RadarChart({'player_pos': 'Forward'}), {
+                'player': 'Player ' + str(i),
+                'compare': 'Compare ' + str(i),
+                'player_row': pd.DataFrame(dict(row, Goals=[1.0 + i], Assists=[2.0], Shots=[3.0])),
+                'compare_row': pd.DataFrame(dict(row, Goals=[3.0], Assists=[1.0 + i], Shots=[0.5])),
+                'columns': ['Goals', 'Assists', 'Shots'],
+                'scales': [7.0, 8.0 - i % 2, 6.0]
+            }))
+
+    def test_parallel_renders_match_serial_renders(self):
+        expected = [graph.draw(param_map) for graph, param_map in self.jobs]
+        repeated = self.jobs * 4
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda job: job[0].draw(job[1]), repeated))
+        for i, result in enumerate(results):
+            self.assertEqual(expected[i % len(self.jobs)], result, "render " + str(i) + " differs from serial render")
+
+    def test_no_pyplot_figures(self):
+        plt.close('all')
+        for graph, param_map in self.jobs[:2]:
+            graph.draw(param_map)
+        self.assertEqual([], plt.get_fignums())
+
+
+if __name__ == '__main__':
+    unittest.main()
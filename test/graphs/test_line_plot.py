@@ -59,11 +59,33 @@ class TestLinePlot(unittest.TestCase):
             expected = 'plot'
             self.assertEqual(expected, result)
 
+    def test_draw_all_keeps_order_and_param_map(self):
+        cols = ['stat' + str(i) for i in range(8)]
+        params = {
+            'columns': cols
+        }
+        with patch.object(self.plot, 'draw', side_effect=lambda param_map: param_map['columns']):
+            result = self.plot.draw_all(params)
+            self.assertEqual(cols, result)
+            self.assertIs(cols, params['columns'])
+
     def test_draw_returns_png(self):
         plot = self.plot.draw(self.params)
         self.assertNotEqual(plot, None, 'no changes')
         self.assertTrue(plot.startswith(b'\x89PNG'), 'Wrong graph format. Expected PNG.')
 
+    def test_draw_combined(self):
+        dates = pd.date_range('2019-06-01', periods=30, freq='14D').strftime('%Y-%m-%d').tolist()
+        player_data = pd.DataFrame({'Date': dates, 'Duels / won': range(30), 'Duels won': range(0, 60, 2),
+                                    'Goals': [i % 3 for i in range(30)]})
+        params = dict(self.params, player_data=player_data, compare_data=player_data.iloc[::-1],
+                      columns=['Duels / won', 'Goals'], start_date='2019-09-01', end_date='2020-06-01',
+                      layout='combined')
+        with patch.object(self.plot, 'draw') as mock_draw:
+            plot = self.plot.draw_all(params)
+            mock_draw.assert_not_called()
+        self.assertTrue(plot.startswith(b'\x89PNG'), 'Wrong graph format. Expected PNG.')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,34 @@
+import os
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from datetime import datetime
+from graph_app.data.excel_reader import ExcelReader
 from graph_app.graph_generator.graphs.line_plot_data_helper import LinePlotDataHelper
 
+# Folder containing the player files shipped with the app
+PLAYER_FOLDER = os.path.join(os.path.dirname(__file__), '..', '..', 'graph_app', 'files', 'players')
+
+
+def baseline_season_ticks(dates, scaled_x_values):
+    """
+    Function that computes the season indices, x-values, tick values and labels with the per-year loops that
+    LinePlotDataHelper used before season_ticks(), as a reference for its output.
+    """
+    season_indices = []
+    year = dates.dt.year
+    month = dates.dt.month
+    for y in year.unique():
+        year_dates = dates[year == y]
+        first_of_july = year_dates[(month >= 7) & (year_dates.dt.day > 1)].index.min()
+        if pd.notnull(first_of_july):
+            season_indices.append(first_of_july)
+    season_x_values = [scaled_x_values[i] for i in season_indices] + [scaled_x_values.iloc[-1]]
+    tick_values = [(season_x_values[i] + season_x_values[i + 1]) / 2 for i in range(len(season_x_values) - 1)]
+    years = dates.iloc[season_indices].dt.strftime('%Y-%m-%d').str.slice(start=2, stop=4)
+    labels = [f"{n}/{int(n) + 1}" for n in years]
+    return season_indices, season_x_values, tick_values, labels
+
 
 class TestLinePlotDataHelper(unittest.TestCase):
 
@@ -65,19 +90,44 @@ class TestLinePlotDataHelper(unittest.TestCase):
         ]
         with patch.object(pd, 'to_datetime', return_value=pd.Series(dates)) as to_dt:
             with patch.object(self.helper, 'scaled_date_values', return_value='scaled') as scaled:
-                with patch.object(self.helper, 'get_season_change_indices', return_value='idx') as szn_idx:
-                    with patch.object(self.helper, 'get_season_change_x_vals', return_value='x') as szn_x_vals:
-                        with patch.object(self.helper, 'season_tick_labels', return_value='labs') as labels:
-                            result_scaled, result_szn_x, result_labels = self.helper.get_xlabels(data)
-                            expected_scaled, expected_szn_x, expected_labels = 'scaled', 'x', 'labs'
-                            self.assertEqual(result_scaled, expected_scaled)
-                            self.assertEqual(result_szn_x, expected_szn_x)
-                            self.assertEqual(result_labels, expected_labels)
-                            to_dt.assert_called_once_with(data['Date'], format='%Y-%m-%d')
-                            scaled.assert_called_once()
-                            szn_idx.assert_called_once()
-                            szn_x_vals.assert_called_once_with('idx', 'scaled')
-                            labels.assert_called_once()
+                with patch.object(self.helper, 'season_ticks', return_value=('idx', 'x', 'ticks', 'labs')) as ticks:
+                    result_scaled, result_szn_x, result_labels = self.helper.get_xlabels(data)
+                    expected_scaled, expected_szn_x, expected_labels = 'scaled', 'x', 'labs'
+                    self.assertEqual(result_scaled, expected_scaled)
+                    self.assertEqual(result_szn_x, expected_szn_x)
+                    self.assertEqual(result_labels, expected_labels)
+                    to_dt.assert_called_once_with(data['Date'], format='%Y-%m-%d')
+                    scaled.assert_called_once()
+                    ticks.assert_called_once()
+
+    def test_season_ticks(self):
+        dates = pd.Series(pd.to_datetime(['2008-05-01', '2008-07-01', '2008-08-01', '2008-08-02', '2009-03-01',
+                                          '2009-09-12', '2009-10-01', '2010-06-30', '2099-07-02']))
+        scaled = self.helper.scaled_date_values(dates)
+        indices, season_x, ticks, labels = self.helper.season_ticks(dates, scaled)
+        self.assertEqual([3, 5, 8], indices)
+        self.assertEqual([scaled[3], scaled[5], scaled[8], scaled[8]], season_x)
+        self.assertEqual(self.helper.set_season_tick_values(season_x), ticks)
+        self.assertEqual(['08/9', '09/10', '99/100'], labels)
+        self.assertEqual(labels, self.helper.season_tick_labels(dates, indices))
+
+    def test_season_ticks_player_files(self):
+        reader = ExcelReader()
+        files = sorted(name for name in os.listdir(PLAYER_FOLDER) if name.endswith('.xlsx'))
+        self.assertTrue(files)
+        for name in files:
+            with self.subTest(file=name):
+                path = os.path.join(PLAYER_FOLDER, name)
+                raw_dates = reader.read_file(path, ['Date'])['Date']
+                dates = pd.to_datetime(raw_dates, format='%Y-%m-%d').sort_values().reset_index(drop=True)
+                scaled = self.helper.scaled_date_values(dates)
+                expected = baseline_season_ticks(dates, scaled)
+                self.assertEqual(expected, self.helper.season_ticks(dates, scaled))
+                player_data = reader.read_player_file(path)
+                result_scaled, result_season_x, result_labels = self.helper.get_xlabels(player_data)
+                self.assertEqual(scaled.tolist(), result_scaled.tolist())
+                self.assertEqual(expected[1], result_season_x)
+                self.assertEqual(expected[3], result_labels)
 
     def test_average_entries(self):
         x_vals = pd.Series([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
@@ -95,11 +145,25 @@ class TestLinePlotDataHelper(unittest.TestCase):
             'Successful shots': [7, 12, 5, 10]
         })
         result_data, result_column = self.helper.create_sub_plot_data(subcolumns, player_data, column_index)
-        expected_data = pd.Series([7, 12, 5, 10])[::-1].reset_index(drop=True)
+        expected_data = pd.Series([7, 12, 5, 10])
         expected_column = 'Successful shots'
         self.assertEqual(result_data.tolist(), expected_data.tolist())
         self.assertEqual(result_column, expected_column)
 
+    def test_sort_by_date(self):
+        data = pd.DataFrame({'Date': ['2022-01-03', '2022-01-01', '2022-01-01'], 'Stat': [3, 2, 1]}, index=[5, 6, 7])
+        result = self.helper.sort_by_date(data)
+        self.assertTrue(self.helper.is_sorted_by_date(result))
+        self.assertEqual([1, 2, 3], result['Stat'].tolist())
+        self.assertIs(result, self.helper.sort_by_date(result))
+
+    def test_get_xlabels_cached(self):
+        data = self.helper.sort_by_date(pd.DataFrame({'Date': ['2022-07-03', '2022-01-01']}))
+        first = self.helper.get_xlabels(data)
+        with patch.object(self.helper, 'scaled_date_values') as scaled:
+            self.assertIs(first, self.helper.get_xlabels(data))
+            scaled.assert_not_called()
+
     def test_extract_data_from_param_map(self):
         params = {
             'player_data': 'data',
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from graph_app.graph_generator.graphs.radar_chart import RadarChart
+from graph_app.graph_generator.graphs.radar_skeleton import RadarSkeleton, RadarSkeletonCache
+
+
+class RadarSkeletonCacheTestCase(unittest.TestCase):
+
+    def skeleton(self, size=100):
+        return RadarSkeleton(np.zeros(size, dtype=np.uint8), (0.0, 1.0))
+
+    def test_get_or_render(self):
+        cache = RadarSkeletonCache(1000)
+        skeleton = self.skeleton()
+        render = MagicMock(return_value=skeleton)
+        self.assertIs(skeleton, cache.get_or_render('key', render))
+        self.assertIs(skeleton, cache.get_or_render('key', render))
+        render.assert_called_once_with()
+        self.assertEqual({'hits': 1, 'misses': 1, 'entries': 1, 'used_bytes': 100, 'max_bytes': 1000}, cache.stats())
+
+    def test_evicts_least_recently_used(self):
+        cache = RadarSkeletonCache(250)
+        cache.get_or_render('a', self.skeleton)
+        cache.get_or_render('b', self.skeleton)
+        cache.get_or_render('a', self.skeleton)
+        cache.get_or_render('c', self.skeleton)
+        render = MagicMock(return_value=self.skeleton())
+        cache.get_or_render('a', render)
+        cache.get_or_render('b', render)
+        self.assertEqual(1, render.call_count)
+        self.assertEqual(200, cache.stats()['used_bytes'])
+
+    def test_too_large_not_stored(self):
+        cache = RadarSkeletonCache(50)
+        cache.get_or_render('a', self.skeleton)
+        self.assertEqual(0, cache.stats()['entries'])
+
+    def test_key(self):
+        self.assertEqual(RadarSkeletonCache.key(['A', 'B'], np.array([1, 2.5]), (8, 7)),
+                         RadarSkeletonCache.key(('A', 'B'), [1.0, 2.5], [8, 7]))
+
+
+class RadarChartSkeletonTestCase(unittest.TestCase):
+
+    def setUp(self):
+        columns = ['Goals', 'Assists', 'Shots']
+        row = {'Team': ['Team A'], 'Matches played': [10], 'Birth country': ['Country A']}
+        self.param_map = {
+            'player': 'Player A',
+            'compare': 'Player B',
+            'player_row': pd.DataFrame(dict(row, Goals=[1.0], Assists=[2.0], Shots=[3.0])),
+            'compare_row': pd.DataFrame(dict(row, Goals=[3.0], Assists=[1.0], Shots=[0.0])),
+            'columns': columns,
+            'scales': [4.0, 2.0, 6.0]
+        }
+
+    def test_draw_skeleton(self):
+        skeleton = RadarChart({}).draw_skeleton(self.param_map['columns'], self.param_map['scales'])
+        self.assertEqual((700, 800, 4), skeleton.background.shape)
+        self.assertEqual(0.0, skeleton.ylim[0])
+
+    def test_draw_reuses_skeleton(self):
+        chart = RadarChart({})
+        cache = RadarSkeletonCache(64 * 1024 * 1024)
+        with patch('graph_app.graph_generator.graphs.radar_chart.radar_skeletons', cache):
+            first = chart.draw(self.param_map)
+            second = chart.draw(self.param_map)
+        self.assertTrue(first.startswith(b'\x89PNG'))
+        self.assertEqual(first, second)
+        self.assertEqual(1, cache.stats()['misses'])
+        self.assertEqual(1, cache.stats()['hits'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import multiprocessing
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from graph_app.graph_generator.graphs.radar_chart import RadarChart
+from graph_app.graph_generator.render_pool import (RenderPool, RenderTimeoutError, compact_params,
+                                                   line_plot_columns)
+
+
+class RenderPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        row = {'Player': ['Player A'], 'Team': ['Team A'], 'Matches played': [10], 'Birth country': ['Country A'],
+               'Goals': [1.0], 'Assists': [2.0], 'Shots': [3.0], 'Unused': [4.0]}
+        self.radar_map = {'type': 'radar', 'player': 'Player A', 'compare': None, 'player_pos': 'Forward',
+                          'player_row': pd.DataFrame(row), 'columns': ['Goals', 'Assists', 'Shots'],
+                          'scales': [4.0, 2.0, 6.0]}
+
+    def test_line_plot_columns(self):
+        df = pd.DataFrame(columns=['Match', 'Date', 'Goals', 'Duels / won', 'Duels won', 'Shots'])
+        self.assertEqual(['Date', 'Duels / won', 'Duels won'], line_plot_columns(df, 'Duels / won'))
+        self.assertEqual(['Date', 'Goals', 'Shots'], line_plot_columns(df, ['Shots', 'Goals']))
+
+    def test_compact_params(self):
+        compact = compact_params(self.radar_map)
+        self.assertEqual(['Team', 'Matches played', 'Birth country', 'Goals', 'Assists', 'Shots'],
+                         compact['player_row'].columns.tolist())
+        self.assertEqual(8, len(self.radar_map['player_row'].columns))
+        self.assertEqual(self.radar_map['scales'], compact['scales'])
+
+    def test_render_matches_local_render(self):
+        pool = RenderPool(workers=1, timeout=60, max_tasks=1)
+        pool.start()
+        try:
+            self.assertTrue(pool.is_running())
+            expected = RadarChart(self.radar_map).draw_all(dict(self.radar_map))
+            self.assertEqual(expected, pool.render(dict(self.radar_map)))
+            self.assertEqual(expected, pool.render(dict(self.radar_map)))
+        finally:
+            pool.stop()
+        self.assertFalse(pool.is_running())
+
+    def test_render_not_running(self):
+        with self.assertRaises(RuntimeError):
+            RenderPool(workers=1).render(self.radar_map)
+
+    def test_timeout_keeps_pool(self):
+        pool_mock = MagicMock()
+        pool_mock.apply_async.return_value.get.side_effect = multiprocessing.TimeoutError
+        pool = RenderPool(workers=1, timeout=0.1)
+        with patch.object(pool, 'create_pool', return_value=pool_mock):
+            pool.start()
+            with self.assertRaises(RenderTimeoutError):
+                pool.render(self.radar_map)
+            timeout = pool_mock.apply_async.return_value.get.call_args.args[0]
+            self.assertTrue(0 < timeout <= 0.1)
+            pool_mock.terminate.assert_not_called()
+            self.assertTrue(pool.is_running())
+            pool_mock.apply_async.return_value.get.side_effect = None
+            pool_mock.apply_async.return_value.get.return_value = b'png'
+            self.assertEqual(b'png', pool.render(self.radar_map))
+
+    def test_timeout_shared_by_tasks(self):
+        waits = []
+
+        def get(timeout):
+            waits.append(timeout)
+            time.sleep(0.06)
+            return b'png'
+
+        pool_mock = MagicMock()
+        pool_mock.apply_async.return_value.get.side_effect = get
+        pool = RenderPool(workers=2, timeout=0.1)
+        with patch.object(pool, 'create_pool', return_value=pool_mock):
+            pool.start()
+            pool.render({'type': 'line', 'columns': ['Goals', 'Shots', 'Assists']})
+        self.assertEqual(3, len(waits))
+        self.assertLess(waits[1], 0.05)
+        self.assertEqual(0, waits[2])
+
+    def test_line_plot_stats_split_into_tasks(self):
+        pool_mock = MagicMock()
+        pool_mock.apply_async.side_effect = lambda function, args: MagicMock(**{'get.return_value': args[0]['columns']})
+        pool = RenderPool(workers=2)
+        param_map = {'type': 'line', 'columns': ['Goals', 'Shots', 'Assists']}
+        with patch.object(pool, 'create_pool', return_value=pool_mock):
+            pool.start()
+            self.assertEqual([['Goals'], ['Shots'], ['Assists']], pool.render(param_map))
+            self.assertEqual(['Goals'], pool.render({'type': 'line', 'columns': ['Goals']}))
+            combined = dict(param_map, layout='combined')
+            self.assertEqual(['Goals', 'Shots', 'Assists'], pool.render(combined))
+        self.assertEqual(['Goals', 'Shots', 'Assists'], param_map['columns'])
+
+
+if __name__ == '__main__':
+    unittest.main()